@@ -96,6 +96,7 @@ if __name__ == "__main__":
         entry_points="""
                 [console_scripts]
                 build_mapping=gbd_mapping_generator.build_mapping:build_mapping
+                build_slim_mapping=gbd_mapping_generator.build_mapping:build_slim_mapping
             """,
         zip_safe=False,
         use_scm_version={
@@ -1,9 +1,30 @@
-from ._version import __version__
-from .base_template import Categories, GbdRecord, ModelableEntity, Restrictions, Tmred
-from .cause import Cause, causes
-from .covariate import Covariate, covariates
-from .etiology import Etiology, etiologies
-from .id import (
+import gc
+import importlib
+import os
+import threading
+
+from . import _profile
+
+# Installed before anything else is imported so the profile covers every module.
+_profile.install(__name__)
+
+from . import _snapshot, _tables  # noqa: E402
+from ._index import (  # noqa: E402
+    entities_by_me_id,
+    healthstate_by_id,
+    sequelae_by_healthstate,
+)
+from ._profile import report as profile_report  # noqa: E402
+from ._version import __version__  # noqa: E402
+from .base_template import (  # noqa: E402
+    Categories,
+    GbdCollection,
+    GbdRecord,
+    ModelableEntity,
+    Restrictions,
+    Tmred,
+)
+from .id import (  # noqa: E402
     UNKNOWN,
     UnknownEntityError,
     c_id,
@@ -14,5 +35,122 @@ from .id import (
     s_id,
     scalar,
 )
-from .risk_factor import RiskFactor, risk_factors
-from .sequela import Healthstate, Sequela, sequelae
+
+# Entity classes and collections live in large generated modules. They are imported
+# the first time they are accessed so a process only pays for the collections it uses.
+_LAZY_IMPORTS = {
+    "Cause": ".cause_template",
+    "causes": ".cause",
+    "Covariate": ".covariate_template",
+    "covariates": ".covariate",
+    "Etiology": ".etiology_template",
+    "etiologies": ".etiology",
+    "RiskFactor": ".risk_factor_template",
+    "risk_factors": ".risk_factor",
+    "Healthstate": ".sequela_template",
+    "Sequela": ".sequela_template",
+    "sequelae": ".sequela",
+}
+
+# The generated modules, which before they were imported lazily were always attributes of
+# the package. They are still imported the first time they are accessed as one.
+_SUBMODULES = frozenset(module_name.lstrip(".") for module_name in _LAZY_IMPORTS.values())
+
+__all__ = [
+    "__version__",
+    "Categories",
+    "GbdCollection",
+    "GbdRecord",
+    "ModelableEntity",
+    "Restrictions",
+    "Tmred",
+    "UNKNOWN",
+    "UnknownEntityError",
+    "c_id",
+    "cov_id",
+    "hs_id",
+    "me_id",
+    "rei_id",
+    "s_id",
+    "scalar",
+    "entities_by_me_id",
+    "healthstate_by_id",
+    "sequelae_by_healthstate",
+    "profile_report",
+    "seal",
+    *_LAZY_IMPORTS,
+]
+
+
+# Collections are rebuilt from the binary snapshot when it matches the generated
+# modules. Set GBD_MAPPING_SNAPSHOT=0 to always import the generated modules instead.
+_USE_SNAPSHOT = os.environ.get("GBD_MAPPING_SNAPSHOT", "1") != "0"
+
+
+# Held while a collection is loaded and cached, so every thread gets the same one.
+_LOAD_LOCK = threading.RLock()
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        if name in _SUBMODULES:
+            # Importing a submodule also sets it on the package.
+            return importlib.import_module(f".{name}", __name__)
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    if name in _snapshot.COLLECTIONS:
+        with _profile.measure(name, "collection"):
+            return _load_collection(name)
+    with _profile.measure(name, "class"):
+        value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the package so later lookups bypass this hook entirely.
+    globals()[name] = value
+    return value
+
+
+def _load_collection(name, rows=None):
+    """Returns a collection, loading it and caching it on the package the first time.
+
+    Collections come from the snapshot when it is up to date and otherwise from the rows
+    of their generated module, which builds its collection by calling this with ``rows``.
+    So the package and the module always hold the same collection.
+    """
+    with _LOAD_LOCK:
+        # Loaded by another thread while this one waited.
+        if name in globals():
+            return globals()[name]
+        value = None
+        if _USE_SNAPSHOT:
+            value = _snapshot.load_collection(name, _get_collection)
+        if value is None and rows is not None:
+            value = _snapshot.build_collection(name, rows, _get_collection)
+        if value is not None:
+            globals()[name] = value
+            return value
+    # Imported without holding the lock, as the module takes it to build the collection.
+    return getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+
+
+def _get_collection(name):
+    return globals()[name] if name in globals() else __getattr__(name)
+
+
+def seal():
+    """Builds the whole mapping and freezes it for fork-based worker pools.
+
+    All collections, records and deferred attributes are built, then ``gc.freeze`` moves
+    every object the process tracks into the garbage collector's permanent generation.
+    Call this in the parent process right before forking workers: collections in the
+    children no longer write to the memory pages they share with the parent, which keeps
+    those pages shared. ``gc.unfreeze`` reverses the freeze.
+    """
+    for name in _snapshot.COLLECTIONS:
+        _tables.resolve_all(_get_collection(name))
+    # Collect first so garbage left over from building is not frozen along with the mapping.
+    gc.collect()
+    gc.freeze()
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -0,0 +1,109 @@
+"""Vectorized translation of arrays of GBD ids to the entities of a collection.
+
+Entities are coded by their place in the collection sorted by GBD id, so codes only move
+when entities are removed; new GBD ids are higher than existing ones. Each collection
+builds a dense table the first time it translates ids: an array indexed by GBD id
+holding the code of the entity with that id, or ``-1`` for ids no entity has.
+Translating a whole array of ids is then a single lookup into it.
+
+pandas is only imported to build ``Categorical`` results and dtypes; a ``Series`` of
+ids is translated to a ``Series`` with the same index, of names in an ``object`` one.
+"""
+import functools
+import sys
+
+import numpy as np
+
+from .id import _is_known
+
+UNKNOWN_CODE = -1
+
+
+class IdTable:
+    """Dense GBD id to code table of a collection, with the names of its entities."""
+
+    __slots__ = ("positions", "names", "_dtype")
+
+    def __init__(self, collection):
+        # Entities without a known id can't be translated to, they are coded last.
+        entities = sorted(
+            collection,
+            key=lambda e: (0, int(e.gbd_id)) if _is_known(e.gbd_id) else (1, 0),
+        )
+        known = [
+            (int(e.gbd_id), code) for code, e in enumerate(entities) if _is_known(e.gbd_id)
+        ]
+        size = max((gbd_id for gbd_id, _ in known), default=-1) + 1
+        self.positions = np.full(size, UNKNOWN_CODE, dtype=np.int32)
+        for gbd_id, code in known:
+            self.positions[gbd_id] = code
+        # The trailing None is what UNKNOWN_CODE, the last position, picks out.
+        self.names = np.array([entity.name for entity in entities] + [None], dtype=object)
+
+    def categorical_dtype(self):
+        try:
+            return self._dtype
+        except AttributeError:
+            self._dtype = categorical_dtype(tuple(self.names[:-1]))
+            return self._dtype
+
+    def codes(self, values: np.ndarray) -> np.ndarray:
+        if values.dtype.kind not in "iu":
+            # Floats, e.g. from a column with missing ids; NaN and fractions are unknown.
+            with np.errstate(invalid="ignore"):
+                integral = np.isfinite(values) & (values % 1 == 0)
+            values = np.where(integral, values, UNKNOWN_CODE).astype(np.int64)
+        in_table = (values >= 0) & (values < len(self.positions))
+        codes = np.full(values.shape, UNKNOWN_CODE, dtype=self.positions.dtype)
+        codes[in_table] = self.positions[values[in_table]]
+        return codes
+
+
+def _values(gbd_ids) -> np.ndarray:
+    if hasattr(gbd_ids, "to_numpy"):
+        # Covers nullable pandas columns, whose missing values numpy can't convert.
+        values = gbd_ids.to_numpy()
+        if values.dtype.kind == "O":
+            values = gbd_ids.to_numpy(dtype=np.float64, na_value=np.nan)
+        return values
+    values = np.asarray(gbd_ids)
+    if values.dtype.kind == "O":
+        values = np.array(
+            [np.nan if v is None else v for v in values.ravel()], dtype=np.float64
+        )
+        values = values.reshape(np.shape(gbd_ids))
+    return values
+
+
+def _like(gbd_ids, values, dtype=None):
+    # pandas can only have made a Series if it has been imported.
+    pd = sys.modules.get("pandas")
+    if pd is not None and isinstance(gbd_ids, pd.Series):
+        return pd.Series(values, index=gbd_ids.index, name=gbd_ids.name, dtype=dtype)
+    return values
+
+
+def ids_to_codes(table: IdTable, gbd_ids):
+    return _like(gbd_ids, table.codes(_values(gbd_ids)))
+
+
+def ids_to_names(table: IdTable, gbd_ids):
+    # Kept as objects, pandas would infer a string dtype and turn ``None`` into NaN.
+    return _like(gbd_ids, table.names[table.codes(_values(gbd_ids))], dtype=object)
+
+
+def ids_to_categorical(table: IdTable, gbd_ids):
+    import pandas as pd
+
+    categorical = pd.Categorical.from_codes(
+        table.codes(_values(gbd_ids)).ravel(), dtype=table.categorical_dtype()
+    )
+    return _like(gbd_ids, categorical)
+
+
+@functools.lru_cache(maxsize=None)
+def categorical_dtype(categories: tuple):
+    """Returns the one unordered ``CategoricalDtype`` of the given categories."""
+    import pandas as pd
+
+    return pd.CategoricalDtype(list(categories), ordered=False)
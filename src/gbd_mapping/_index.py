@@ -0,0 +1,75 @@
+"""Indexes across the collections of the mapping.
+
+Each index is built once, the first time it is used, from the collections of the
+``gbd_mapping`` package, so it holds the same entities they do.
+"""
+import importlib
+import threading
+
+from .id import _is_known
+
+# Reentrant as some indexes are built from others.
+_LOCK = threading.RLock()
+_INDEXES = {}
+
+
+def _index(name, build):
+    try:
+        return _INDEXES[name]
+    except KeyError:
+        pass
+    with _LOCK:
+        if name not in _INDEXES:  # Not built by another thread while we waited.
+            _INDEXES[name] = build()
+    return _INDEXES[name]
+
+
+def _collection(name):
+    return getattr(importlib.import_module(__package__), name)
+
+
+def _build_me_id_index():
+    index = {}
+    for name in ("causes", "sequelae"):
+        for entity in _collection(name):
+            if _is_known(entity.me_id):
+                index.setdefault(entity.me_id, []).append(entity)
+    return {me_id: tuple(entities) for me_id, entities in index.items()}
+
+
+def entities_by_me_id(me_id) -> tuple:
+    """Returns the causes and sequelae with a modelable entity id, causes first.
+
+    Entities whose ``me_id`` is ``UNKNOWN`` are left out of the index, so looking up
+    ``UNKNOWN``, like looking up an id no entity has, returns an empty tuple.
+    """
+    return _index("me_id", _build_me_id_index).get(me_id, ())
+
+
+def _build_healthstate_index():
+    index = {}
+    for sequela in _collection("sequelae"):
+        index.setdefault(sequela.healthstate, []).append(sequela)
+    return {healthstate: tuple(sequelae) for healthstate, sequelae in index.items()}
+
+
+def _build_hs_id_index():
+    return {
+        healthstate.gbd_id: healthstate
+        for healthstate in _index("healthstate", _build_healthstate_index)
+        if _is_known(healthstate.gbd_id)
+    }
+
+
+def healthstate_by_id(hs_id):
+    """Returns the healthstate with a health state id.
+
+    Raises a ``KeyError`` if there is none. Healthstates are shared, so this is the same
+    object every sequela with the id holds.
+    """
+    return _index("hs_id", _build_hs_id_index)[hs_id]
+
+
+def sequelae_by_healthstate(healthstate) -> tuple:
+    """Returns the sequelae with a healthstate, or an empty tuple if there are none."""
+    return _index("healthstate", _build_healthstate_index).get(healthstate, ())
@@ -0,0 +1,102 @@
+"""Opt-in profiling of how the mapping loads.
+
+Set ``GBD_MAPPING_PROFILE=1`` before importing ``gbd_mapping`` to record, for every
+``gbd_mapping`` module as it is imported and every collection as it is loaded, the wall
+time, the bytes allocated (measured with ``tracemalloc``) and the number of objects
+tracked by the garbage collector that it added. ``gbd_mapping.profile_report()``
+returns the measurements.
+
+Measurements are inclusive of anything loaded while they run, e.g. a module's imports;
+the ``self_*`` values exclude other measured entries. Tracing allocations and counting
+objects slows loading down, so profiled wall times are only comparable to each other.
+"""
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+ENABLED = os.environ.get("GBD_MAPPING_PROFILE", "0") not in ("", "0")
+
+_MEASURES = ("seconds", "allocated_bytes", "objects")
+
+_report = []
+_stack = []
+
+
+def _sample():
+    return time.perf_counter(), tracemalloc.get_traced_memory()[0], len(gc.get_objects())
+
+
+@contextmanager
+def measure(name: str, kind: str):
+    """Records the cost of the enclosed block as a ``kind`` entry named ``name``."""
+    if not ENABLED:
+        yield
+        return
+    entry = {"name": name, "kind": kind}
+    _report.append(entry)
+    _stack.append(entry)
+    children = dict.fromkeys(_MEASURES, 0)
+    entry["_children"] = children
+    start = _sample()
+    try:
+        yield
+    finally:
+        _stack.pop()
+        for measure_name, before, after in zip(_MEASURES, start, _sample()):
+            entry[measure_name] = after - before
+            entry[f"self_{measure_name}"] = after - before - children[measure_name]
+            if _stack:
+                _stack[-1]["_children"][measure_name] += after - before
+        del entry["_children"]
+
+
+def report() -> list[dict]:
+    """Returns the recorded entries in the order they started loading."""
+    return [dict(entry) for entry in _report if "_children" not in entry]
+
+
+class _ProfilingLoader:
+    def __init__(self, loader):
+        self._loader = loader
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        with measure(module.__name__.rpartition(".")[2], "module"):
+            self._loader.exec_module(module)
+
+    def __getattr__(self, item):
+        return getattr(self._loader, item)
+
+
+class _ProfilingFinder:
+    """Wraps the loaders of ``gbd_mapping`` submodules to measure their execution."""
+
+    def __init__(self, package: str):
+        self._prefix = f"{package}."
+
+    def find_spec(self, fullname, path, target=None):
+        if not fullname.startswith(self._prefix):
+            return None
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _ProfilingLoader(spec.loader)
+                return spec
+        return None
+
+
+def install(package: str):
+    """Starts profiling imports of the package's submodules if profiling is enabled."""
+    if not ENABLED:
+        return
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+    sys.meta_path.insert(0, _ProfilingFinder(package))
@@ -0,0 +1,171 @@
+"""Binary snapshot of the generated GBD mapping.
+
+The snapshot stores every collection as compact rows (see ``_tables``) so the mapping
+can be rebuilt without importing and executing the large generated modules. It is
+written by ``build_mapping snapshot`` and records a digest of each generated module it
+was built from. A collection is only loaded from the snapshot while its module is
+unchanged; otherwise callers fall back to importing the module.
+
+File layout::
+
+    magic (8 bytes) | format version (uint16) | sha256 of payload (32 bytes) | payload
+
+    payload = index size (uint32) | pickled index | packed rows
+
+The index is a ``{"sources": {...}, "collections": {...}}`` dictionary mapping each
+collection to the attribute names and byte bounds of its rows, each row being pickled
+on its own. The file is memory mapped read-only, so every process using the mapping
+shares one copy of it and a row is only decoded when its record is first built.
+"""
+import hashlib
+import mmap
+import pickle
+import struct
+import threading
+from pathlib import Path
+
+from . import _tables
+
+SNAPSHOT_FILE = "mapping.snapshot"
+FORMAT_VERSION = 2
+
+_MAGIC = b"GBDMAP\x00\x00"
+_HEADER = struct.Struct(">8sH32s")
+_INDEX_SIZE = struct.Struct(">I")
+_PICKLE_PROTOCOL = 4
+_ROOT = Path(__file__).resolve().parent
+
+# Collection name -> generated module that defines it.
+COLLECTIONS = _tables.MODULES
+
+_TO_ROWS = {
+    "sequelae": _tables.sequela_rows,
+    "etiologies": _tables.etiology_rows,
+    "covariates": _tables.covariate_rows,
+    "causes": _tables.cause_rows,
+    "risk_factors": _tables.risk_factor_rows,
+}
+
+_FROM_ROWS = {
+    "sequelae": _tables.build_sequelae,
+    "etiologies": _tables.build_etiologies,
+    "covariates": _tables.build_covariates,
+    "causes": _tables.build_causes,
+    "risk_factors": _tables.build_risk_factors,
+}
+
+# Collections holding references to records of other collections.
+_LINKED = ("causes", "risk_factors")
+
+_payload = None
+_PAYLOAD_LOCK = threading.Lock()
+
+
+def source_digest(module: str) -> str:
+    """Returns the sha256 hex digest of a generated module's source."""
+    return hashlib.sha256(_ROOT.joinpath(f"{module}.py").read_bytes()).hexdigest()
+
+
+def dumps(collections: dict) -> bytes:
+    """Serializes fully built collections, keyed by collection name, to snapshot bytes."""
+    keys = _tables.attribute_names(*collections.values())
+    index = {
+        "sources": {
+            COLLECTIONS[name]: source_digest(COLLECTIONS[name]) for name in collections
+        },
+        "collections": {},
+    }
+    rows = bytearray()
+    for name, collection in collections.items():
+        table = _tables.RowTable.pack(_TO_ROWS[name](collection, keys), _PICKLE_PROTOCOL)
+        bounds = tuple(len(rows) + bound for bound in table.bounds)
+        index["collections"][name] = (table.keys, bounds)
+        rows += table.buffer
+    index = pickle.dumps(index, protocol=_PICKLE_PROTOCOL)
+    payload = _INDEX_SIZE.pack(len(index)) + index + rows
+    return _HEADER.pack(_MAGIC, FORMAT_VERSION, hashlib.sha256(payload).digest()) + payload
+
+
+def loads(data) -> dict | None:
+    """Validates snapshot bytes, returning ``None`` if they are unusable.
+
+    ``data`` may be any buffer, e.g. a memory map. The result maps ``"sources"`` to the
+    module digests and ``"rows"`` to a ``RowTable`` per collection that reads its rows
+    from ``data`` without copying it.
+    """
+    if len(data) < _HEADER.size + _INDEX_SIZE.size:
+        return None
+    magic, version, digest = _HEADER.unpack_from(data)
+    payload = memoryview(data)[_HEADER.size :]
+    if magic != _MAGIC or version != FORMAT_VERSION:
+        return None
+    if hashlib.sha256(payload).digest() != digest:
+        return None
+    (index_size,) = _INDEX_SIZE.unpack_from(payload)
+    index = pickle.loads(payload[_INDEX_SIZE.size : _INDEX_SIZE.size + index_size])
+    rows = payload[_INDEX_SIZE.size + index_size :]
+    return {
+        "sources": index["sources"],
+        "rows": {
+            name: _tables.RowTable(rows, keys, bounds)
+            for name, (keys, bounds) in index["collections"].items()
+        },
+    }
+
+
+def _map_snapshot():
+    try:
+        with _ROOT.joinpath(SNAPSHOT_FILE).open("rb") as f:
+            # The map stays valid after the file is closed.
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):  # Missing or empty file.
+        return b""
+
+
+def _read_payload():
+    global _payload
+    with _PAYLOAD_LOCK:
+        if _payload is None:
+            _payload = loads(_map_snapshot()) or {"sources": {}, "rows": {}}
+        return _payload
+
+
+def build_collection(name: str, rows, get_collection, lazy: bool = False):
+    """Builds a collection from its rows, looking up the collections it refers to with
+    ``get_collection``."""
+    if name in _LINKED:
+        return _FROM_ROWS[name](rows, get_collection, lazy=lazy)
+    return _FROM_ROWS[name](rows, lazy=lazy)
+
+
+def load_collection(name: str, get_collection):
+    """Builds a collection from the snapshot.
+
+    Records are built lazily, the first time each one is accessed.
+
+    Parameters
+    ----------
+    name
+        The name of the collection, e.g. ``"causes"``.
+    get_collection
+        Callable returning another collection by name, used to resolve references
+        the first time they are accessed.
+
+    Returns
+    -------
+    GbdRecord | None
+        The rebuilt collection, or ``None`` if the snapshot is missing, corrupt or stale,
+        or the generated module it was built from is missing.
+    """
+    module = COLLECTIONS[name]
+    payload = _read_payload()
+    if name not in payload["rows"]:
+        return None
+    try:
+        digest = source_digest(module)
+    except OSError:  # E.g. only the module's bytecode is installed.
+        return None
+    if payload["sources"].get(module) != digest:
+        return None
+    # Rows stay in the payload, they only read from the shared map.
+    return build_collection(name, payload["rows"][name], get_collection, lazy=True)
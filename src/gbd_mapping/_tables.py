@@ -0,0 +1,533 @@
+"""Compact row representations of the GBD mapping collections.
+
+Each collection can be flattened into a tuple of rows made only of builtin values
+(``str``, ``int``, ``float``, ``bool``, ``None`` and tuples of those) and rebuilt from
+them. Each row starts with the entity's attribute name in its collection, references
+between entities are stored by attribute name and ``UNKNOWN`` ids are stored as
+``None``. Links a slim mapping leaves out, as they refer to entities it doesn't hold,
+are stored as ``LEFT_OUT`` and are not set on the record at all.
+
+Collections can be built eagerly or lazily. A lazy collection only keeps a reference to
+each row and builds the record the first time it is accessed or iterated over. Rows can
+also be packed into a ``RowTable``, from which a lazy collection unpickles each row
+only when its record is built.
+References to other collections are always resolved on first access, so building one
+collection never builds the collections it refers to.
+"""
+import importlib
+import pickle
+from functools import partial
+
+from .base_template import Categories, GbdRecord, Restrictions, Tmred
+from .id import UNKNOWN, _is_known, c_id, cov_id, hs_id, me_id, rei_id, s_id, scalar
+
+# Collection name -> generated module that defines it.
+MODULES = {
+    "sequelae": "sequela",
+    "etiologies": "etiology",
+    "covariates": "covariate",
+    "causes": "cause",
+    "risk_factors": "risk_factor",
+}
+
+# Row value of a link left out of the mapping.
+LEFT_OUT = ...
+
+RESTRICTION_FIELDS = Restrictions.__slots__
+
+SEQUELA_FIELDS = ("name", "gbd_id", "me_id", "healthstate_name", "healthstate_id")
+ETIOLOGY_FIELDS = ("attribute", "name", "gbd_id")
+COVARIATE_FIELDS = ("name", "gbd_id", "by_age", "by_sex", "dichotomous")
+CAUSE_FIELDS = (
+    "name",
+    "gbd_id",
+    "me_id",
+    "most_detailed",
+    "level",
+    "restrictions",
+    "sequelae",
+    "etiologies",
+    "parent",
+    "sub_causes",
+)
+RISK_FACTOR_FIELDS = (
+    "name",
+    "gbd_id",
+    "level",
+    "most_detailed",
+    "distribution",
+    "population_attributable_fraction_calculation_type",
+    "restrictions",
+    "affected_causes",
+    "population_attributable_fraction_of_one_causes",
+    "parent",
+    "sub_risk_factors",
+    "affected_risk_factors",
+    "categories",
+    "tmred",
+    "relative_risk_scalar",
+)
+
+
+def _id_or_none(value):
+    return int(value) if _is_known(value) else None
+
+
+def _id_or_unknown(id_type, value):
+    return UNKNOWN if value is None else id_type(value)
+
+
+def attribute_names(*collections):
+    """Maps each record in the collections to its attribute name, keyed by ``id``."""
+    return {
+        id(record): name
+        for collection in collections
+        for name, record in zip(collection.__slots__, collection)
+    }
+
+
+def _names(records, keys):
+    return None if records is None else tuple(keys[id(record)] for record in records)
+
+
+def _link_names(record, field, keys):
+    try:
+        records = getattr(record, field)
+    except AttributeError:
+        return LEFT_OUT
+    return _names(records, keys)
+
+
+def _restriction_row(restrictions):
+    return tuple(getattr(restrictions, field) for field in RESTRICTION_FIELDS)
+
+
+def _categories_row(categories):
+    if categories is None:
+        return None
+    return tuple(categories.items())
+
+
+def _tmred_row(tmred):
+    if tmred is None:
+        return None
+    return (
+        tmred.distribution,
+        tmred.inverted,
+        _float_or_none(tmred.min),
+        _float_or_none(tmred.max),
+    )
+
+
+def _float_or_none(value):
+    return None if value is None else float(value)
+
+
+def _scalar_or_none(value):
+    return None if value is None else scalar(value)
+
+
+def sequela_rows(sequelae, keys):
+    return tuple(
+        (
+            keys[id(s)],
+            _id_or_none(s.gbd_id),
+            _id_or_none(s.me_id),
+            None if s.healthstate.name is UNKNOWN else s.healthstate.name,
+            _id_or_none(s.healthstate.gbd_id),
+        )
+        for s in sequelae
+    )
+
+
+def etiology_rows(etiologies, keys):
+    # Etiology names may differ from their attribute names, so both are kept.
+    return tuple((keys[id(e)], e.name, _id_or_none(e.gbd_id)) for e in etiologies)
+
+
+def covariate_rows(covariates, keys):
+    return tuple(
+        (keys[id(c)], _id_or_none(c.gbd_id), c.by_age, c.by_sex, c.dichotomous)
+        for c in covariates
+    )
+
+
+def cause_rows(causes, keys):
+    return tuple(
+        (
+            keys[id(c)],
+            _id_or_none(c.gbd_id),
+            _id_or_none(c.me_id),
+            c.most_detailed,
+            c.level,
+            _restriction_row(c.restrictions),
+            _link_names(c, "sequelae", keys),
+            _link_names(c, "etiologies", keys),
+            None if c.parent is None else keys[id(c.parent)],
+            _link_names(c, "sub_causes", keys),
+        )
+        for c in causes
+    )
+
+
+def risk_factor_rows(risk_factors, keys):
+    return tuple(
+        (
+            keys[id(r)],
+            _id_or_none(r.gbd_id),
+            r.level,
+            r.most_detailed,
+            r.distribution,
+            r.population_attributable_fraction_calculation_type,
+            _restriction_row(r.restrictions),
+            _link_names(r, "affected_causes", keys),
+            _link_names(r, "population_attributable_fraction_of_one_causes", keys),
+            None if r.parent is None else keys[id(r.parent)],
+            _link_names(r, "sub_risk_factors", keys),
+            _link_names(r, "affected_risk_factors", keys),
+            _categories_row(r.categories),
+            _tmred_row(r.tmred),
+            _float_or_none(r.relative_risk_scalar),
+        )
+        for r in risk_factors
+    )
+
+
+# Entity kind -> collection holding the entities of that kind.
+KIND_COLLECTIONS = {
+    "sequela": "sequelae",
+    "etiology": "etiologies",
+    "covariate": "covariates",
+    "cause": "causes",
+    "risk_factor": "risk_factors",
+}
+
+
+def from_reference(kind, key):
+    """Returns the entity of a kind by its attribute name in the mapping's collection."""
+    return getattr(getattr(importlib.import_module(__package__), KIND_COLLECTIONS[kind]), key)
+
+
+def reference(record):
+    """Returns how to pickle a frozen mapping record by reference, or None if it isn't one.
+
+    Entities are pickled as their kind and attribute name and resolved with
+    ``from_reference``. Restrictions, healthstates, categories and tmreds are pickled as
+    their row and resolved to the interned record. Either way, a process unpickling a
+    record gets the same object as its own mapping holds.
+    """
+    if not getattr(record, "_frozen", False):
+        return None
+    kind = getattr(record, "kind", None)
+    if kind in KIND_COLLECTIONS:
+        collection = getattr(importlib.import_module(__package__), KIND_COLLECTIONS[kind])
+        key = record.name
+        if getattr(collection, key, None) is not record:
+            # Some etiologies' names are not their attribute names.
+            key = attribute_names(collection).get(id(record))
+            if key is None:  # Not in the mapping, e.g. built separately from rows.
+                return None
+        return from_reference, (kind, key)
+    if kind == "healthstate":
+        name = None if record.name is UNKNOWN else record.name
+        return _interned, (_healthstate, name, _id_or_none(record.gbd_id))
+    if isinstance(record, Restrictions):
+        return _interned, (Restrictions, *_restriction_row(record))
+    if isinstance(record, Categories):
+        return _interned, (_categories, *_categories_row(record))
+    if isinstance(record, Tmred):
+        return _interned, (_tmred, *_tmred_row(record))
+    return None
+
+
+def _get_all(collection, names):
+    return tuple(getattr(collection, name) for name in names)
+
+
+def module_collection(name):
+    """Returns a collection from the generated module that defines it."""
+    return getattr(importlib.import_module(f".{MODULES[name]}", __package__), name)
+
+
+def _get_all_from(get_collection, collection_name, names):
+    return _get_all(get_collection(collection_name), names)
+
+
+def resolve_all(collection):
+    """Builds every record in a collection along with all of its deferred attributes."""
+    for record in collection:
+        for field in tuple(getattr(record, "_deferred", ())):
+            getattr(record, field)
+
+
+class RowTable:
+    """Rows of a collection packed into a buffer and unpickled one at a time.
+
+    The buffer is typically a memory map of the snapshot, so rows are only read and
+    decoded when the record built from them is first accessed.
+    """
+
+    __slots__ = ("buffer", "keys", "bounds")
+
+    def __init__(self, buffer, keys: tuple[str, ...], bounds: tuple[int, ...]):
+        self.buffer = buffer
+        self.keys = keys
+        self.bounds = bounds
+
+    @classmethod
+    def pack(cls, rows, protocol: int = pickle.DEFAULT_PROTOCOL) -> "RowTable":
+        """Packs rows, each starting with its attribute name, into a new table."""
+        blobs = [pickle.dumps(row, protocol=protocol) for row in rows]
+        bounds = [0]
+        for blob in blobs:
+            bounds.append(bounds[-1] + len(blob))
+        return cls(b"".join(blobs), tuple(row[0] for row in rows), tuple(bounds))
+
+    def row(self, index: int) -> tuple:
+        return pickle.loads(self.buffer[self.bounds[index] : self.bounds[index + 1]])
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __iter__(self):
+        for index in range(len(self.keys)):
+            yield self.row(index)
+
+
+def _frozen(record):
+    record._freeze()
+    return record
+
+
+def _build(container_type, make_record, rows, lazy):
+    # Lazy containers keep a reference to each row and build its record on first access.
+    # Records are frozen once built, eagerly built links are set on them afterwards.
+    # Records nested in them, e.g. restrictions, are frozen by ``make_record``.
+    def make(row):
+        return _frozen(make_record(row))
+
+    if lazy and isinstance(rows, RowTable):
+        container = container_type._from_deferred(
+            lambda index: make(rows.row(index)), dict(zip(rows.keys, range(len(rows))))
+        )
+    elif lazy:
+        container = container_type._from_deferred(make, {row[0]: row for row in rows})
+    else:
+        container = container_type(**{row[0]: make(row) for row in rows})
+    return _frozen(container)
+
+
+def _set(record, field, resolve, value):
+    # Links are part of building the record, so they are set even though it is frozen.
+    object.__setattr__(record, field, resolve(value))
+
+
+def _link_all(records, rows, link, links):
+    for row in rows:
+        _link(getattr(records, row[0]), row, link, links)
+
+
+def _link(record, row, link, links):
+    # Links are set with ``_set`` or deferred with ``GbdRecord._defer``.
+    for field, index, resolve in links:
+        if row[index] is LEFT_OUT:
+            # Unset, so accessing it raises rather than giving only part of the links.
+            object.__delattr__(record, field)
+        elif row[index] is not None:
+            link(record, field, resolve, row[index])
+
+
+# (builder, row values, their types) -> frozen record shared by every entity built from
+# those values.
+_INTERNED = {}
+
+
+def _interned(make, *values):
+    # Restrictions, healthstates, categories and tmreds repeat across entities, so each
+    # distinct one is built once. They are frozen, so sharing them is safe. Types are part
+    # of the key as e.g. age group ids are ints for some entities and floats for others.
+    key = (make, values, tuple(map(type, values)))
+    try:
+        return _INTERNED[key]
+    except KeyError:
+        return _INTERNED.setdefault(key, _frozen(make(*values)))
+
+
+def _healthstate(hs_name, hsid):
+    from .sequela_template import Healthstate
+
+    return Healthstate(
+        name=UNKNOWN if hs_name is None else hs_name,
+        kind="healthstate",
+        gbd_id=_id_or_unknown(hs_id, hsid),
+    )
+
+
+def _categories(*levels):
+    return Categories(**dict(levels))
+
+
+def _tmred(distribution, inverted, min_, max_):
+    return Tmred(distribution, inverted, _scalar_or_none(min_), _scalar_or_none(max_))
+
+
+def _sequela(row):
+    from .sequela_template import Sequela
+
+    name, sid, mei_id, hs_name, hsid = row
+    return Sequela(
+        name=name,
+        kind="sequela",
+        gbd_id=_id_or_unknown(s_id, sid),
+        me_id=_id_or_unknown(me_id, mei_id),
+        healthstate=_interned(_healthstate, hs_name, hsid),
+    )
+
+
+def _etiology(row):
+    from .etiology_template import Etiology
+
+    _key, name, reiid = row
+    return Etiology(name=name, kind="etiology", gbd_id=_id_or_unknown(rei_id, reiid))
+
+
+def _covariate(row):
+    from .covariate_template import Covariate
+
+    name, covid, by_age, by_sex, dichotomous = row
+    return Covariate(
+        name=name,
+        kind="covariate",
+        gbd_id=None if covid is None else cov_id(covid),
+        by_age=by_age,
+        by_sex=by_sex,
+        dichotomous=dichotomous,
+    )
+
+
+def _cause(row):
+    from .cause_template import Cause
+
+    name, cid, mei_id, most_detailed, level, restrictions, *_ = row
+    return Cause(
+        name=name,
+        kind="cause",
+        gbd_id=c_id(cid),
+        me_id=_id_or_unknown(me_id, mei_id),
+        level=level,
+        most_detailed=most_detailed,
+        parent=None,
+        restrictions=_interned(Restrictions, *restrictions),
+    )
+
+
+def _risk_factor(row):
+    from .risk_factor_template import RiskFactor
+
+    (
+        name,
+        reiid,
+        level,
+        most_detailed,
+        distribution,
+        paf_type,
+        restrictions,
+        *_,
+        categories,
+        tmred,
+        rr_scalar,
+    ) = row
+    return RiskFactor(
+        name=name,
+        kind="risk_factor",
+        gbd_id=rei_id(reiid),
+        level=level,
+        most_detailed=most_detailed,
+        distribution=distribution,
+        population_attributable_fraction_calculation_type=paf_type,
+        restrictions=_interned(Restrictions, *restrictions),
+        affected_causes=None,
+        population_attributable_fraction_of_one_causes=None,
+        categories=None if categories is None else _interned(_categories, *categories),
+        tmred=None if tmred is None else _interned(_tmred, *tmred),
+        relative_risk_scalar=_scalar_or_none(rr_scalar),
+    )
+
+
+def build_sequelae(rows, lazy=False):
+    from .sequela_template import Sequelae
+
+    return _build(Sequelae, _sequela, rows, lazy)
+
+
+def build_etiologies(rows, lazy=False):
+    from .etiology_template import Etiologies
+
+    return _build(Etiologies, _etiology, rows, lazy)
+
+
+def build_covariates(rows, lazy=False):
+    from .covariate_template import Covariates
+
+    return _build(Covariates, _covariate, rows, lazy)
+
+
+def build_causes(rows, get_collection=module_collection, lazy=False):
+    """Builds the causes, eagerly or, if ``lazy``, one by one on first access.
+
+    Parent and sub-cause links of a lazily built cause are deferred as well, so
+    accessing one cause does not build the whole cause hierarchy. Sequelae and
+    etiologies are looked up with ``get_collection`` on first access.
+    """
+    from .cause_template import Causes
+
+    def make_cause(row):
+        cause = _cause(row)
+        _link(cause, row, GbdRecord._defer, references)
+        if lazy:
+            _link(cause, row, GbdRecord._defer, links)
+        return cause
+
+    references = (
+        ("sequelae", 6, partial(_get_all_from, get_collection, "sequelae")),
+        ("etiologies", 7, partial(_get_all_from, get_collection, "etiologies")),
+    )
+    causes = _build(Causes, make_cause, rows, lazy)
+    links = (
+        ("parent", 8, partial(getattr, causes)),
+        ("sub_causes", 9, partial(_get_all, causes)),
+    )
+    if not lazy:
+        _link_all(causes, rows, _set, links)
+    return causes
+
+
+def build_risk_factors(rows, get_collection=module_collection, lazy=False):
+    """Builds the risk factors, eagerly or, if ``lazy``, one by one on first access.
+
+    Affected causes are looked up with ``get_collection`` on first access.
+    """
+    from .risk_factor_template import RiskFactors
+
+    def make_risk_factor(row):
+        risk_factor = _risk_factor(row)
+        _link(risk_factor, row, GbdRecord._defer, references)
+        if lazy:
+            _link(risk_factor, row, GbdRecord._defer, links)
+        return risk_factor
+
+    get_causes = partial(_get_all_from, get_collection, "causes")
+    references = (
+        ("affected_causes", 7, get_causes),
+        ("population_attributable_fraction_of_one_causes", 8, get_causes),
+    )
+    risk_factors = _build(RiskFactors, make_risk_factor, rows, lazy)
+    get_risk_factors = partial(_get_all, risk_factors)
+    links = (
+        ("parent", 9, partial(getattr, risk_factors)),
+        ("sub_risk_factors", 10, get_risk_factors),
+        ("affected_risk_factors", 11, get_risk_factors),
+    )
+    if not lazy:
+        _link_all(risk_factors, rows, _set, links)
+    return risk_factors
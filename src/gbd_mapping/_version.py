@@ -0,0 +1 @@
+__version__ = "0.1.dev1+g3c7d5a52e"
@@ -4,32 +4,216 @@ This code is automatically generated by gbd_mapping_generator/base_template_buil
 
 Any manual changes will be lost.
 """
-from .id import c_id, cov_id, hs_id, me_id, rei_id, s_id, scalar
+import json
+import threading
+from .id import Unknown, _is_known, c_id, cov_id, hs_id, me_id, rei_id, s_id, scalar
+
+_DEFERRED_LOCK = threading.RLock()
+_MISSING = object()
 
 
 class GbdRecord:
-    """Base class for entities modeled in the GBD."""
-    __slots__ = ()
+    """Base class for entities modeled in the GBD.
+
+    Records in the mapping are frozen once they are built and linked. Frozen records
+    can't be changed and hash by ``(kind, gbd_id)``, or by ``(kind, name)`` if they have
+    no id, so entities can be used as dictionary keys and set members. Records without
+    a kind hash by their fields. Records can also be weakly referenced, e.g. as keys of a
+    ``weakref.WeakKeyDictionary``.
+    """
+    __slots__ = ('_deferred', '_cached_dict', '_hash', '_frozen', '__weakref__', )
+    _fields = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Set once per class so membership tests don't scan __slots__.
+        cls._fields = frozenset(cls.__slots__)
+
+    def __init__(self):
+        object.__setattr__(self, '_frozen', False)
+
+    def __setattr__(self, name, value):
+        if getattr(self, '_frozen', False):
+            raise AttributeError(f"'{self.__class__.__name__}' object is frozen")
+        object.__setattr__(self, name, value)
 
-    def to_dict(self):
-        out = {}
+    def __delattr__(self, name):
+        if getattr(self, '_frozen', False):
+            raise AttributeError(f"'{self.__class__.__name__}' object is frozen")
+        object.__delattr__(self, name)
+
+    def _freeze(self):
+        """Makes the record read-only, though its deferred attributes can still be built."""
+        if 'kind' in self._fields:
+            object.__setattr__(self, '_hash', hash(self._identity()))
+        object.__setattr__(self, '_frozen', True)
+
+    def __reduce_ex__(self, protocol):
+        # Frozen records of the mapping are pickled as references that are resolved
+        # against the mapping of the process unpickling them, others by value.
+        from ._tables import reference
+
+        return reference(self) or (_new_record, (self.__class__,), self.__getstate__())
+
+    def __getstate__(self):
+        fields = {}
         for item in self.__slots__:
-            attr = getattr(self, item)
-            if item == "parent":
-                out[item] = attr.name if hasattr(attr, "name") else attr.__repr__()
-            elif isinstance(attr, GbdRecord):
-                out[item] = attr.to_dict()
-            elif isinstance(attr, tuple) and attr:
-                if isinstance(attr[0], GbdRecord):
-                    out[item] = tuple(r.to_dict() for r in attr)
-            elif attr is not None:
-                out[item] = attr
-            else:
+            try:
+                fields[item] = getattr(self, item)
+            except AttributeError:
+                pass
+        # Hashes of strings differ between processes, so the hash is computed again.
+        return fields, getattr(self, '_frozen', False)
+
+    def __setstate__(self, state):
+        fields, frozen = state
+        for item, value in fields.items():
+            object.__setattr__(self, item, value)
+        if frozen:
+            self._freeze()
+
+    def _identity(self):
+        if 'kind' not in self._fields:
+            # Nested and linked records are left out, so cycles of links don't recurse.
+            return (self.__class__.__name__, tuple(
+                attr for attr in self
+                if not isinstance(attr, GbdRecord) and not _is_records(attr)))
+        gbd_id = self.gbd_id
+        return (self.kind, gbd_id) if _is_known(gbd_id) else (self.kind, self.name)
+
+    def to_dict(self, max_depth=None):
+        """Returns the fields of the record as a dictionary.
+
+        Nested records are expanded into dictionaries up to ``max_depth`` levels deep,
+        or fully if it is ``None``. Parents, named records beyond ``max_depth`` and
+        records that would contain themselves are given by name instead.
+
+        Fully expanded results of frozen records are cached on them, as they can't
+        change, but every call returns new dictionaries. Within one result, a record
+        nested in several places is expanded into one dictionary shared between them.
+        """
+        frozen = getattr(self, '_frozen', False)
+        cached = getattr(self, '_cached_dict', None) if frozen else None
+        if max_depth is None and cached is not None:
+            return _copy_dict(cached)
+        # Frames are [record, depth, parent frame, fields, nested results, uncacheable].
+        root = [self, 0, None, None, {}, False]
+        stack = [root]
+        expanding = set()
+        while stack:
+            frame = stack[-1]
+            record, depth, parent, fields, nested = frame[:5]
+            if fields is None:  # First visit, schedule nested records.
+                expanding.add(id(record))
+                frame[3] = fields = record._items()
+                for item, attr in fields:
+                    if item == "parent":
+                        continue
+                    children = attr if isinstance(attr, tuple) else (attr,)
+                    for child in children:
+                        if not isinstance(child, GbdRecord) or id(child) in nested:
+                            continue
+                        if id(child) in expanding:
+                            nested[id(child)] = child.name
+                            frame[5] = True
+                        elif (max_depth is not None and depth >= max_depth
+                              and hasattr(child, "name")):
+                            nested[id(child)] = child.name
+                        elif (max_depth is None and getattr(child, '_frozen', False)
+                              and hasattr(child, '_cached_dict')):
+                            nested[id(child)] = child._cached_dict
+                        else:
+                            nested[id(child)] = None
+                            stack.append([child, depth + 1, frame, None, {}, False])
                 continue
-        return out        
+            stack.pop()
+            expanding.discard(id(record))
+            out = {}
+            for item, attr in fields:
+                if item == "parent":
+                    out[item] = attr.name if hasattr(attr, "name") else attr.__repr__()
+                elif isinstance(attr, GbdRecord):
+                    out[item] = nested[id(attr)]
+                elif isinstance(attr, tuple) and attr:
+                    if isinstance(attr[0], GbdRecord):
+                        out[item] = tuple(nested[id(r)] for r in attr)
+                elif attr is not None:
+                    out[item] = attr
+            # Results cut short by a cycle depend on where expansion started and those of
+            # records that aren't frozen, or hold ones that aren't, may change.
+            frame[5] = frame[5] or not getattr(record, '_frozen', False)
+            if max_depth is None and not frame[5]:
+                object.__setattr__(record, '_cached_dict', out)
+            if parent is not None:
+                parent[4][id(record)] = out
+                parent[5] = parent[5] or frame[5]
+        # Fully expanded results may hold cached dictionaries, which are never handed out.
+        return _copy_dict(out) if max_depth is None else out
+
+    def _items(self):
+        """Returns (field, value) pairs of the record, in the order of its slots.
+
+        Fields left out of the mapping, see ``__getattr__``, are skipped.
+        """
+        items = []
+        for item in self.__slots__:
+            try:
+                items.append((item, getattr(self, item)))
+            except AttributeError:
+                pass
+        return items
+
+    @classmethod
+    def _from_deferred(cls, resolve, values):
+        """Creates a record whose attributes are built as ``resolve(values[name])`` on first
+        access."""
+        record = cls.__new__(cls)
+        object.__setattr__(record, '_frozen', False)
+        record._deferred = {name: (resolve, value) for name, value in values.items()}
+        return record
+
+    def _defer(self, name, resolve, value):
+        """Replaces attribute ``name`` with ``resolve(value)``, evaluated on first access."""
+        try:
+            object.__delattr__(self, name)
+        except AttributeError:
+            pass
+        try:
+            deferred = self._deferred
+        except AttributeError:
+            deferred = self._deferred = {}
+        deferred[name] = (resolve, value)
+
+    def __getattr__(self, item):
+        # Only reached for unset slots, so fully built records never pay for this.
+        if item in GbdRecord.__slots__ or item.startswith('__'):  # Never deferred.
+            raise AttributeError(item)
+        try:
+            deferred = self._deferred
+        except AttributeError:
+            deferred = {}
+        if item not in deferred:
+            if item in self._fields:
+                # Slim mappings leave out links to entities they don't hold.
+                raise AttributeError(
+                    f"'{self.__class__.__name__}' object has no attribute '{item}', "
+                    "it was left out of this mapping"
+                )
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute '{item}'"
+            )
+        with _DEFERRED_LOCK:
+            if item in deferred:  # Not built by another thread while we waited.
+                resolve, value = deferred[item]
+                object.__setattr__(self, item, resolve(value))
+                del deferred[item]
+        return object.__getattribute__(self, item)
 
     def __contains__(self, item):
-        return item in self.__slots__
+        try:
+            return item in self._fields
+        except TypeError:  # Unhashable, so not a field name.
+            return False
 
     def __getitem__(self, item):
         if item in self:
@@ -41,14 +225,47 @@ class GbdRecord:
         for item in self.__slots__:
             yield getattr(self, item)
 
+    def __hash__(self):
+        try:
+            return self._hash
+        except AttributeError:
+            pass
+        out = hash(self._identity())
+        if getattr(self, '_frozen', False):
+            object.__setattr__(self, '_hash', out)
+        return out
+
     def __eq__(self, other):
-        return all([getattr(self, item) == getattr(other, item) for item in self.__slots__
-                    if not isinstance(getattr(self, item), GbdRecord)])
+        if self is other:
+            return True
+        if not isinstance(other, GbdRecord):
+            return NotImplemented
+        try:
+            if self._hash != other._hash:
+                return False
+        except AttributeError:
+            pass
+        if 'kind' in self._fields and 'kind' in other._fields:
+            if self.kind != other.kind or self.gbd_id != other.gbd_id:
+                return False
+        if self._fields is not other._fields and self._fields != other._fields:
+            return False
+        # Stops at the first difference. Shared values are equal without comparing them.
+        for item in self.__slots__:
+            mine, theirs = getattr(self, item, _MISSING), getattr(other, item, _MISSING)
+            if mine is theirs:
+                continue
+            if item == 'parent' or _is_records(mine):
+                if not _same_links(mine, theirs):
+                    return False
+            elif mine != theirs:
+                return False
+        return True
 
     def __repr__(self):
         out = f'{self.__class__.__name__}('
         for i, slot in enumerate(self.__slots__):
-            attr = self[slot]
+            attr = getattr(self, slot, None)
             if attr is None:
                 continue
             if i != 0:
@@ -63,6 +280,166 @@ class GbdRecord:
         return out + ')'
 
 
+class GbdCollection(GbdRecord):
+    """Base class for collections of GBD entities."""
+    __slots__ = ('_by_id', '_id_table', )
+
+    def by_id(self, gbd_id):
+        """Returns the entity with the given GBD id, raising a ``KeyError`` if there is none.
+
+        The first lookup builds an index of every entity in the collection.
+        """
+        return self._id_index()[gbd_id]
+
+    def by_ids(self, gbd_ids):
+        """Returns a tuple of the entities with the given GBD ids, in the same order."""
+        index = self._id_index()
+        return tuple(index[gbd_id] for gbd_id in gbd_ids)
+
+    def _id_index(self):
+        try:
+            return self._by_id
+        except AttributeError:
+            pass
+        # Entities without a known id can't be looked up by it.
+        index = {entity.gbd_id: entity for entity in self
+                 if _is_known(entity.gbd_id)}
+        object.__setattr__(self, '_by_id', index)
+        return index
+
+    def ids_to_codes(self, gbd_ids):
+        """Returns the codes in ``categorical_dtype()`` of the entities with the given ids.
+
+        ``gbd_ids`` is a NumPy array or pandas ``Series`` of ids, translated in one
+        vectorized step; a ``Series`` gives a ``Series`` with the same index. Ids no entity
+        has, including missing ones, get the code ``-1``. The first translation builds a
+        dense table of every id in the collection.
+        """
+        from ._arrays import ids_to_codes
+        return ids_to_codes(self._dense_id_table(), gbd_ids)
+
+    def ids_to_names(self, gbd_ids):
+        """Returns the names of the entities with the given GBD ids, like ``ids_to_codes``.
+
+        Names are in an object array, with ``None`` for ids no entity has.
+        """
+        from ._arrays import ids_to_names
+        return ids_to_names(self._dense_id_table(), gbd_ids)
+
+    def ids_to_categorical(self, gbd_ids):
+        """Returns a pandas ``Categorical`` of the names of the entities with the given ids.
+
+        Its dtype is ``categorical_dtype()`` and ids no entity has are missing values.
+        """
+        from ._arrays import ids_to_categorical
+        return ids_to_categorical(self._dense_id_table(), gbd_ids)
+
+    def categorical_dtype(self):
+        """Returns a cached pandas ``CategoricalDtype`` of the names of the entities.
+
+        The names are in the order of the entities' GBD ids, which new entities come after,
+        so columns stored as its codes keep their meaning across processes and, unless
+        entities are removed, across versions of the mapping.
+        """
+        return self._dense_id_table().categorical_dtype()
+
+    def _dense_id_table(self):
+        try:
+            return self._id_table
+        except AttributeError:
+            pass
+        from ._arrays import IdTable
+        object.__setattr__(self, '_id_table', IdTable(self))
+        return self._id_table
+
+    def write_json(self, f, lines=False):
+        """Writes the entities to the text file ``f`` as JSON, one entity at a time.
+
+        The entities are written as one object keyed by attribute name or, if ``lines``,
+        as JSON Lines with one entity per line. Links to other entities are written as
+        their names and ``UNKNOWN`` as ``null``.
+        """
+        encode = json.JSONEncoder(default=_unknown_to_none).encode
+        if lines:
+            for entity in self:
+                f.write(encode(_linked_dict(entity)) + '\n')
+            return
+        f.write('{')
+        for i, (name, entity) in enumerate(zip(self.__slots__, self)):
+            f.write(',\n' if i else '\n')
+            f.write(f'{encode(name)}: {encode(_linked_dict(entity))}')
+        f.write('\n}\n')
+
+
+def _copy_dict(result):
+    # Copies the dictionaries of a to_dict result, nested ones included, without recursing.
+    # A dictionary nested in several places is copied once, so the copy is shared within
+    # the new result, as it was in the old one, but not with any other result.
+    copies = {id(result): {}}
+    stack = [result]
+    while stack:
+        source = stack.pop()
+        target = copies[id(source)]
+        for key, value in source.items():
+            nested = value if isinstance(value, tuple) else (value,)
+            for v in nested:
+                if isinstance(v, dict) and id(v) not in copies:
+                    copies[id(v)] = {}
+                    stack.append(v)
+            if isinstance(value, dict):
+                target[key] = copies[id(value)]
+            elif isinstance(value, tuple) and any(isinstance(v, dict) for v in value):
+                target[key] = tuple(copies[id(v)] if isinstance(v, dict) else v for v in value)
+            else:
+                target[key] = value
+    return copies[id(result)]
+
+
+def _linked_dict(record):
+    # Like GbdRecord.to_dict, but linked records, in parent or in tuples, are given by name.
+    out = {}
+    for item in record.__slots__:
+        attr = getattr(record, item, None)
+        if attr is None:
+            continue
+        if item == 'parent':
+            out[item] = attr.name
+        elif isinstance(attr, GbdRecord):
+            out[item] = attr.to_dict()
+        elif isinstance(attr, tuple) and attr and isinstance(attr[0], GbdRecord):
+            out[item] = tuple(r.name for r in attr)
+        else:
+            out[item] = attr
+    return out
+
+
+def _new_record(cls):
+    record = cls.__new__(cls)
+    object.__setattr__(record, '_frozen', False)
+    return record
+
+
+def _is_records(value):
+    return isinstance(value, tuple) and bool(value) and isinstance(value[0], GbdRecord)
+
+
+def _same_links(mine, theirs):
+    # Linked entities are compared by kind and id rather than field by field, as links can
+    # form cycles. Comparing collections still compares every entity in full.
+    if not isinstance(mine, tuple):
+        mine, theirs = (mine,), (theirs,)
+    if not isinstance(theirs, tuple) or len(mine) != len(theirs):
+        return False
+    return all(a is b or isinstance(a, GbdRecord) and isinstance(b, GbdRecord)
+               and a._identity() == b._identity() for a, b in zip(mine, theirs))
+
+
+def _unknown_to_none(value):
+    if isinstance(value, Unknown):
+        return None
+    raise TypeError(f'Object of type {value.__class__.__name__} is not JSON serializable')
+
+
 class ModelableEntity(GbdRecord):
     """Container for general GBD ids and metadata."""
     __slots__ = ('name', 'kind', 'gbd_id', )
@@ -70,8 +447,7 @@ class ModelableEntity(GbdRecord):
     def __init__(self,
                  name: str,
                  kind: str,
-                 gbd_id: c_id | s_id | hs_id | me_id | cov_id | rei_id | None,
-    ):
+                 gbd_id: c_id | s_id | hs_id | me_id | cov_id | rei_id | None, ):
         super().__init__()
         self.name = name
         self.kind = kind
@@ -119,320 +495,80 @@ class Tmred(GbdRecord):
         self.max = max
 
 
-class Categories(GbdRecord):
-    """Container for categorical risk exposure levels."""
-    __slots__ = ('cat1', 'cat2', 'cat3', 'cat4', 'cat5', 'cat6', 'cat7', 'cat8', 'cat9', 'cat10', 'cat11', 'cat12',
-                 'cat13', 'cat14', 'cat15', 'cat16', 'cat17', 'cat18', 'cat19', 'cat20', 'cat21', 'cat22', 'cat23',
-                 'cat24', 'cat25', 'cat26', 'cat27', 'cat28', 'cat29', 'cat30', 'cat31', 'cat32', 'cat33', 'cat34',
-                 'cat35', 'cat36', 'cat37', 'cat38', 'cat39', 'cat40', 'cat41', 'cat42', 'cat43', 'cat44', 'cat45',
-                 'cat46', 'cat47', 'cat48', 'cat49', 'cat50', 'cat51', 'cat52', 'cat53', 'cat54', 'cat55', 'cat56',
-                 'cat57', 'cat58', 'cat59', 'cat60', 'cat61', 'cat62', 'cat63', 'cat64', 'cat65', 'cat66', 'cat67',
-                 'cat68', 'cat69', 'cat70', 'cat71', 'cat72', 'cat73', 'cat74', 'cat75', 'cat76', 'cat77', 'cat78',
-                 'cat79', 'cat80', 'cat81', 'cat82', 'cat83', 'cat84', 'cat85', 'cat86', 'cat87', 'cat88', 'cat89',
-                 'cat90', 'cat91', 'cat92', 'cat93', 'cat94', 'cat95', 'cat96', 'cat97', 'cat98', 'cat99', 'cat100',
-                 'cat101', 'cat102', 'cat103', 'cat104', 'cat105', 'cat106', 'cat107', 'cat108', 'cat109', 'cat110',
-                 'cat111', 'cat112', 'cat113', 'cat114', 'cat115', 'cat116', 'cat117', 'cat118', 'cat119', 'cat120',
-                 'cat121', 'cat122', 'cat123', 'cat124', 'cat125', 'cat126', 'cat127', 'cat128', 'cat129', 'cat130',
-                 'cat131', 'cat132', 'cat133', 'cat134', 'cat135', 'cat136', 'cat137', 'cat138', 'cat139', 'cat140',
-                 'cat141', 'cat142', 'cat143', 'cat144', 'cat145', 'cat146', 'cat147', 'cat148', 'cat149', )
+class _IndexedCategories(GbdRecord):
+    # Slots of a base class are not fields of the record, see GbdCollection.
+    __slots__ = ('_index', )
 
-    def __init__(self,
-                 cat1: str = None,
-                 cat2: str = None,
-                 cat3: str = None,
-                 cat4: str = None,
-                 cat5: str = None,
-                 cat6: str = None,
-                 cat7: str = None,
-                 cat8: str = None,
-                 cat9: str = None,
-                 cat10: str = None,
-                 cat11: str = None,
-                 cat12: str = None,
-                 cat13: str = None,
-                 cat14: str = None,
-                 cat15: str = None,
-                 cat16: str = None,
-                 cat17: str = None,
-                 cat18: str = None,
-                 cat19: str = None,
-                 cat20: str = None,
-                 cat21: str = None,
-                 cat22: str = None,
-                 cat23: str = None,
-                 cat24: str = None,
-                 cat25: str = None,
-                 cat26: str = None,
-                 cat27: str = None,
-                 cat28: str = None,
-                 cat29: str = None,
-                 cat30: str = None,
-                 cat31: str = None,
-                 cat32: str = None,
-                 cat33: str = None,
-                 cat34: str = None,
-                 cat35: str = None,
-                 cat36: str = None,
-                 cat37: str = None,
-                 cat38: str = None,
-                 cat39: str = None,
-                 cat40: str = None,
-                 cat41: str = None,
-                 cat42: str = None,
-                 cat43: str = None,
-                 cat44: str = None,
-                 cat45: str = None,
-                 cat46: str = None,
-                 cat47: str = None,
-                 cat48: str = None,
-                 cat49: str = None,
-                 cat50: str = None,
-                 cat51: str = None,
-                 cat52: str = None,
-                 cat53: str = None,
-                 cat54: str = None,
-                 cat55: str = None,
-                 cat56: str = None,
-                 cat57: str = None,
-                 cat58: str = None,
-                 cat59: str = None,
-                 cat60: str = None,
-                 cat61: str = None,
-                 cat62: str = None,
-                 cat63: str = None,
-                 cat64: str = None,
-                 cat65: str = None,
-                 cat66: str = None,
-                 cat67: str = None,
-                 cat68: str = None,
-                 cat69: str = None,
-                 cat70: str = None,
-                 cat71: str = None,
-                 cat72: str = None,
-                 cat73: str = None,
-                 cat74: str = None,
-                 cat75: str = None,
-                 cat76: str = None,
-                 cat77: str = None,
-                 cat78: str = None,
-                 cat79: str = None,
-                 cat80: str = None,
-                 cat81: str = None,
-                 cat82: str = None,
-                 cat83: str = None,
-                 cat84: str = None,
-                 cat85: str = None,
-                 cat86: str = None,
-                 cat87: str = None,
-                 cat88: str = None,
-                 cat89: str = None,
-                 cat90: str = None,
-                 cat91: str = None,
-                 cat92: str = None,
-                 cat93: str = None,
-                 cat94: str = None,
-                 cat95: str = None,
-                 cat96: str = None,
-                 cat97: str = None,
-                 cat98: str = None,
-                 cat99: str = None,
-                 cat100: str = None,
-                 cat101: str = None,
-                 cat102: str = None,
-                 cat103: str = None,
-                 cat104: str = None,
-                 cat105: str = None,
-                 cat106: str = None,
-                 cat107: str = None,
-                 cat108: str = None,
-                 cat109: str = None,
-                 cat110: str = None,
-                 cat111: str = None,
-                 cat112: str = None,
-                 cat113: str = None,
-                 cat114: str = None,
-                 cat115: str = None,
-                 cat116: str = None,
-                 cat117: str = None,
-                 cat118: str = None,
-                 cat119: str = None,
-                 cat120: str = None,
-                 cat121: str = None,
-                 cat122: str = None,
-                 cat123: str = None,
-                 cat124: str = None,
-                 cat125: str = None,
-                 cat126: str = None,
-                 cat127: str = None,
-                 cat128: str = None,
-                 cat129: str = None,
-                 cat130: str = None,
-                 cat131: str = None,
-                 cat132: str = None,
-                 cat133: str = None,
-                 cat134: str = None,
-                 cat135: str = None,
-                 cat136: str = None,
-                 cat137: str = None,
-                 cat138: str = None,
-                 cat139: str = None,
-                 cat140: str = None,
-                 cat141: str = None,
-                 cat142: str = None,
-                 cat143: str = None,
-                 cat144: str = None,
-                 cat145: str = None,
-                 cat146: str = None,
-                 cat147: str = None,
-                 cat148: str = None,
-                 cat149: str = None, ):
+
+class Categories(_IndexedCategories):
+    """Container for categorical risk exposure levels.
+
+    Holds the labels of the levels a risk uses in the order of their codes, ``cat1``,
+    ``cat2`` and so on, which may have gaps. Labels are available as attributes or
+    items, e.g. ``categories.cat3``, which is ``None`` for codes the risk does not use.
+    """
+    __slots__ = ('codes', 'labels', )
+
+    def __init__(self, **labels: str):
         super().__init__()
-        self.cat1 = cat1
-        self.cat2 = cat2
-        self.cat3 = cat3
-        self.cat4 = cat4
-        self.cat5 = cat5
-        self.cat6 = cat6
-        self.cat7 = cat7
-        self.cat8 = cat8
-        self.cat9 = cat9
-        self.cat10 = cat10
-        self.cat11 = cat11
-        self.cat12 = cat12
-        self.cat13 = cat13
-        self.cat14 = cat14
-        self.cat15 = cat15
-        self.cat16 = cat16
-        self.cat17 = cat17
-        self.cat18 = cat18
-        self.cat19 = cat19
-        self.cat20 = cat20
-        self.cat21 = cat21
-        self.cat22 = cat22
-        self.cat23 = cat23
-        self.cat24 = cat24
-        self.cat25 = cat25
-        self.cat26 = cat26
-        self.cat27 = cat27
-        self.cat28 = cat28
-        self.cat29 = cat29
-        self.cat30 = cat30
-        self.cat31 = cat31
-        self.cat32 = cat32
-        self.cat33 = cat33
-        self.cat34 = cat34
-        self.cat35 = cat35
-        self.cat36 = cat36
-        self.cat37 = cat37
-        self.cat38 = cat38
-        self.cat39 = cat39
-        self.cat40 = cat40
-        self.cat41 = cat41
-        self.cat42 = cat42
-        self.cat43 = cat43
-        self.cat44 = cat44
-        self.cat45 = cat45
-        self.cat46 = cat46
-        self.cat47 = cat47
-        self.cat48 = cat48
-        self.cat49 = cat49
-        self.cat50 = cat50
-        self.cat51 = cat51
-        self.cat52 = cat52
-        self.cat53 = cat53
-        self.cat54 = cat54
-        self.cat55 = cat55
-        self.cat56 = cat56
-        self.cat57 = cat57
-        self.cat58 = cat58
-        self.cat59 = cat59
-        self.cat60 = cat60
-        self.cat61 = cat61
-        self.cat62 = cat62
-        self.cat63 = cat63
-        self.cat64 = cat64
-        self.cat65 = cat65
-        self.cat66 = cat66
-        self.cat67 = cat67
-        self.cat68 = cat68
-        self.cat69 = cat69
-        self.cat70 = cat70
-        self.cat71 = cat71
-        self.cat72 = cat72
-        self.cat73 = cat73
-        self.cat74 = cat74
-        self.cat75 = cat75
-        self.cat76 = cat76
-        self.cat77 = cat77
-        self.cat78 = cat78
-        self.cat79 = cat79
-        self.cat80 = cat80
-        self.cat81 = cat81
-        self.cat82 = cat82
-        self.cat83 = cat83
-        self.cat84 = cat84
-        self.cat85 = cat85
-        self.cat86 = cat86
-        self.cat87 = cat87
-        self.cat88 = cat88
-        self.cat89 = cat89
-        self.cat90 = cat90
-        self.cat91 = cat91
-        self.cat92 = cat92
-        self.cat93 = cat93
-        self.cat94 = cat94
-        self.cat95 = cat95
-        self.cat96 = cat96
-        self.cat97 = cat97
-        self.cat98 = cat98
-        self.cat99 = cat99
-        self.cat100 = cat100
-        self.cat101 = cat101
-        self.cat102 = cat102
-        self.cat103 = cat103
-        self.cat104 = cat104
-        self.cat105 = cat105
-        self.cat106 = cat106
-        self.cat107 = cat107
-        self.cat108 = cat108
-        self.cat109 = cat109
-        self.cat110 = cat110
-        self.cat111 = cat111
-        self.cat112 = cat112
-        self.cat113 = cat113
-        self.cat114 = cat114
-        self.cat115 = cat115
-        self.cat116 = cat116
-        self.cat117 = cat117
-        self.cat118 = cat118
-        self.cat119 = cat119
-        self.cat120 = cat120
-        self.cat121 = cat121
-        self.cat122 = cat122
-        self.cat123 = cat123
-        self.cat124 = cat124
-        self.cat125 = cat125
-        self.cat126 = cat126
-        self.cat127 = cat127
-        self.cat128 = cat128
-        self.cat129 = cat129
-        self.cat130 = cat130
-        self.cat131 = cat131
-        self.cat132 = cat132
-        self.cat133 = cat133
-        self.cat134 = cat134
-        self.cat135 = cat135
-        self.cat136 = cat136
-        self.cat137 = cat137
-        self.cat138 = cat138
-        self.cat139 = cat139
-        self.cat140 = cat140
-        self.cat141 = cat141
-        self.cat142 = cat142
-        self.cat143 = cat143
-        self.cat144 = cat144
-        self.cat145 = cat145
-        self.cat146 = cat146
-        self.cat147 = cat147
-        self.cat148 = cat148
-        self.cat149 = cat149
+        for code in labels:
+            if not _is_category_code(code):
+                raise TypeError(f"Categories() got an unexpected keyword argument '{code}'")
+        items = sorted(((code, label) for code, label in labels.items() if label is not None),
+                       key=lambda item: int(item[0][3:]))
+        self.codes = tuple(code for code, _ in items)
+        self.labels = tuple(label for _, label in items)
+
+    def code(self, label):
+        """Returns the code of the level with the given label."""
+        return self._lookups()[1][label]
+
+    def items(self):
+        """Returns (code, label) pairs in the order of the codes."""
+        return list(zip(self.codes, self.labels))
+
+    def categorical_dtype(self, labels=False):
+        """Returns a cached pandas ``CategoricalDtype`` of the codes, or of the labels if
+        ``labels``, in the order of the codes."""
+        from ._arrays import categorical_dtype
+        return categorical_dtype(self.labels if labels else self.codes)
+
+    def _items(self):
+        return self.items()
+
+    def _lookups(self):
+        # Label by code and code by label, built on first use. They aren't fields, so
+        # they're built again after unpickling.
+        try:
+            return self._index
+        except AttributeError:
+            pass
+        index = dict(zip(self.codes, self.labels)), dict(zip(self.labels, self.codes))
+        object.__setattr__(self, '_index', index)
+        return index
+
+    def __getattr__(self, item):
+        if _is_category_code(item):
+            return self._lookups()[0].get(item)
+        return super().__getattr__(item)
+
+    def __contains__(self, item):
+        # Every code is an item, as it was when each one had a slot.
+        return _is_category_code(item) or super().__contains__(item)
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __iter__(self):
+        return iter(self.labels)
+
+    def __dir__(self):
+        return [*super().__dir__(), *self.codes]
+
+    def __repr__(self):
+        items = ','.join(f'\n{code}={label!r}' for code, label in self.items())
+        return f'Categories({items})'
+
+
+def _is_category_code(item):
+    return isinstance(item, str) and item.startswith('cat') and item[3:].isdigit()
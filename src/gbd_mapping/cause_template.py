@@ -6,10 +6,14 @@ Any manual changes will be lost.
 """
 from __future__ import annotations
 
-from .base_template import GbdRecord, ModelableEntity, Restrictions
-from .etiology_template import Etiology
+from typing import TYPE_CHECKING
+
+from .base_template import GbdCollection, ModelableEntity, Restrictions
 from .id import Unknown, c_id, me_id
-from .sequela_template import Sequela
+
+if TYPE_CHECKING:
+    from .etiology_template import Etiology
+    from .sequela_template import Sequela
 
 
 class Cause(ModelableEntity):
@@ -45,7 +49,7 @@ class Cause(ModelableEntity):
         self.etiologies = etiologies
 
 
-class Causes(GbdRecord):
+class Causes(GbdCollection):
     """Container for GBD causes."""
     __slots__ = ('all_causes', 'communicable_maternal_neonatal_and_nutritional_diseases', 'tuberculosis', 'hiv_aids',
                  'hiv_aids_resulting_in_other_diseases', 'diarrheal_diseases', 'typhoid_fever', 'paratyphoid_fever',
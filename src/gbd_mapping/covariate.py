@@ -4,7192 +4,913 @@ This code is automatically generated by gbd_mapping_generator/covariate_builder.
 
 Any manual changes will be lost.
 """
-from .covariate_template import Covariate, Covariates
-from .id import cov_id
+from . import _load_collection
 
-covariates = Covariates(**{
-    'legality_of_abortion': Covariate(
-        name='legality_of_abortion',
-        kind='covariate',
-        gbd_id=cov_id(2),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'absolute_value_of_average_latitude': Covariate(
-        name='absolute_value_of_average_latitude',
-        kind='covariate',
-        gbd_id=cov_id(3),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'antenatal_care_1_visit_coverage_proportion': Covariate(
-        name='antenatal_care_1_visit_coverage_proportion',
-        kind='covariate',
-        gbd_id=cov_id(7),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'antenatal_care_4_visits_coverage_proportion': Covariate(
-        name='antenatal_care_4_visits_coverage_proportion',
-        kind='covariate',
-        gbd_id=cov_id(8),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_specific_fertility_rate': Covariate(
-        name='age_specific_fertility_rate',
-        kind='covariate',
-        gbd_id=cov_id(13),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'tobacco_cigarettes_per_capita': Covariate(
-        name='tobacco_cigarettes_per_capita',
-        kind='covariate',
-        gbd_id=cov_id(14),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'coastal_population_within_10km_proportion': Covariate(
-        name='coastal_population_within_10km_proportion',
-        kind='covariate',
-        gbd_id=cov_id(16),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'contraception_modern_prevalence_proportion_by_age': Covariate(
-        name='contraception_modern_prevalence_proportion_by_age',
-        kind='covariate',
-        gbd_id=cov_id(18),
-        by_age=True,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'contraception_modern_prevalence_proportion': Covariate(
-        name='contraception_modern_prevalence_proportion',
-        kind='covariate',
-        gbd_id=cov_id(19),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'cumulative_cigarettes_10_years': Covariate(
-        name='cumulative_cigarettes_10_years',
-        kind='covariate',
-        gbd_id=cov_id(24),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'cumulative_cigarettes_15_years': Covariate(
-        name='cumulative_cigarettes_15_years',
-        kind='covariate',
-        gbd_id=cov_id(25),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'cumulative_cigarettes_20_years': Covariate(
-        name='cumulative_cigarettes_20_years',
-        kind='covariate',
-        gbd_id=cov_id(26),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'cumulative_cigarettes_5_years': Covariate(
-        name='cumulative_cigarettes_5_years',
-        kind='covariate',
-        gbd_id=cov_id(27),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'diabetes_fasting_plasma_glucose_mmol_l_age_standardized_25_and_up': Covariate(
-        name='diabetes_fasting_plasma_glucose_mmol_l_age_standardized_25_and_up',
-        kind='covariate',
-        gbd_id=cov_id(28),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'diabetes_age_standardized_prevalence_proportion': Covariate(
-        name='diabetes_age_standardized_prevalence_proportion',
-        kind='covariate',
-        gbd_id=cov_id(29),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'dtp3_coverage_covid_free_proportion': Covariate(
-        name='dtp3_coverage_covid_free_proportion',
-        kind='covariate',
-        gbd_id=cov_id(32),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'education_years_per_capita': Covariate(
-        name='education_years_per_capita',
-        kind='covariate',
-        gbd_id=cov_id(33),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'gold_production_binary': Covariate(
-        name='gold_production_binary',
-        kind='covariate',
-        gbd_id=cov_id(42),
-        by_age=False,
-        by_sex=False,
-        dichotomous=True,
-    ),
-    'proportion_of_households_using_iodized_salt_adjusted': Covariate(
-        name='proportion_of_households_using_iodized_salt_adjusted',
-        kind='covariate',
-        gbd_id=cov_id(46),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'hib3_vaccine_coverage_covid_free_proportion': Covariate(
-        name='hib3_vaccine_coverage_covid_free_proportion',
-        kind='covariate',
-        gbd_id=cov_id(47),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'hiv_prevalence_unadjusted_proportion': Covariate(
-        name='hiv_prevalence_unadjusted_proportion',
-        kind='covariate',
-        gbd_id=cov_id(49),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'hospital_beds_per_1000': Covariate(
-        name='hospital_beds_per_1000',
-        kind='covariate',
-        gbd_id=cov_id(50),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'in_facility_delivery_proportion': Covariate(
-        name='in_facility_delivery_proportion',
-        kind='covariate',
-        gbd_id=cov_id(51),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'landlocked_nation_binary': Covariate(
-        name='landlocked_nation_binary',
-        kind='covariate',
-        gbd_id=cov_id(55),
-        by_age=False,
-        by_sex=False,
-        dichotomous=True,
-    ),
-    'average_latitude': Covariate(
-        name='average_latitude',
-        kind='covariate',
-        gbd_id=cov_id(56),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'ldi_income_per_capita': Covariate(
-        name='ldi_income_per_capita',
-        kind='covariate',
-        gbd_id=cov_id(57),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'live_births_thousands': Covariate(
-        name='live_births_thousands',
-        kind='covariate',
-        gbd_id=cov_id(60),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'mean_bmi': Covariate(
-        name='mean_bmi',
-        kind='covariate',
-        gbd_id=cov_id(68),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'low_density_lipoprotein_mmol_l': Covariate(
-        name='low_density_lipoprotein_mmol_l',
-        kind='covariate',
-        gbd_id=cov_id(69),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'systolic_blood_pressure_mmhg': Covariate(
-        name='systolic_blood_pressure_mmhg',
-        kind='covariate',
-        gbd_id=cov_id(70),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'population_weighted_mean_temperature': Covariate(
-        name='population_weighted_mean_temperature',
-        kind='covariate',
-        gbd_id=cov_id(71),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'measles_vaccine_coverage_covid_free_proportion': Covariate(
-        name='measles_vaccine_coverage_covid_free_proportion',
-        kind='covariate',
-        gbd_id=cov_id(75),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'mortality_rate_due_to_death_shocks_in_last_10_years_per_1_person': Covariate(
-        name='mortality_rate_due_to_death_shocks_in_last_10_years_per_1_person',
-        kind='covariate',
-        gbd_id=cov_id(79),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'live_births_35_and_up_proportion': Covariate(
-        name='live_births_35_and_up_proportion',
-        kind='covariate',
-        gbd_id=cov_id(84),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'live_births_40_and_up_proportion': Covariate(
-        name='live_births_40_and_up_proportion',
-        kind='covariate',
-        gbd_id=cov_id(85),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'pigs_per_capita': Covariate(
-        name='pigs_per_capita',
-        kind='covariate',
-        gbd_id=cov_id(100),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'indoor_air_pollution_all_cooking_fuels': Covariate(
-        name='indoor_air_pollution_all_cooking_fuels',
-        kind='covariate',
-        gbd_id=cov_id(105),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'outdoor_air_pollution_pm_2_5': Covariate(
-        name='outdoor_air_pollution_pm_2_5',
-        kind='covariate',
-        gbd_id=cov_id(106),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'latitude_under_15_proportion': Covariate(
-        name='latitude_under_15_proportion',
-        kind='covariate',
-        gbd_id=cov_id(107),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'elevation_over_1500m_proportion': Covariate(
-        name='elevation_over_1500m_proportion',
-        kind='covariate',
-        gbd_id=cov_id(109),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'population_15_to_30_proportion': Covariate(
-        name='population_15_to_30_proportion',
-        kind='covariate',
-        gbd_id=cov_id(110),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'latitude_15_to_30_proportion': Covariate(
-        name='latitude_15_to_30_proportion',
-        kind='covariate',
-        gbd_id=cov_id(111),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'latitude_30_to_45_proportion': Covariate(
-        name='latitude_30_to_45_proportion',
-        kind='covariate',
-        gbd_id=cov_id(112),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'latitude_over_45_proportion': Covariate(
-        name='latitude_over_45_proportion',
-        kind='covariate',
-        gbd_id=cov_id(113),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'elevation_500_to_1500m_proportion': Covariate(
-        name='elevation_500_to_1500m_proportion',
-        kind='covariate',
-        gbd_id=cov_id(114),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'population_density_150_300_ppl_sqkm_proportion': Covariate(
-        name='population_density_150_300_ppl_sqkm_proportion',
-        kind='covariate',
-        gbd_id=cov_id(115),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'population_density_300_500_ppl_sqkm_proportion': Covariate(
-        name='population_density_300_500_ppl_sqkm_proportion',
-        kind='covariate',
-        gbd_id=cov_id(116),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'population_density_500_1000_ppl_sqkm_proportion': Covariate(
-        name='population_density_500_1000_ppl_sqkm_proportion',
-        kind='covariate',
-        gbd_id=cov_id(117),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'population_density_over_1000_ppl_sqkm_proportion': Covariate(
-        name='population_density_over_1000_ppl_sqkm_proportion',
-        kind='covariate',
-        gbd_id=cov_id(118),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'population_density_under_150_ppl_sqkm_proportion': Covariate(
-        name='population_density_under_150_ppl_sqkm_proportion',
-        kind='covariate',
-        gbd_id=cov_id(119),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'population_over_65_proportion': Covariate(
-        name='population_over_65_proportion',
-        kind='covariate',
-        gbd_id=cov_id(120),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'elevation_under_100m_proportion': Covariate(
-        name='elevation_under_100m_proportion',
-        kind='covariate',
-        gbd_id=cov_id(121),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'rainfall_population_weighted_mm_yr': Covariate(
-        name='rainfall_population_weighted_mm_yr',
-        kind='covariate',
-        gbd_id=cov_id(127),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'rainfall_quintiles_4_5': Covariate(
-        name='rainfall_quintiles_4_5',
-        kind='covariate',
-        gbd_id=cov_id(130),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'rainfall_quintile_1_proportion': Covariate(
-        name='rainfall_quintile_1_proportion',
-        kind='covariate',
-        gbd_id=cov_id(131),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'rainfall_quintile_2_proportion': Covariate(
-        name='rainfall_quintile_2_proportion',
-        kind='covariate',
-        gbd_id=cov_id(132),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'rainfall_quintile_5_proportion': Covariate(
-        name='rainfall_quintile_5_proportion',
-        kind='covariate',
-        gbd_id=cov_id(135),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'religion_binary_greater_than_50_percent_muslim': Covariate(
-        name='religion_binary_greater_than_50_percent_muslim',
-        kind='covariate',
-        gbd_id=cov_id(137),
-        by_age=False,
-        by_sex=False,
-        dichotomous=True,
-    ),
-    'sahel_region_of_africa_binary': Covariate(
-        name='sahel_region_of_africa_binary',
-        kind='covariate',
-        gbd_id=cov_id(141),
-        by_age=False,
-        by_sex=False,
-        dichotomous=True,
-    ),
-    'sanitation_proportion_with_access': Covariate(
-        name='sanitation_proportion_with_access',
-        kind='covariate',
-        gbd_id=cov_id(142),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'skilled_birth_attendance_proportion': Covariate(
-        name='skilled_birth_attendance_proportion',
-        kind='covariate',
-        gbd_id=cov_id(143),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'smoking_prevalence': Covariate(
-        name='smoking_prevalence',
-        kind='covariate',
-        gbd_id=cov_id(145),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'smoking_prevalence_reproductive_age_standardized': Covariate(
-        name='smoking_prevalence_reproductive_age_standardized',
-        kind='covariate',
-        gbd_id=cov_id(146),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'ninetieth_percentile_climatic_temperature_in_the_given_country_year': Covariate(
-        name='ninetieth_percentile_climatic_temperature_in_the_given_country_year',
-        kind='covariate',
-        gbd_id=cov_id(147),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'tetanus_toxoid_maternal_protection_at_birth': Covariate(
-        name='tetanus_toxoid_maternal_protection_at_birth',
-        kind='covariate',
-        gbd_id=cov_id(148),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'total_fertility_rate': Covariate(
-        name='total_fertility_rate',
-        kind='covariate',
-        gbd_id=cov_id(149),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'vehicles_2_and_up4_wheels_per_capita': Covariate(
-        name='vehicles_2_and_up4_wheels_per_capita',
-        kind='covariate',
-        gbd_id=cov_id(154),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'vehicles_2_wheels_per_capita': Covariate(
-        name='vehicles_2_wheels_per_capita',
-        kind='covariate',
-        gbd_id=cov_id(155),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'vehicles_4_wheels_per_capita': Covariate(
-        name='vehicles_4_wheels_per_capita',
-        kind='covariate',
-        gbd_id=cov_id(156),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'vehicles_2_wheels_fraction_proportion': Covariate(
-        name='vehicles_2_wheels_fraction_proportion',
-        kind='covariate',
-        gbd_id=cov_id(157),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'mortality_rate_due_to_war_shocks_per_1_person': Covariate(
-        name='mortality_rate_due_to_war_shocks_per_1_person',
-        kind='covariate',
-        gbd_id=cov_id(159),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'improved_water_source_proportion_with_access': Covariate(
-        name='improved_water_source_proportion_with_access',
-        kind='covariate',
-        gbd_id=cov_id(160),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'malaria_lysenko_pfpr_1_holoendemic': Covariate(
-        name='malaria_lysenko_pfpr_1_holoendemic',
-        kind='covariate',
-        gbd_id=cov_id(183),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'malaria_pfpr_rate': Covariate(
-        name='malaria_pfpr_rate',
-        kind='covariate',
-        gbd_id=cov_id(188),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'significant_leishmaniasis_endemicity_binary': Covariate(
-        name='significant_leishmaniasis_endemicity_binary',
-        kind='covariate',
-        gbd_id=cov_id(192),
-        by_age=False,
-        by_sex=False,
-        dichotomous=True,
-    ),
-    'year': Covariate(
-        name='year',
-        kind='covariate',
-        gbd_id=cov_id(195),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'birth_prevalence_of_chd': Covariate(
-        name='birth_prevalence_of_chd',
-        kind='covariate',
-        gbd_id=cov_id(197),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'birth_prevalence_of_congenital_chromosomal_anomalies': Covariate(
-        name='birth_prevalence_of_congenital_chromosomal_anomalies',
-        kind='covariate',
-        gbd_id=cov_id(198),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'hemoglobinopathies_prevalence_x_excess_mortality': Covariate(
-        name='hemoglobinopathies_prevalence_x_excess_mortality',
-        kind='covariate',
-        gbd_id=cov_id(200),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardize_prevalence_of_severe_anemia': Covariate(
-        name='age_standardize_prevalence_of_severe_anemia',
-        kind='covariate',
-        gbd_id=cov_id(205),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'maternal_care_and_immunization': Covariate(
-        name='maternal_care_and_immunization',
-        kind='covariate',
-        gbd_id=cov_id(208),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'neonatal_mortality_rate_per_1000': Covariate(
-        name='neonatal_mortality_rate_per_1000',
-        kind='covariate',
-        gbd_id=cov_id(209),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'pcv3_coverage_covid_free_proportion': Covariate(
-        name='pcv3_coverage_covid_free_proportion',
-        kind='covariate',
-        gbd_id=cov_id(210),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'presence_of_leishmaniasis_binary': Covariate(
-        name='presence_of_leishmaniasis_binary',
-        kind='covariate',
-        gbd_id=cov_id(211),
-        by_age=False,
-        by_sex=False,
-        dichotomous=True,
-    ),
-    'under_5_hiv_death_rate': Covariate(
-        name='under_5_hiv_death_rate',
-        kind='covariate',
-        gbd_id=cov_id(214),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'syphilis_prevalence_proportion': Covariate(
-        name='syphilis_prevalence_proportion',
-        kind='covariate',
-        gbd_id=cov_id(218),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'population_weighted_probability_of_dengue_transmission': Covariate(
-        name='population_weighted_probability_of_dengue_transmission',
-        kind='covariate',
-        gbd_id=cov_id(247),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'dengue_outbreaks_binary': Covariate(
-        name='dengue_outbreaks_binary',
-        kind='covariate',
-        gbd_id=cov_id(248),
-        by_age=False,
-        by_sex=False,
-        dichotomous=True,
-    ),
-    'proportion_of_the_population_living_in_the_classic_monsoon_region': Covariate(
-        name='proportion_of_the_population_living_in_the_classic_monsoon_region',
-        kind='covariate',
-        gbd_id=cov_id(250),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_of_the_population_living_in_the_classic_monsoon_region_low_income_countries': Covariate(
-        name='proportion_of_the_population_living_in_the_classic_monsoon_region_low_income_countries',
-        kind='covariate',
-        gbd_id=cov_id(251),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'hemoglobinopathies_prevalence_x_excess_mortality_excluding_g6pd_deficiency': Covariate(
-        name='hemoglobinopathies_prevalence_x_excess_mortality_excluding_g6pd_deficiency',
-        kind='covariate',
-        gbd_id=cov_id(262),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'alcohol_binge_drinker_proportion_age_standardized': Covariate(
-        name='alcohol_binge_drinker_proportion_age_standardized',
-        kind='covariate',
-        gbd_id=cov_id(273),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'smoking_prevalence_age_standardized_both_sexes': Covariate(
-        name='smoking_prevalence_age_standardized_both_sexes',
-        kind='covariate',
-        gbd_id=cov_id(282),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_of_the_population_living_in_the_indian_ocean_monsoon_belt': Covariate(
-        name='proportion_of_the_population_living_in_the_indian_ocean_monsoon_belt',
-        kind='covariate',
-        gbd_id=cov_id(441),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'vitamin_a_deficiency_prevalence_age_standardized': Covariate(
-        name='vitamin_a_deficiency_prevalence_age_standardized',
-        kind='covariate',
-        gbd_id=cov_id(442),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'prevalence_of_obesity': Covariate(
-        name='prevalence_of_obesity',
-        kind='covariate',
-        gbd_id=cov_id(453),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'prevalence_of_overweight_and_obesity': Covariate(
-        name='prevalence_of_overweight_and_obesity',
-        kind='covariate',
-        gbd_id=cov_id(454),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'prevalence_of_obesity_age_standardized': Covariate(
-        name='prevalence_of_obesity_age_standardized',
-        kind='covariate',
-        gbd_id=cov_id(455),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'maternal_education_years_per_capita': Covariate(
-        name='maternal_education_years_per_capita',
-        kind='covariate',
-        gbd_id=cov_id(463),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'chagasprevpaho': Covariate(
-        name='chagasprevpaho',
-        kind='covariate',
-        gbd_id=cov_id(467),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'enhanced_vegetation_index_long_term_average_2000_2012_mean': Covariate(
-        name='enhanced_vegetation_index_long_term_average_2000_2012_mean',
-        kind='covariate',
-        gbd_id=cov_id(479),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_tb': Covariate(
-        name='log_transformed_sev_scalar_tb',
-        kind='covariate',
-        gbd_id=cov_id(483),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_oth_hiv': Covariate(
-        name='log_transformed_sev_scalar_oth_hiv',
-        kind='covariate',
-        gbd_id=cov_id(485),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_diarrhea': Covariate(
-        name='log_transformed_sev_scalar_diarrhea',
-        kind='covariate',
-        gbd_id=cov_id(486),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_lri': Covariate(
-        name='log_transformed_sev_scalar_lri',
-        kind='covariate',
-        gbd_id=cov_id(491),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_uri': Covariate(
-        name='log_transformed_sev_scalar_uri',
-        kind='covariate',
-        gbd_id=cov_id(492),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_otitis': Covariate(
-        name='log_transformed_sev_scalar_otitis',
-        kind='covariate',
-        gbd_id=cov_id(493),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_meningitis': Covariate(
-        name='log_transformed_sev_scalar_meningitis',
-        kind='covariate',
-        gbd_id=cov_id(494),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_measles': Covariate(
-        name='log_transformed_sev_scalar_measles',
-        kind='covariate',
-        gbd_id=cov_id(503),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_malaria': Covariate(
-        name='log_transformed_sev_scalar_malaria',
-        kind='covariate',
-        gbd_id=cov_id(505),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_mat_hem': Covariate(
-        name='log_transformed_sev_scalar_mat_hem',
-        kind='covariate',
-        gbd_id=cov_id(526),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_mat_sepsis': Covariate(
-        name='log_transformed_sev_scalar_mat_sepsis',
-        kind='covariate',
-        gbd_id=cov_id(527),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_mat_htn': Covariate(
-        name='log_transformed_sev_scalar_mat_htn',
-        kind='covariate',
-        gbd_id=cov_id(528),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_mat_indir': Covariate(
-        name='log_transformed_sev_scalar_mat_indir',
-        kind='covariate',
-        gbd_id=cov_id(531),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_mat_late': Covariate(
-        name='log_transformed_sev_scalar_mat_late',
-        kind='covariate',
-        gbd_id=cov_id(532),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_oth_mat': Covariate(
-        name='log_transformed_sev_scalar_oth_mat',
-        kind='covariate',
-        gbd_id=cov_id(533),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_hep': Covariate(
-        name='log_transformed_sev_scalar_hep',
-        kind='covariate',
-        gbd_id=cov_id(541),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_hep_b': Covariate(
-        name='log_transformed_sev_scalar_hep_b',
-        kind='covariate',
-        gbd_id=cov_id(543),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_hep_c': Covariate(
-        name='log_transformed_sev_scalar_hep_c',
-        kind='covariate',
-        gbd_id=cov_id(544),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_esophag_c': Covariate(
-        name='log_transformed_sev_scalar_esophag_c',
-        kind='covariate',
-        gbd_id=cov_id(548),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_stomach_c': Covariate(
-        name='log_transformed_sev_scalar_stomach_c',
-        kind='covariate',
-        gbd_id=cov_id(549),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_liver_c': Covariate(
-        name='log_transformed_sev_scalar_liver_c',
-        kind='covariate',
-        gbd_id=cov_id(550),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_liver_c_hepb': Covariate(
-        name='log_transformed_sev_scalar_liver_c_hepb',
-        kind='covariate',
-        gbd_id=cov_id(551),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_liver_c_hepc': Covariate(
-        name='log_transformed_sev_scalar_liver_c_hepc',
-        kind='covariate',
-        gbd_id=cov_id(552),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_oth_liver_c': Covariate(
-        name='log_transformed_sev_scalar_oth_liver_c',
-        kind='covariate',
-        gbd_id=cov_id(553),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_larynx_c': Covariate(
-        name='log_transformed_sev_scalar_larynx_c',
-        kind='covariate',
-        gbd_id=cov_id(554),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_lung_c': Covariate(
-        name='log_transformed_sev_scalar_lung_c',
-        kind='covariate',
-        gbd_id=cov_id(555),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_breast_c': Covariate(
-        name='log_transformed_sev_scalar_breast_c',
-        kind='covariate',
-        gbd_id=cov_id(556),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_uterus_c': Covariate(
-        name='log_transformed_sev_scalar_uterus_c',
-        kind='covariate',
-        gbd_id=cov_id(557),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_prostate_c': Covariate(
-        name='log_transformed_sev_scalar_prostate_c',
-        kind='covariate',
-        gbd_id=cov_id(558),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_colorect_c': Covariate(
-        name='log_transformed_sev_scalar_colorect_c',
-        kind='covariate',
-        gbd_id=cov_id(559),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_lip_oral_c': Covariate(
-        name='log_transformed_sev_scalar_lip_oral_c',
-        kind='covariate',
-        gbd_id=cov_id(560),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_nasoph_c': Covariate(
-        name='log_transformed_sev_scalar_nasoph_c',
-        kind='covariate',
-        gbd_id=cov_id(561),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_oth_phar_c': Covariate(
-        name='log_transformed_sev_scalar_oth_phar_c',
-        kind='covariate',
-        gbd_id=cov_id(562),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_gallblad_c': Covariate(
-        name='log_transformed_sev_scalar_gallblad_c',
-        kind='covariate',
-        gbd_id=cov_id(563),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_pancreas_c': Covariate(
-        name='log_transformed_sev_scalar_pancreas_c',
-        kind='covariate',
-        gbd_id=cov_id(564),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_ovary_c': Covariate(
-        name='log_transformed_sev_scalar_ovary_c',
-        kind='covariate',
-        gbd_id=cov_id(567),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_kidney_c': Covariate(
-        name='log_transformed_sev_scalar_kidney_c',
-        kind='covariate',
-        gbd_id=cov_id(569),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_bladder_c': Covariate(
-        name='log_transformed_sev_scalar_bladder_c',
-        kind='covariate',
-        gbd_id=cov_id(570),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_thyroid_c': Covariate(
-        name='log_transformed_sev_scalar_thyroid_c',
-        kind='covariate',
-        gbd_id=cov_id(572),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_mesothel': Covariate(
-        name='log_transformed_sev_scalar_mesothel',
-        kind='covariate',
-        gbd_id=cov_id(573),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_leukemia': Covariate(
-        name='log_transformed_sev_scalar_leukemia',
-        kind='covariate',
-        gbd_id=cov_id(577),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_ihd': Covariate(
-        name='log_transformed_sev_scalar_ihd',
-        kind='covariate',
-        gbd_id=cov_id(580),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_stroke': Covariate(
-        name='log_transformed_sev_scalar_stroke',
-        kind='covariate',
-        gbd_id=cov_id(581),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_isch_stroke': Covariate(
-        name='log_transformed_sev_scalar_isch_stroke',
-        kind='covariate',
-        gbd_id=cov_id(582),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_intrahem_stroke': Covariate(
-        name='log_transformed_sev_scalar_intrahem_stroke',
-        kind='covariate',
-        gbd_id=cov_id(583),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_cmp': Covariate(
-        name='log_transformed_sev_scalar_cmp',
-        kind='covariate',
-        gbd_id=cov_id(584),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_a_fib': Covariate(
-        name='log_transformed_sev_scalar_a_fib',
-        kind='covariate',
-        gbd_id=cov_id(585),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_aort_an': Covariate(
-        name='log_transformed_sev_scalar_aort_an',
-        kind='covariate',
-        gbd_id=cov_id(586),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_pad': Covariate(
-        name='log_transformed_sev_scalar_pad',
-        kind='covariate',
-        gbd_id=cov_id(587),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_copd': Covariate(
-        name='log_transformed_sev_scalar_copd',
-        kind='covariate',
-        gbd_id=cov_id(590),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_asthma': Covariate(
-        name='log_transformed_sev_scalar_asthma',
-        kind='covariate',
-        gbd_id=cov_id(596),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_cirr_hepb': Covariate(
-        name='log_transformed_sev_scalar_cirr_hepb',
-        kind='covariate',
-        gbd_id=cov_id(599),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_cirr_hepc': Covariate(
-        name='log_transformed_sev_scalar_cirr_hepc',
-        kind='covariate',
-        gbd_id=cov_id(600),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_pancreatit': Covariate(
-        name='log_transformed_sev_scalar_pancreatit',
-        kind='covariate',
-        gbd_id=cov_id(610),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_idiopathic_epilepsy': Covariate(
-        name='log_transformed_sev_scalar_idiopathic_epilepsy',
-        kind='covariate',
-        gbd_id=cov_id(614),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_schizo': Covariate(
-        name='log_transformed_sev_scalar_schizo',
-        kind='covariate',
-        gbd_id=cov_id(620),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_depression': Covariate(
-        name='log_transformed_sev_scalar_depression',
-        kind='covariate',
-        gbd_id=cov_id(621),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_mdd': Covariate(
-        name='log_transformed_sev_scalar_mdd',
-        kind='covariate',
-        gbd_id=cov_id(622),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_bipolar': Covariate(
-        name='log_transformed_sev_scalar_bipolar',
-        kind='covariate',
-        gbd_id=cov_id(624),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_anxiety': Covariate(
-        name='log_transformed_sev_scalar_anxiety',
-        kind='covariate',
-        gbd_id=cov_id(625),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_eating': Covariate(
-        name='log_transformed_sev_scalar_eating',
-        kind='covariate',
-        gbd_id=cov_id(626),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_bulimia': Covariate(
-        name='log_transformed_sev_scalar_bulimia',
-        kind='covariate',
-        gbd_id=cov_id(628),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_conduct': Covariate(
-        name='log_transformed_sev_scalar_conduct',
-        kind='covariate',
-        gbd_id=cov_id(633),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_id': Covariate(
-        name='log_transformed_sev_scalar_id',
-        kind='covariate',
-        gbd_id=cov_id(634),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_osteoarth': Covariate(
-        name='log_transformed_sev_scalar_osteoarth',
-        kind='covariate',
-        gbd_id=cov_id(658),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_back_pain': Covariate(
-        name='log_transformed_sev_scalar_back_pain',
-        kind='covariate',
-        gbd_id=cov_id(660),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_gout': Covariate(
-        name='log_transformed_sev_scalar_gout',
-        kind='covariate',
-        gbd_id=cov_id(662),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_sense': Covariate(
-        name='log_transformed_sev_scalar_sense',
-        kind='covariate',
-        gbd_id=cov_id(687),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_cataract': Covariate(
-        name='log_transformed_sev_scalar_cataract',
-        kind='covariate',
-        gbd_id=cov_id(689),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_hearing': Covariate(
-        name='log_transformed_sev_scalar_hearing',
-        kind='covariate',
-        gbd_id=cov_id(692),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_sids': Covariate(
-        name='log_transformed_sev_scalar_sids',
-        kind='covariate',
-        gbd_id=cov_id(701),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_road_inj': Covariate(
-        name='log_transformed_sev_scalar_road_inj',
-        kind='covariate',
-        gbd_id=cov_id(702),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_pedest': Covariate(
-        name='log_transformed_sev_scalar_pedest',
-        kind='covariate',
-        gbd_id=cov_id(703),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_cyclist': Covariate(
-        name='log_transformed_sev_scalar_cyclist',
-        kind='covariate',
-        gbd_id=cov_id(704),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_mot_cyc': Covariate(
-        name='log_transformed_sev_scalar_mot_cyc',
-        kind='covariate',
-        gbd_id=cov_id(705),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_mot_veh': Covariate(
-        name='log_transformed_sev_scalar_mot_veh',
-        kind='covariate',
-        gbd_id=cov_id(706),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_oth_road': Covariate(
-        name='log_transformed_sev_scalar_oth_road',
-        kind='covariate',
-        gbd_id=cov_id(707),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_oth_trans': Covariate(
-        name='log_transformed_sev_scalar_oth_trans',
-        kind='covariate',
-        gbd_id=cov_id(708),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_falls': Covariate(
-        name='log_transformed_sev_scalar_falls',
-        kind='covariate',
-        gbd_id=cov_id(709),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_drown': Covariate(
-        name='log_transformed_sev_scalar_drown',
-        kind='covariate',
-        gbd_id=cov_id(710),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_fire': Covariate(
-        name='log_transformed_sev_scalar_fire',
-        kind='covariate',
-        gbd_id=cov_id(711),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_poison': Covariate(
-        name='log_transformed_sev_scalar_poison',
-        kind='covariate',
-        gbd_id=cov_id(712),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_mech': Covariate(
-        name='log_transformed_sev_scalar_mech',
-        kind='covariate',
-        gbd_id=cov_id(713),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_mech_gun': Covariate(
-        name='log_transformed_sev_scalar_mech_gun',
-        kind='covariate',
-        gbd_id=cov_id(714),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_oth_mech': Covariate(
-        name='log_transformed_sev_scalar_oth_mech',
-        kind='covariate',
-        gbd_id=cov_id(716),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_animal': Covariate(
-        name='log_transformed_sev_scalar_animal',
-        kind='covariate',
-        gbd_id=cov_id(718),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_venom': Covariate(
-        name='log_transformed_sev_scalar_venom',
-        kind='covariate',
-        gbd_id=cov_id(719),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_non_ven': Covariate(
-        name='log_transformed_sev_scalar_non_ven',
-        kind='covariate',
-        gbd_id=cov_id(720),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_f_body': Covariate(
-        name='log_transformed_sev_scalar_f_body',
-        kind='covariate',
-        gbd_id=cov_id(721),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_f_body_asp': Covariate(
-        name='log_transformed_sev_scalar_f_body_asp',
-        kind='covariate',
-        gbd_id=cov_id(722),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_oth_f_body': Covariate(
-        name='log_transformed_sev_scalar_oth_f_body',
-        kind='covariate',
-        gbd_id=cov_id(724),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_oth_unint': Covariate(
-        name='log_transformed_sev_scalar_oth_unint',
-        kind='covariate',
-        gbd_id=cov_id(725),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_self_harm': Covariate(
-        name='log_transformed_sev_scalar_self_harm',
-        kind='covariate',
-        gbd_id=cov_id(726),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_violence': Covariate(
-        name='log_transformed_sev_scalar_violence',
-        kind='covariate',
-        gbd_id=cov_id(727),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_viol_gun': Covariate(
-        name='log_transformed_sev_scalar_viol_gun',
-        kind='covariate',
-        gbd_id=cov_id(728),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_viol_knife': Covariate(
-        name='log_transformed_sev_scalar_viol_knife',
-        kind='covariate',
-        gbd_id=cov_id(729),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_oth_viol': Covariate(
-        name='log_transformed_sev_scalar_oth_viol',
-        kind='covariate',
-        gbd_id=cov_id(730),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_disaster': Covariate(
-        name='log_transformed_sev_scalar_disaster',
-        kind='covariate',
-        gbd_id=cov_id(731),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_mat_hiv': Covariate(
-        name='log_transformed_sev_scalar_mat_hiv',
-        kind='covariate',
-        gbd_id=cov_id(733),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_tb': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_tb',
-        kind='covariate',
-        gbd_id=cov_id(737),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_oth_hiv': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_oth_hiv',
-        kind='covariate',
-        gbd_id=cov_id(739),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_diarrhea': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_diarrhea',
-        kind='covariate',
-        gbd_id=cov_id(740),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_lri': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_lri',
-        kind='covariate',
-        gbd_id=cov_id(744),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_uri': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_uri',
-        kind='covariate',
-        gbd_id=cov_id(745),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_otitis': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_otitis',
-        kind='covariate',
-        gbd_id=cov_id(746),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_measles': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_measles',
-        kind='covariate',
-        gbd_id=cov_id(747),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_mat_hem': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_mat_hem',
-        kind='covariate',
-        gbd_id=cov_id(748),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_mat_sepsis': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_mat_sepsis',
-        kind='covariate',
-        gbd_id=cov_id(749),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_hep': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_hep',
-        kind='covariate',
-        gbd_id=cov_id(751),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_hep_b': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_hep_b',
-        kind='covariate',
-        gbd_id=cov_id(752),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_hep_c': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_hep_c',
-        kind='covariate',
-        gbd_id=cov_id(753),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_esophag_c': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_esophag_c',
-        kind='covariate',
-        gbd_id=cov_id(754),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_stomach_c': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_stomach_c',
-        kind='covariate',
-        gbd_id=cov_id(755),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_liver_c': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_liver_c',
-        kind='covariate',
-        gbd_id=cov_id(756),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_liver_c_hepb': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_liver_c_hepb',
-        kind='covariate',
-        gbd_id=cov_id(757),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_liver_c_hepc': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_liver_c_hepc',
-        kind='covariate',
-        gbd_id=cov_id(758),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_oth_liver_c': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_oth_liver_c',
-        kind='covariate',
-        gbd_id=cov_id(759),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_larynx_c': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_larynx_c',
-        kind='covariate',
-        gbd_id=cov_id(760),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_lung_c': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_lung_c',
-        kind='covariate',
-        gbd_id=cov_id(761),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_breast_c': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_breast_c',
-        kind='covariate',
-        gbd_id=cov_id(762),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_uterus_c': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_uterus_c',
-        kind='covariate',
-        gbd_id=cov_id(763),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_prostate_c': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_prostate_c',
-        kind='covariate',
-        gbd_id=cov_id(764),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_colorect_c': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_colorect_c',
-        kind='covariate',
-        gbd_id=cov_id(765),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_lip_oral_c': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_lip_oral_c',
-        kind='covariate',
-        gbd_id=cov_id(766),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_nasoph_c': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_nasoph_c',
-        kind='covariate',
-        gbd_id=cov_id(767),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_oth_phar_c': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_oth_phar_c',
-        kind='covariate',
-        gbd_id=cov_id(768),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_gallblad_c': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_gallblad_c',
-        kind='covariate',
-        gbd_id=cov_id(769),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_pancreas_c': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_pancreas_c',
-        kind='covariate',
-        gbd_id=cov_id(770),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_ovary_c': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_ovary_c',
-        kind='covariate',
-        gbd_id=cov_id(771),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_kidney_c': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_kidney_c',
-        kind='covariate',
-        gbd_id=cov_id(772),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_bladder_c': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_bladder_c',
-        kind='covariate',
-        gbd_id=cov_id(773),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_thyroid_c': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_thyroid_c',
-        kind='covariate',
-        gbd_id=cov_id(774),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_mesothel': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_mesothel',
-        kind='covariate',
-        gbd_id=cov_id(775),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_leukemia': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_leukemia',
-        kind='covariate',
-        gbd_id=cov_id(776),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_ihd': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_ihd',
-        kind='covariate',
-        gbd_id=cov_id(778),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_stroke': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_stroke',
-        kind='covariate',
-        gbd_id=cov_id(779),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_isch_stroke': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_isch_stroke',
-        kind='covariate',
-        gbd_id=cov_id(780),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_intrahem_stroke': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_intrahem_stroke',
-        kind='covariate',
-        gbd_id=cov_id(781),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_cmp': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_cmp',
-        kind='covariate',
-        gbd_id=cov_id(782),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_a_fib': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_a_fib',
-        kind='covariate',
-        gbd_id=cov_id(783),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_aort_an': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_aort_an',
-        kind='covariate',
-        gbd_id=cov_id(784),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_pad': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_pad',
-        kind='covariate',
-        gbd_id=cov_id(785),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_copd': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_copd',
-        kind='covariate',
-        gbd_id=cov_id(788),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_asthma': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_asthma',
-        kind='covariate',
-        gbd_id=cov_id(794),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_cirr_hepb': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_cirr_hepb',
-        kind='covariate',
-        gbd_id=cov_id(797),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_cirr_hepc': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_cirr_hepc',
-        kind='covariate',
-        gbd_id=cov_id(798),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_pancreatit': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_pancreatit',
-        kind='covariate',
-        gbd_id=cov_id(800),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_idiopathic_epilepsy': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_idiopathic_epilepsy',
-        kind='covariate',
-        gbd_id=cov_id(801),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_depression': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_depression',
-        kind='covariate',
-        gbd_id=cov_id(802),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_mdd': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_mdd',
-        kind='covariate',
-        gbd_id=cov_id(803),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_id': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_id',
-        kind='covariate',
-        gbd_id=cov_id(805),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_osteoarth': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_osteoarth',
-        kind='covariate',
-        gbd_id=cov_id(806),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_back_pain': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_back_pain',
-        kind='covariate',
-        gbd_id=cov_id(808),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_gout': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_gout',
-        kind='covariate',
-        gbd_id=cov_id(809),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_sense': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_sense',
-        kind='covariate',
-        gbd_id=cov_id(810),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_cataract': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_cataract',
-        kind='covariate',
-        gbd_id=cov_id(811),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_hearing': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_hearing',
-        kind='covariate',
-        gbd_id=cov_id(812),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_road_inj': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_road_inj',
-        kind='covariate',
-        gbd_id=cov_id(813),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_pedest': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_pedest',
-        kind='covariate',
-        gbd_id=cov_id(814),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_cyclist': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_cyclist',
-        kind='covariate',
-        gbd_id=cov_id(815),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_mot_cyc': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_mot_cyc',
-        kind='covariate',
-        gbd_id=cov_id(816),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_mot_veh': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_mot_veh',
-        kind='covariate',
-        gbd_id=cov_id(817),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_oth_road': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_oth_road',
-        kind='covariate',
-        gbd_id=cov_id(818),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_oth_trans': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_oth_trans',
-        kind='covariate',
-        gbd_id=cov_id(819),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_falls': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_falls',
-        kind='covariate',
-        gbd_id=cov_id(820),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_drown': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_drown',
-        kind='covariate',
-        gbd_id=cov_id(821),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_fire': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_fire',
-        kind='covariate',
-        gbd_id=cov_id(822),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_poison': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_poison',
-        kind='covariate',
-        gbd_id=cov_id(823),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_mech': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_mech',
-        kind='covariate',
-        gbd_id=cov_id(824),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_mech_gun': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_mech_gun',
-        kind='covariate',
-        gbd_id=cov_id(825),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_oth_mech': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_oth_mech',
-        kind='covariate',
-        gbd_id=cov_id(827),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_animal': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_animal',
-        kind='covariate',
-        gbd_id=cov_id(828),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_venom': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_venom',
-        kind='covariate',
-        gbd_id=cov_id(829),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_non_ven': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_non_ven',
-        kind='covariate',
-        gbd_id=cov_id(830),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_f_body': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_f_body',
-        kind='covariate',
-        gbd_id=cov_id(831),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_f_body_asp': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_f_body_asp',
-        kind='covariate',
-        gbd_id=cov_id(832),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_oth_f_body': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_oth_f_body',
-        kind='covariate',
-        gbd_id=cov_id(834),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_oth_unint': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_oth_unint',
-        kind='covariate',
-        gbd_id=cov_id(835),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_self_harm': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_self_harm',
-        kind='covariate',
-        gbd_id=cov_id(836),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_violence': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_violence',
-        kind='covariate',
-        gbd_id=cov_id(837),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_viol_gun': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_viol_gun',
-        kind='covariate',
-        gbd_id=cov_id(838),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_viol_knife': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_viol_knife',
-        kind='covariate',
-        gbd_id=cov_id(839),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_oth_viol': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_oth_viol',
-        kind='covariate',
-        gbd_id=cov_id(840),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'education_age_standardized': Covariate(
-        name='education_age_standardized',
-        kind='covariate',
-        gbd_id=cov_id(845),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'meningitis_belt_proportion': Covariate(
-        name='meningitis_belt_proportion',
-        kind='covariate',
-        gbd_id=cov_id(848),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'gdp_per_capita_base_2010': Covariate(
-        name='gdp_per_capita_base_2010',
-        kind='covariate',
-        gbd_id=cov_id(851),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'urbanicity_binary': Covariate(
-        name='urbanicity_binary',
-        kind='covariate',
-        gbd_id=cov_id(854),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_unsafe_water': Covariate(
-        name='age_and_sex_specific_sev_for_unsafe_water',
-        kind='covariate',
-        gbd_id=cov_id(863),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_unsafe_sanitation': Covariate(
-        name='age_and_sex_specific_sev_for_unsafe_sanitation',
-        kind='covariate',
-        gbd_id=cov_id(866),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'dengue_reporting_trends_transformed_into_relative_risks_relative_to_that_countrys_mean_incidence': Covariate(
-        name='dengue_reporting_trends_transformed_into_relative_risks_relative_to_that_countrys_mean_incidence',
-        kind='covariate',
-        gbd_id=cov_id(872),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'echinococcosis_endemicity': Covariate(
-        name='echinococcosis_endemicity',
-        kind='covariate',
-        gbd_id=cov_id(875),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'socio_demographic_index': Covariate(
-        name='socio_demographic_index',
-        kind='covariate',
-        gbd_id=cov_id(881),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'japanese_encelphalitis_endemic_area_binary': Covariate(
-        name='japanese_encelphalitis_endemic_area_binary',
-        kind='covariate',
-        gbd_id=cov_id(884),
-        by_age=False,
-        by_sex=False,
-        dichotomous=True,
-    ),
-    'calcium_unadjusted_g': Covariate(
-        name='calcium_unadjusted_g',
-        kind='covariate',
-        gbd_id=cov_id(890),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'fiber_unadjusted_g': Covariate(
-        name='fiber_unadjusted_g',
-        kind='covariate',
-        gbd_id=cov_id(902),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'fruits_unadjusted_g': Covariate(
-        name='fruits_unadjusted_g',
-        kind='covariate',
-        gbd_id=cov_id(914),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'milk_unadjusted_g': Covariate(
-        name='milk_unadjusted_g',
-        kind='covariate',
-        gbd_id=cov_id(920),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'nuts_seeds_unadjusted_g': Covariate(
-        name='nuts_seeds_unadjusted_g',
-        kind='covariate',
-        gbd_id=cov_id(926),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'pufa_adjusted_percent': Covariate(
-        name='pufa_adjusted_percent',
-        kind='covariate',
-        gbd_id=cov_id(929),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'pulses_legumes_unadjusted_g': Covariate(
-        name='pulses_legumes_unadjusted_g',
-        kind='covariate',
-        gbd_id=cov_id(935),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'red_meats_unadjusted_g': Covariate(
-        name='red_meats_unadjusted_g',
-        kind='covariate',
-        gbd_id=cov_id(941),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'sugar_unadjusted_g': Covariate(
-        name='sugar_unadjusted_g',
-        kind='covariate',
-        gbd_id=cov_id(962),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'vegetables_unadjusted_g': Covariate(
-        name='vegetables_unadjusted_g',
-        kind='covariate',
-        gbd_id=cov_id(968),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'energy_unadjusted_kcal': Covariate(
-        name='energy_unadjusted_kcal',
-        kind='covariate',
-        gbd_id=cov_id(977),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'hiv_mortality_females_10_54': Covariate(
-        name='hiv_mortality_females_10_54',
-        kind='covariate',
-        gbd_id=cov_id(986),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'hiv_age_standardized_prevalence': Covariate(
-        name='hiv_age_standardized_prevalence',
-        kind='covariate',
-        gbd_id=cov_id(1016),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_maternal': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_maternal',
-        kind='covariate',
-        gbd_id=cov_id(1019),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_cvd': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_cvd',
-        kind='covariate',
-        gbd_id=cov_id(1022),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_chr_resp': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_chr_resp',
-        kind='covariate',
-        gbd_id=cov_id(1025),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_cirrhosis': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_cirrhosis',
-        kind='covariate',
-        gbd_id=cov_id(1028),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_digestive': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_digestive',
-        kind='covariate',
-        gbd_id=cov_id(1031),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_msk': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_msk',
-        kind='covariate',
-        gbd_id=cov_id(1034),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_trans_inj': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_trans_inj',
-        kind='covariate',
-        gbd_id=cov_id(1037),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_maternal': Covariate(
-        name='log_transformed_sev_scalar_maternal',
-        kind='covariate',
-        gbd_id=cov_id(1040),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_cvd': Covariate(
-        name='log_transformed_sev_scalar_cvd',
-        kind='covariate',
-        gbd_id=cov_id(1043),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_chr_resp': Covariate(
-        name='log_transformed_sev_scalar_chr_resp',
-        kind='covariate',
-        gbd_id=cov_id(1046),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_cirrhosis': Covariate(
-        name='log_transformed_sev_scalar_cirrhosis',
-        kind='covariate',
-        gbd_id=cov_id(1049),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_digestive': Covariate(
-        name='log_transformed_sev_scalar_digestive',
-        kind='covariate',
-        gbd_id=cov_id(1052),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_msk': Covariate(
-        name='log_transformed_sev_scalar_msk',
-        kind='covariate',
-        gbd_id=cov_id(1055),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_trans_inj': Covariate(
-        name='log_transformed_sev_scalar_trans_inj',
-        kind='covariate',
-        gbd_id=cov_id(1058),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'vitamin_a_unadjusted_iu': Covariate(
-        name='vitamin_a_unadjusted_iu',
-        kind='covariate',
-        gbd_id=cov_id(1062),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'vitamin_a_rae_unadjusted_ug': Covariate(
-        name='vitamin_a_rae_unadjusted_ug',
-        kind='covariate',
-        gbd_id=cov_id(1063),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'dietary_zinc_unadjusted_mg': Covariate(
-        name='dietary_zinc_unadjusted_mg',
-        kind='covariate',
-        gbd_id=cov_id(1065),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_of_total_population_covered_by_menafrivac_initiative_meningitis_meningococcal_type_a_vaccine': Covariate(
-        name='proportion_of_total_population_covered_by_menafrivac_initiative_meningitis_meningococcal_type_a_vaccine',
-        kind='covariate',
-        gbd_id=cov_id(1068),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'malaria_incidence_adjusted_for_antimalarial_coverage_and_drug_effectiveness': Covariate(
-        name='malaria_incidence_adjusted_for_antimalarial_coverage_and_drug_effectiveness',
-        kind='covariate',
-        gbd_id=cov_id(1072),
-        by_age=True,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'rotavirus_coverage_covid_free_proportion': Covariate(
-        name='rotavirus_coverage_covid_free_proportion',
-        kind='covariate',
-        gbd_id=cov_id(1075),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_of_cirrhosis_due_to_alcohol': Covariate(
-        name='proportion_of_cirrhosis_due_to_alcohol',
-        kind='covariate',
-        gbd_id=cov_id(1076),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'proportion_of_cirrhosis_due_to_hepatitis_b': Covariate(
-        name='proportion_of_cirrhosis_due_to_hepatitis_b',
-        kind='covariate',
-        gbd_id=cov_id(1077),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'proportion_of_cirrhosis_due_to_hepatitis_c': Covariate(
-        name='proportion_of_cirrhosis_due_to_hepatitis_c',
-        kind='covariate',
-        gbd_id=cov_id(1078),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'proportion_of_cirrhosis_due_to_other_causes': Covariate(
-        name='proportion_of_cirrhosis_due_to_other_causes',
-        kind='covariate',
-        gbd_id=cov_id(1079),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'proportion_of_liver_cancer_due_to_alcohol_age_standardized': Covariate(
-        name='proportion_of_liver_cancer_due_to_alcohol_age_standardized',
-        kind='covariate',
-        gbd_id=cov_id(1080),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'proportion_of_liver_cancer_due_to_hepatitis_b_age_standardized': Covariate(
-        name='proportion_of_liver_cancer_due_to_hepatitis_b_age_standardized',
-        kind='covariate',
-        gbd_id=cov_id(1081),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'proportion_of_liver_cancer_due_to_hepatitis_c_age_standardized': Covariate(
-        name='proportion_of_liver_cancer_due_to_hepatitis_c_age_standardized',
-        kind='covariate',
-        gbd_id=cov_id(1082),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'proportion_of_liver_cancer_due_to_other_causes_age_standardized': Covariate(
-        name='proportion_of_liver_cancer_due_to_other_causes_age_standardized',
-        kind='covariate',
-        gbd_id=cov_id(1083),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'major_depressive_disorder': Covariate(
-        name='major_depressive_disorder',
-        kind='covariate',
-        gbd_id=cov_id(1086),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'proportion_of_population_involved_in_agricultural_activities': Covariate(
-        name='proportion_of_population_involved_in_agricultural_activities',
-        kind='covariate',
-        gbd_id=cov_id(1087),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'health_expenditure_per_capita': Covariate(
-        name='health_expenditure_per_capita',
-        kind='covariate',
-        gbd_id=cov_id(1089),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'fraction_of_oop_health_expenditure': Covariate(
-        name='fraction_of_oop_health_expenditure',
-        kind='covariate',
-        gbd_id=cov_id(1093),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'universal_health_coverage': Covariate(
-        name='universal_health_coverage',
-        kind='covariate',
-        gbd_id=cov_id(1097),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'maternal_alcohol_consumption_during_pregnancy_proportion': Covariate(
-        name='maternal_alcohol_consumption_during_pregnancy_proportion',
-        kind='covariate',
-        gbd_id=cov_id(1098),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'healthcare_access_and_quality_index': Covariate(
-        name='healthcare_access_and_quality_index',
-        kind='covariate',
-        gbd_id=cov_id(1099),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_standardized_proportion_adult_underweight': Covariate(
-        name='age_standardized_proportion_adult_underweight',
-        kind='covariate',
-        gbd_id=cov_id(1100),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'ors_oral_rehydration': Covariate(
-        name='ors_oral_rehydration',
-        kind='covariate',
-        gbd_id=cov_id(1102),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'antibiotics_for_lri': Covariate(
-        name='antibiotics_for_lri',
-        kind='covariate',
-        gbd_id=cov_id(1103),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'live_births_by_sex': Covariate(
-        name='live_births_by_sex',
-        kind='covariate',
-        gbd_id=cov_id(1106),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_melanoma': Covariate(
-        name='age_standardized_melanoma',
-        kind='covariate',
-        gbd_id=cov_id(1107),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'measles_vaccine_coverage_2_doses_covid_free_proportion': Covariate(
-        name='measles_vaccine_coverage_2_doses_covid_free_proportion',
-        kind='covariate',
-        gbd_id=cov_id(1108),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'schisto_cumulative_treatments': Covariate(
-        name='schisto_cumulative_treatments',
-        kind='covariate',
-        gbd_id=cov_id(1110),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'health_worker_density': Covariate(
-        name='health_worker_density',
-        kind='covariate',
-        gbd_id=cov_id(1111),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'iron_energy_unadjusted_mg': Covariate(
-        name='iron_energy_unadjusted_mg',
-        kind='covariate',
-        gbd_id=cov_id(1113),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'malaria_incidence_map': Covariate(
-        name='malaria_incidence_map',
-        kind='covariate',
-        gbd_id=cov_id(1130),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'antimalarial_effective_treatment_map': Covariate(
-        name='antimalarial_effective_treatment_map',
-        kind='covariate',
-        gbd_id=cov_id(1132),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'rubella_vaccine_coverage_covid_free_proportion': Covariate(
-        name='rubella_vaccine_coverage_covid_free_proportion',
-        kind='covariate',
-        gbd_id=cov_id(1147),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'tuberculosis_infection_risk_weighted_prevalence_age_standardized': Covariate(
-        name='tuberculosis_infection_risk_weighted_prevalence_age_standardized',
-        kind='covariate',
-        gbd_id=cov_id(1148),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'ten_year_lag_distributed_energy_per_capita': Covariate(
-        name='ten_year_lag_distributed_energy_per_capita',
-        kind='covariate',
-        gbd_id=cov_id(1150),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'folic_acid_unadjusted_ug': Covariate(
-        name='folic_acid_unadjusted_ug',
-        kind='covariate',
-        gbd_id=cov_id(1153),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'smooth_outphase_of_leaded_gasoline': Covariate(
-        name='smooth_outphase_of_leaded_gasoline',
-        kind='covariate',
-        gbd_id=cov_id(1154),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'no_access_to_handwashing_facility': Covariate(
-        name='no_access_to_handwashing_facility',
-        kind='covariate',
-        gbd_id=cov_id(1155),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'residential_radon': Covariate(
-        name='residential_radon',
-        kind='covariate',
-        gbd_id=cov_id(1156),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'zinc_deficiency': Covariate(
-        name='zinc_deficiency',
-        kind='covariate',
-        gbd_id=cov_id(1159),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'diet_high_in_trans_fatty_acids': Covariate(
-        name='diet_high_in_trans_fatty_acids',
-        kind='covariate',
-        gbd_id=cov_id(1162),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'diet_high_in_sodium': Covariate(
-        name='diet_high_in_sodium',
-        kind='covariate',
-        gbd_id=cov_id(1163),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'tuberculosis_prevalence_age_standardized': Covariate(
-        name='tuberculosis_prevalence_age_standardized',
-        kind='covariate',
-        gbd_id=cov_id(1165),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'low_bone_mineral_density': Covariate(
-        name='low_bone_mineral_density',
-        kind='covariate',
-        gbd_id=cov_id(1166),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_bone_mineral_density_among_population_age_60_and_up_years': Covariate(
-        name='age_standardized_bone_mineral_density_among_population_age_60_and_up_years',
-        kind='covariate',
-        gbd_id=cov_id(1168),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'malnutrition_shock_mortality_rate': Covariate(
-        name='malnutrition_shock_mortality_rate',
-        kind='covariate',
-        gbd_id=cov_id(1170),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'mean_war_mortality_rate_in_the_previous_ten_years': Covariate(
-        name='mean_war_mortality_rate_in_the_previous_ten_years',
-        kind='covariate',
-        gbd_id=cov_id(1171),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_for_both_sexes_combined_tb': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_for_both_sexes_combined_tb',
-        kind='covariate',
-        gbd_id=cov_id(1182),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'secondhand_smoke': Covariate(
-        name='secondhand_smoke',
-        kind='covariate',
-        gbd_id=cov_id(1183),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'asbestos_consumption_metric_tons_per_year_per_capita': Covariate(
-        name='asbestos_consumption_metric_tons_per_year_per_capita',
-        kind='covariate',
-        gbd_id=cov_id(1185),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'zinc_treatment_for_diarrhea': Covariate(
-        name='zinc_treatment_for_diarrhea',
-        kind='covariate',
-        gbd_id=cov_id(1193),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'fortification_standard_including_folic_acid': Covariate(
-        name='fortification_standard_including_folic_acid',
-        kind='covariate',
-        gbd_id=cov_id(1195),
-        by_age=False,
-        by_sex=False,
-        dichotomous=True,
-    ),
-    'demand_for_contraception_satisfied_with_modern_methods': Covariate(
-        name='demand_for_contraception_satisfied_with_modern_methods',
-        kind='covariate',
-        gbd_id=cov_id(1197),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'demand_for_contraception_satisfied_with_modern_methods_by_age': Covariate(
-        name='demand_for_contraception_satisfied_with_modern_methods_by_age',
-        kind='covariate',
-        gbd_id=cov_id(1198),
-        by_age=True,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'polio_3_dose_coverage_covid_free_proportion': Covariate(
-        name='polio_3_dose_coverage_covid_free_proportion',
-        kind='covariate',
-        gbd_id=cov_id(1200),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'hepatitis_b_3_dose_coverage_covid_free_proportion': Covariate(
-        name='hepatitis_b_3_dose_coverage_covid_free_proportion',
-        kind='covariate',
-        gbd_id=cov_id(1201),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'composite_fortification_standard_and_folic_acid_inclusion': Covariate(
-        name='composite_fortification_standard_and_folic_acid_inclusion',
-        kind='covariate',
-        gbd_id=cov_id(1207),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'intravenous_drug_use_proportion_by_age': Covariate(
-        name='intravenous_drug_use_proportion_by_age',
-        kind='covariate',
-        gbd_id=cov_id(1208),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'intravenous_drug_use_age_standardized_proportion': Covariate(
-        name='intravenous_drug_use_age_standardized_proportion',
-        kind='covariate',
-        gbd_id=cov_id(1209),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'alcohol_consumption_age_standardized_in_grams_per_day': Covariate(
-        name='alcohol_consumption_age_standardized_in_grams_per_day',
-        kind='covariate',
-        gbd_id=cov_id(1211),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'alcohol_drinker_proportion_age_standardized': Covariate(
-        name='alcohol_drinker_proportion_age_standardized',
-        kind='covariate',
-        gbd_id=cov_id(1212),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'proportion_of_liver_cancer_due_to_nash_age_standardized': Covariate(
-        name='proportion_of_liver_cancer_due_to_nash_age_standardized',
-        kind='covariate',
-        gbd_id=cov_id(1216),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'proportion_of_cirrhosis_due_to_nash': Covariate(
-        name='proportion_of_cirrhosis_due_to_nash',
-        kind='covariate',
-        gbd_id=cov_id(1217),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'muslim_religion_proportion_of_population': Covariate(
-        name='muslim_religion_proportion_of_population',
-        kind='covariate',
-        gbd_id=cov_id(1218),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'tb_strain_prevalence_weighted_transmission_rr': Covariate(
-        name='tb_strain_prevalence_weighted_transmission_rr',
-        kind='covariate',
-        gbd_id=cov_id(1222),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_child_underweight': Covariate(
-        name='age_and_sex_specific_sev_for_child_underweight',
-        kind='covariate',
-        gbd_id=cov_id(1229),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_child_underweight': Covariate(
-        name='age_standardized_sev_for_child_underweight',
-        kind='covariate',
-        gbd_id=cov_id(1230),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_child_stunting': Covariate(
-        name='age_and_sex_specific_sev_for_child_stunting',
-        kind='covariate',
-        gbd_id=cov_id(1231),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_child_stunting': Covariate(
-        name='age_standardized_sev_for_child_stunting',
-        kind='covariate',
-        gbd_id=cov_id(1232),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_child_wasting': Covariate(
-        name='age_and_sex_specific_sev_for_child_wasting',
-        kind='covariate',
-        gbd_id=cov_id(1233),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_child_wasting': Covariate(
-        name='age_standardized_sev_for_child_wasting',
-        kind='covariate',
-        gbd_id=cov_id(1234),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'fortification_standard_including_iron': Covariate(
-        name='fortification_standard_including_iron',
-        kind='covariate',
-        gbd_id=cov_id(1241),
-        by_age=False,
-        by_sex=False,
-        dichotomous=True,
-    ),
-    'pelvic_inflammatory_disease_age_standardized_prevalence': Covariate(
-        name='pelvic_inflammatory_disease_age_standardized_prevalence',
-        kind='covariate',
-        gbd_id=cov_id(1243),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'nafld_nash_prevalence': Covariate(
-        name='nafld_nash_prevalence',
-        kind='covariate',
-        gbd_id=cov_id(1245),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'hepatitis_b_3_dose_coverage_lagged_5_years_covid_free_proportion': Covariate(
-        name='hepatitis_b_3_dose_coverage_lagged_5_years_covid_free_proportion',
-        kind='covariate',
-        gbd_id=cov_id(1246),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'hepatitis_b_3_dose_coverage_lagged_ten_years_covid_free_proportion': Covariate(
-        name='hepatitis_b_3_dose_coverage_lagged_ten_years_covid_free_proportion',
-        kind='covariate',
-        gbd_id=cov_id(1247),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_alcohol_use': Covariate(
-        name='age_and_sex_specific_sev_for_alcohol_use',
-        kind='covariate',
-        gbd_id=cov_id(1250),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_alcohol_use': Covariate(
-        name='age_standardized_sev_for_alcohol_use',
-        kind='covariate',
-        gbd_id=cov_id(1251),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'underweight_women_age_specific': Covariate(
-        name='underweight_women_age_specific',
-        kind='covariate',
-        gbd_id=cov_id(1253),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_group_i': Covariate(
-        name='log_transformed_sev_scalar_group_i',
-        kind='covariate',
-        gbd_id=cov_id(1831),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_drug_sus_tb': Covariate(
-        name='log_transformed_sev_scalar_drug_sus_tb',
-        kind='covariate',
-        gbd_id=cov_id(1832),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_mdr_tb': Covariate(
-        name='log_transformed_sev_scalar_mdr_tb',
-        kind='covariate',
-        gbd_id=cov_id(1833),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_xdr_tb': Covariate(
-        name='log_transformed_sev_scalar_xdr_tb',
-        kind='covariate',
-        gbd_id=cov_id(1834),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_hiv': Covariate(
-        name='log_transformed_sev_scalar_hiv',
-        kind='covariate',
-        gbd_id=cov_id(1835),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_drug_sus_hiv_tb': Covariate(
-        name='log_transformed_sev_scalar_drug_sus_hiv_tb',
-        kind='covariate',
-        gbd_id=cov_id(1836),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_mdr_hiv_tb': Covariate(
-        name='log_transformed_sev_scalar_mdr_hiv_tb',
-        kind='covariate',
-        gbd_id=cov_id(1837),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_xdr_hiv_tb': Covariate(
-        name='log_transformed_sev_scalar_xdr_hiv_tb',
-        kind='covariate',
-        gbd_id=cov_id(1838),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_encepha': Covariate(
-        name='log_transformed_sev_scalar_encepha',
-        kind='covariate',
-        gbd_id=cov_id(1843),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_nn_enceph': Covariate(
-        name='log_transformed_sev_scalar_nn_enceph',
-        kind='covariate',
-        gbd_id=cov_id(1846),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_nn_sepsis': Covariate(
-        name='log_transformed_sev_scalar_nn_sepsis',
-        kind='covariate',
-        gbd_id=cov_id(1847),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_nn_hemol': Covariate(
-        name='log_transformed_sev_scalar_nn_hemol',
-        kind='covariate',
-        gbd_id=cov_id(1848),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_oth_nn': Covariate(
-        name='log_transformed_sev_scalar_oth_nn',
-        kind='covariate',
-        gbd_id=cov_id(1849),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_ncd': Covariate(
-        name='log_transformed_sev_scalar_ncd',
-        kind='covariate',
-        gbd_id=cov_id(1860),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_lymphoma': Covariate(
-        name='log_transformed_sev_scalar_lymphoma',
-        kind='covariate',
-        gbd_id=cov_id(1863),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_myeloma': Covariate(
-        name='log_transformed_sev_scalar_myeloma',
-        kind='covariate',
-        gbd_id=cov_id(1864),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_all': Covariate(
-        name='log_transformed_sev_scalar_all',
-        kind='covariate',
-        gbd_id=cov_id(1865),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_cll': Covariate(
-        name='log_transformed_sev_scalar_cll',
-        kind='covariate',
-        gbd_id=cov_id(1866),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_aml': Covariate(
-        name='log_transformed_sev_scalar_aml',
-        kind='covariate',
-        gbd_id=cov_id(1867),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_cml': Covariate(
-        name='log_transformed_sev_scalar_cml',
-        kind='covariate',
-        gbd_id=cov_id(1868),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_oth_leukemia': Covariate(
-        name='log_transformed_sev_scalar_oth_leukemia',
-        kind='covariate',
-        gbd_id=cov_id(1869),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_oth_cmp': Covariate(
-        name='log_transformed_sev_scalar_oth_cmp',
-        kind='covariate',
-        gbd_id=cov_id(1872),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_pud': Covariate(
-        name='log_transformed_sev_scalar_pud',
-        kind='covariate',
-        gbd_id=cov_id(1874),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_gall_bile': Covariate(
-        name='log_transformed_sev_scalar_gall_bile',
-        kind='covariate',
-        gbd_id=cov_id(1875),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_alzheimers': Covariate(
-        name='log_transformed_sev_scalar_alzheimers',
-        kind='covariate',
-        gbd_id=cov_id(1876),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_ms': Covariate(
-        name='log_transformed_sev_scalar_ms',
-        kind='covariate',
-        gbd_id=cov_id(1878),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_rheu_arth': Covariate(
-        name='log_transformed_sev_scalar_rheu_arth',
-        kind='covariate',
-        gbd_id=cov_id(1892),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_glaucoma': Covariate(
-        name='log_transformed_sev_scalar_glaucoma',
-        kind='covariate',
-        gbd_id=cov_id(1893),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_macular': Covariate(
-        name='log_transformed_sev_scalar_macular',
-        kind='covariate',
-        gbd_id=cov_id(1894),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_injuries': Covariate(
-        name='log_transformed_sev_scalar_injuries',
-        kind='covariate',
-        gbd_id=cov_id(1895),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_self_firearm': Covariate(
-        name='log_transformed_sev_scalar_self_firearm',
-        kind='covariate',
-        gbd_id=cov_id(1896),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_self_other': Covariate(
-        name='log_transformed_sev_scalar_self_other',
-        kind='covariate',
-        gbd_id=cov_id(1897),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_sex_viol': Covariate(
-        name='log_transformed_sev_scalar_sex_viol',
-        kind='covariate',
-        gbd_id=cov_id(1898),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_group_i': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_group_i',
-        kind='covariate',
-        gbd_id=cov_id(1899),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_drug_sus_tb': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_drug_sus_tb',
-        kind='covariate',
-        gbd_id=cov_id(1900),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_mdr_tb': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_mdr_tb',
-        kind='covariate',
-        gbd_id=cov_id(1901),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_xdr_tb': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_xdr_tb',
-        kind='covariate',
-        gbd_id=cov_id(1902),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_hiv': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_hiv',
-        kind='covariate',
-        gbd_id=cov_id(1903),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_drug_sus_hiv_tb': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_drug_sus_hiv_tb',
-        kind='covariate',
-        gbd_id=cov_id(1904),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_mdr_hiv_tb': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_mdr_hiv_tb',
-        kind='covariate',
-        gbd_id=cov_id(1905),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_xdr_hiv_tb': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_xdr_hiv_tb',
-        kind='covariate',
-        gbd_id=cov_id(1906),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_meningitis': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_meningitis',
-        kind='covariate',
-        gbd_id=cov_id(1907),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_encepha': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_encepha',
-        kind='covariate',
-        gbd_id=cov_id(1912),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_nn_enceph': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_nn_enceph',
-        kind='covariate',
-        gbd_id=cov_id(1917),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_nn_sepsis': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_nn_sepsis',
-        kind='covariate',
-        gbd_id=cov_id(1918),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_nn_hemol': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_nn_hemol',
-        kind='covariate',
-        gbd_id=cov_id(1919),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_oth_nn': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_oth_nn',
-        kind='covariate',
-        gbd_id=cov_id(1920),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_lymphoma': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_lymphoma',
-        kind='covariate',
-        gbd_id=cov_id(1934),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_myeloma': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_myeloma',
-        kind='covariate',
-        gbd_id=cov_id(1935),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_all': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_all',
-        kind='covariate',
-        gbd_id=cov_id(1936),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_cll': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_cll',
-        kind='covariate',
-        gbd_id=cov_id(1937),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_aml': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_aml',
-        kind='covariate',
-        gbd_id=cov_id(1938),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_cml': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_cml',
-        kind='covariate',
-        gbd_id=cov_id(1939),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_oth_leukemia': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_oth_leukemia',
-        kind='covariate',
-        gbd_id=cov_id(1940),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_oth_cmp': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_oth_cmp',
-        kind='covariate',
-        gbd_id=cov_id(1943),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_pud': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_pud',
-        kind='covariate',
-        gbd_id=cov_id(1945),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_gall_bile': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_gall_bile',
-        kind='covariate',
-        gbd_id=cov_id(1946),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_alzheimers': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_alzheimers',
-        kind='covariate',
-        gbd_id=cov_id(1947),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_ms': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_ms',
-        kind='covariate',
-        gbd_id=cov_id(1949),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_rheu_arth': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_rheu_arth',
-        kind='covariate',
-        gbd_id=cov_id(1963),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_glaucoma': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_glaucoma',
-        kind='covariate',
-        gbd_id=cov_id(1964),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_macular': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_macular',
-        kind='covariate',
-        gbd_id=cov_id(1965),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_sids': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_sids',
-        kind='covariate',
-        gbd_id=cov_id(1966),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_injuries': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_injuries',
-        kind='covariate',
-        gbd_id=cov_id(1967),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_self_firearm': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_self_firearm',
-        kind='covariate',
-        gbd_id=cov_id(1968),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_self_other': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_self_other',
-        kind='covariate',
-        gbd_id=cov_id(1969),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_sex_viol': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_sex_viol',
-        kind='covariate',
-        gbd_id=cov_id(1970),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'opioids_per_million_population_per_day_ten_year_lag': Covariate(
-        name='opioids_per_million_population_per_day_ten_year_lag',
-        kind='covariate',
-        gbd_id=cov_id(1972),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'occupation_professionals': Covariate(
-        name='occupation_professionals',
-        kind='covariate',
-        gbd_id=cov_id(1973),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'health_industry_workers': Covariate(
-        name='health_industry_workers',
-        kind='covariate',
-        gbd_id=cov_id(1974),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'education_years_per_capita_aggregated_by_age_15_and_up_and_sex': Covariate(
-        name='education_years_per_capita_aggregated_by_age_15_and_up_and_sex',
-        kind='covariate',
-        gbd_id=cov_id(1975),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'total_physical_activity_met_min_week_age_specific': Covariate(
-        name='total_physical_activity_met_min_week_age_specific',
-        kind='covariate',
-        gbd_id=cov_id(1977),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'total_physical_activity_met_min_week_age_standardized': Covariate(
-        name='total_physical_activity_met_min_week_age_standardized',
-        kind='covariate',
-        gbd_id=cov_id(1978),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'bacille_calmette_guerin_bcg_vaccine_coverage_covid_free_proportion': Covariate(
-        name='bacille_calmette_guerin_bcg_vaccine_coverage_covid_free_proportion',
-        kind='covariate',
-        gbd_id=cov_id(1980),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'hepatitis_b_vaccine_coverage_aged_through_time_covid_free_proportion': Covariate(
-        name='hepatitis_b_vaccine_coverage_aged_through_time_covid_free_proportion',
-        kind='covariate',
-        gbd_id=cov_id(1981),
-        by_age=True,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'adolescent_birth_rates_10_19_years_of_age': Covariate(
-        name='adolescent_birth_rates_10_19_years_of_age',
-        kind='covariate',
-        gbd_id=cov_id(1982),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'log_total_health_expenditure_per_capita': Covariate(
-        name='log_total_health_expenditure_per_capita',
-        kind='covariate',
-        gbd_id=cov_id(1984),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'pigs_raised_in_extensive_agricultural_systems_per_capita': Covariate(
-        name='pigs_raised_in_extensive_agricultural_systems_per_capita',
-        kind='covariate',
-        gbd_id=cov_id(1987),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'physicians_per_capita': Covariate(
-        name='physicians_per_capita',
-        kind='covariate',
-        gbd_id=cov_id(1993),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'nurses_and_midwives_per_capita': Covariate(
-        name='nurses_and_midwives_per_capita',
-        kind='covariate',
-        gbd_id=cov_id(1994),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'pharmacists_per_capita': Covariate(
-        name='pharmacists_per_capita',
-        kind='covariate',
-        gbd_id=cov_id(1995),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'hiv_mortality_rate': Covariate(
-        name='hiv_mortality_rate',
-        kind='covariate',
-        gbd_id=cov_id(1996),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'dentists_per_capita': Covariate(
-        name='dentists_per_capita',
-        kind='covariate',
-        gbd_id=cov_id(1999),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'net_reproduction_rate': Covariate(
-        name='net_reproduction_rate',
-        kind='covariate',
-        gbd_id=cov_id(2001),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'log_transformed_coal_production_per_capita': Covariate(
-        name='log_transformed_coal_production_per_capita',
-        kind='covariate',
-        gbd_id=cov_id(2002),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'systolic_blood_pressure_mmhg_us_r_e': Covariate(
-        name='systolic_blood_pressure_mmhg_us_r_e',
-        kind='covariate',
-        gbd_id=cov_id(2003),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'low_density_lipoprotein_mmol_l_us_r_e': Covariate(
-        name='low_density_lipoprotein_mmol_l_us_r_e',
-        kind='covariate',
-        gbd_id=cov_id(2004),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'mean_bmi_kg_m2_us_r_e': Covariate(
-        name='mean_bmi_kg_m2_us_r_e',
-        kind='covariate',
-        gbd_id=cov_id(2005),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'education_years_per_capita_us_r_e': Covariate(
-        name='education_years_per_capita_us_r_e',
-        kind='covariate',
-        gbd_id=cov_id(2006),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'ldi_income_per_capita_us_r_e': Covariate(
-        name='ldi_income_per_capita_us_r_e',
-        kind='covariate',
-        gbd_id=cov_id(2007),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'fasting_plasma_glucose_us_r_e': Covariate(
-        name='fasting_plasma_glucose_us_r_e',
-        kind='covariate',
-        gbd_id=cov_id(2008),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'total_physical_activity_met_min_week_age_specific_us_r_e': Covariate(
-        name='total_physical_activity_met_min_week_age_specific_us_r_e',
-        kind='covariate',
-        gbd_id=cov_id(2009),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'total_physical_activity_met_min_week_age_standardized_us_r_e': Covariate(
-        name='total_physical_activity_met_min_week_age_standardized_us_r_e',
-        kind='covariate',
-        gbd_id=cov_id(2010),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'alcohol_liters_per_capita_us_r_e': Covariate(
-        name='alcohol_liters_per_capita_us_r_e',
-        kind='covariate',
-        gbd_id=cov_id(2011),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'smoking_prevalence_us_r_e': Covariate(
-        name='smoking_prevalence_us_r_e',
-        kind='covariate',
-        gbd_id=cov_id(2012),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'outdoor_air_pollution_pm_2_5_us_r_e': Covariate(
-        name='outdoor_air_pollution_pm_2_5_us_r_e',
-        kind='covariate',
-        gbd_id=cov_id(2013),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'fruits_unadjusted_g_us_r_e': Covariate(
-        name='fruits_unadjusted_g_us_r_e',
-        kind='covariate',
-        gbd_id=cov_id(2014),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'vegetables_unadjusted_g_us_r_e': Covariate(
-        name='vegetables_unadjusted_g_us_r_e',
-        kind='covariate',
-        gbd_id=cov_id(2015),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'education_relative_inequality_gini': Covariate(
-        name='education_relative_inequality_gini',
-        kind='covariate',
-        gbd_id=cov_id(2020),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'proportion_of_the_population_with_at_least_6_years_of_education_maternal': Covariate(
-        name='proportion_of_the_population_with_at_least_6_years_of_education_maternal',
-        kind='covariate',
-        gbd_id=cov_id(2026),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_of_the_population_with_at_least_12_years_of_education_maternal': Covariate(
-        name='proportion_of_the_population_with_at_least_12_years_of_education_maternal',
-        kind='covariate',
-        gbd_id=cov_id(2027),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'mmr_due_to_maternal_hemorrhage': Covariate(
-        name='mmr_due_to_maternal_hemorrhage',
-        kind='covariate',
-        gbd_id=cov_id(2031),
-        by_age=True,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'mmr_due_to_maternal_hypertensive_disorders': Covariate(
-        name='mmr_due_to_maternal_hypertensive_disorders',
-        kind='covariate',
-        gbd_id=cov_id(2032),
-        by_age=True,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'mmr_due_to_sepsis_and_other_maternal_infections': Covariate(
-        name='mmr_due_to_sepsis_and_other_maternal_infections',
-        kind='covariate',
-        gbd_id=cov_id(2034),
-        by_age=True,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'mmr_due_to_obstructed_labor': Covariate(
-        name='mmr_due_to_obstructed_labor',
-        kind='covariate',
-        gbd_id=cov_id(2035),
-        by_age=True,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_unsafe_water': Covariate(
-        name='age_standardized_sev_for_unsafe_water',
-        kind='covariate',
-        gbd_id=cov_id(2038),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_unsafe_sanitation': Covariate(
-        name='age_standardized_sev_for_unsafe_sanitation',
-        kind='covariate',
-        gbd_id=cov_id(2039),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_handwashing': Covariate(
-        name='age_and_sex_specific_sev_for_handwashing',
-        kind='covariate',
-        gbd_id=cov_id(2040),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_handwashing': Covariate(
-        name='age_standardized_sev_for_handwashing',
-        kind='covariate',
-        gbd_id=cov_id(2041),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_ambient_particulate_matter': Covariate(
-        name='age_and_sex_specific_sev_for_ambient_particulate_matter',
-        kind='covariate',
-        gbd_id=cov_id(2042),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_ambient_particulate_matter': Covariate(
-        name='age_standardized_sev_for_ambient_particulate_matter',
-        kind='covariate',
-        gbd_id=cov_id(2043),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_household_air_pollution': Covariate(
-        name='age_and_sex_specific_sev_for_household_air_pollution',
-        kind='covariate',
-        gbd_id=cov_id(2044),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_household_air_pollution': Covariate(
-        name='age_standardized_sev_for_household_air_pollution',
-        kind='covariate',
-        gbd_id=cov_id(2045),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_ozone': Covariate(
-        name='age_and_sex_specific_sev_for_ozone',
-        kind='covariate',
-        gbd_id=cov_id(2046),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_ozone': Covariate(
-        name='age_standardized_sev_for_ozone',
-        kind='covariate',
-        gbd_id=cov_id(2047),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_radon': Covariate(
-        name='age_and_sex_specific_sev_for_radon',
-        kind='covariate',
-        gbd_id=cov_id(2048),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_radon': Covariate(
-        name='age_standardized_sev_for_radon',
-        kind='covariate',
-        gbd_id=cov_id(2049),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_lead': Covariate(
-        name='age_and_sex_specific_sev_for_lead',
-        kind='covariate',
-        gbd_id=cov_id(2050),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_lead': Covariate(
-        name='age_standardized_sev_for_lead',
-        kind='covariate',
-        gbd_id=cov_id(2051),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_occupational_asbestos': Covariate(
-        name='age_and_sex_specific_sev_for_occupational_asbestos',
-        kind='covariate',
-        gbd_id=cov_id(2052),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_occupational_asbestos': Covariate(
-        name='age_standardized_sev_for_occupational_asbestos',
-        kind='covariate',
-        gbd_id=cov_id(2053),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_occupational_arsenic': Covariate(
-        name='age_and_sex_specific_sev_for_occupational_arsenic',
-        kind='covariate',
-        gbd_id=cov_id(2054),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_occupational_arsenic': Covariate(
-        name='age_standardized_sev_for_occupational_arsenic',
-        kind='covariate',
-        gbd_id=cov_id(2055),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_occupational_benzene': Covariate(
-        name='age_and_sex_specific_sev_for_occupational_benzene',
-        kind='covariate',
-        gbd_id=cov_id(2056),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_occupational_benzene': Covariate(
-        name='age_standardized_sev_for_occupational_benzene',
-        kind='covariate',
-        gbd_id=cov_id(2057),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_occupational_beryllium': Covariate(
-        name='age_and_sex_specific_sev_for_occupational_beryllium',
-        kind='covariate',
-        gbd_id=cov_id(2058),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_occupational_beryllium': Covariate(
-        name='age_standardized_sev_for_occupational_beryllium',
-        kind='covariate',
-        gbd_id=cov_id(2059),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_occupational_cadmium': Covariate(
-        name='age_and_sex_specific_sev_for_occupational_cadmium',
-        kind='covariate',
-        gbd_id=cov_id(2060),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_occupational_cadmium': Covariate(
-        name='age_standardized_sev_for_occupational_cadmium',
-        kind='covariate',
-        gbd_id=cov_id(2061),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_occupational_chromium': Covariate(
-        name='age_and_sex_specific_sev_for_occupational_chromium',
-        kind='covariate',
-        gbd_id=cov_id(2062),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_occupational_chromium': Covariate(
-        name='age_standardized_sev_for_occupational_chromium',
-        kind='covariate',
-        gbd_id=cov_id(2063),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_occupational_diesel': Covariate(
-        name='age_and_sex_specific_sev_for_occupational_diesel',
-        kind='covariate',
-        gbd_id=cov_id(2064),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_occupational_diesel': Covariate(
-        name='age_standardized_sev_for_occupational_diesel',
-        kind='covariate',
-        gbd_id=cov_id(2065),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_occupational_formaldehyde': Covariate(
-        name='age_and_sex_specific_sev_for_occupational_formaldehyde',
-        kind='covariate',
-        gbd_id=cov_id(2066),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_occupational_formaldehyde': Covariate(
-        name='age_standardized_sev_for_occupational_formaldehyde',
-        kind='covariate',
-        gbd_id=cov_id(2067),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_occupational_nickel': Covariate(
-        name='age_and_sex_specific_sev_for_occupational_nickel',
-        kind='covariate',
-        gbd_id=cov_id(2068),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_occupational_nickel': Covariate(
-        name='age_standardized_sev_for_occupational_nickel',
-        kind='covariate',
-        gbd_id=cov_id(2069),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_occupational_pah': Covariate(
-        name='age_and_sex_specific_sev_for_occupational_pah',
-        kind='covariate',
-        gbd_id=cov_id(2070),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_occupational_pah': Covariate(
-        name='age_standardized_sev_for_occupational_pah',
-        kind='covariate',
-        gbd_id=cov_id(2071),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_occupational_silica': Covariate(
-        name='age_and_sex_specific_sev_for_occupational_silica',
-        kind='covariate',
-        gbd_id=cov_id(2072),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_occupational_silica': Covariate(
-        name='age_standardized_sev_for_occupational_silica',
-        kind='covariate',
-        gbd_id=cov_id(2073),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_occupational_sulfuric_acid': Covariate(
-        name='age_and_sex_specific_sev_for_occupational_sulfuric_acid',
-        kind='covariate',
-        gbd_id=cov_id(2074),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_occupational_sulfuric_acid': Covariate(
-        name='age_standardized_sev_for_occupational_sulfuric_acid',
-        kind='covariate',
-        gbd_id=cov_id(2075),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_occupational_trichloroethylene': Covariate(
-        name='age_and_sex_specific_sev_for_occupational_trichloroethylene',
-        kind='covariate',
-        gbd_id=cov_id(2076),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_occupational_trichloroethylene': Covariate(
-        name='age_standardized_sev_for_occupational_trichloroethylene',
-        kind='covariate',
-        gbd_id=cov_id(2077),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_occupational_asthmagens': Covariate(
-        name='age_and_sex_specific_sev_for_occupational_asthmagens',
-        kind='covariate',
-        gbd_id=cov_id(2078),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_occupational_asthmagens': Covariate(
-        name='age_standardized_sev_for_occupational_asthmagens',
-        kind='covariate',
-        gbd_id=cov_id(2079),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_occupational_particulates': Covariate(
-        name='age_and_sex_specific_sev_for_occupational_particulates',
-        kind='covariate',
-        gbd_id=cov_id(2080),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_occupational_particulates': Covariate(
-        name='age_standardized_sev_for_occupational_particulates',
-        kind='covariate',
-        gbd_id=cov_id(2081),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_occupational_noise': Covariate(
-        name='age_and_sex_specific_sev_for_occupational_noise',
-        kind='covariate',
-        gbd_id=cov_id(2082),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_occupational_noise': Covariate(
-        name='age_standardized_sev_for_occupational_noise',
-        kind='covariate',
-        gbd_id=cov_id(2083),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_occupational_ergonomic': Covariate(
-        name='age_and_sex_specific_sev_for_occupational_ergonomic',
-        kind='covariate',
-        gbd_id=cov_id(2086),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_occupational_ergonomic': Covariate(
-        name='age_standardized_sev_for_occupational_ergonomic',
-        kind='covariate',
-        gbd_id=cov_id(2087),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_non_exclusive_breastfeeding': Covariate(
-        name='age_and_sex_specific_sev_for_non_exclusive_breastfeeding',
-        kind='covariate',
-        gbd_id=cov_id(2088),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_non_exclusive_breastfeeding': Covariate(
-        name='age_standardized_sev_for_non_exclusive_breastfeeding',
-        kind='covariate',
-        gbd_id=cov_id(2089),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_discontinued_breastfeeding': Covariate(
-        name='age_and_sex_specific_sev_for_discontinued_breastfeeding',
-        kind='covariate',
-        gbd_id=cov_id(2090),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_discontinued_breastfeeding': Covariate(
-        name='age_standardized_sev_for_discontinued_breastfeeding',
-        kind='covariate',
-        gbd_id=cov_id(2091),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_short_gestation': Covariate(
-        name='age_and_sex_specific_sev_for_short_gestation',
-        kind='covariate',
-        gbd_id=cov_id(2092),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_short_gestation': Covariate(
-        name='age_standardized_sev_for_short_gestation',
-        kind='covariate',
-        gbd_id=cov_id(2093),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_low_birth_weight': Covariate(
-        name='age_and_sex_specific_sev_for_low_birth_weight',
-        kind='covariate',
-        gbd_id=cov_id(2094),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_low_birth_weight': Covariate(
-        name='age_standardized_sev_for_low_birth_weight',
-        kind='covariate',
-        gbd_id=cov_id(2095),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_iron_deficiency': Covariate(
-        name='age_and_sex_specific_sev_for_iron_deficiency',
-        kind='covariate',
-        gbd_id=cov_id(2096),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_iron_deficiency': Covariate(
-        name='age_standardized_sev_for_iron_deficiency',
-        kind='covariate',
-        gbd_id=cov_id(2097),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_vitamin_a_deficiency': Covariate(
-        name='age_and_sex_specific_sev_for_vitamin_a_deficiency',
-        kind='covariate',
-        gbd_id=cov_id(2098),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_vitamin_a_deficiency': Covariate(
-        name='age_standardized_sev_for_vitamin_a_deficiency',
-        kind='covariate',
-        gbd_id=cov_id(2099),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_zinc_deficiency': Covariate(
-        name='age_and_sex_specific_sev_for_zinc_deficiency',
-        kind='covariate',
-        gbd_id=cov_id(2100),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_zinc_deficiency': Covariate(
-        name='age_standardized_sev_for_zinc_deficiency',
-        kind='covariate',
-        gbd_id=cov_id(2101),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_smoking': Covariate(
-        name='age_and_sex_specific_sev_for_smoking',
-        kind='covariate',
-        gbd_id=cov_id(2102),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_smoking': Covariate(
-        name='age_standardized_sev_for_smoking',
-        kind='covariate',
-        gbd_id=cov_id(2103),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_chewing_tobacco': Covariate(
-        name='age_and_sex_specific_sev_for_chewing_tobacco',
-        kind='covariate',
-        gbd_id=cov_id(2104),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_chewing_tobacco': Covariate(
-        name='age_standardized_sev_for_chewing_tobacco',
-        kind='covariate',
-        gbd_id=cov_id(2105),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_secondhand_smoke': Covariate(
-        name='age_and_sex_specific_sev_for_secondhand_smoke',
-        kind='covariate',
-        gbd_id=cov_id(2106),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_secondhand_smoke': Covariate(
-        name='age_standardized_sev_for_secondhand_smoke',
-        kind='covariate',
-        gbd_id=cov_id(2107),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_drug_use': Covariate(
-        name='age_and_sex_specific_sev_for_drug_use',
-        kind='covariate',
-        gbd_id=cov_id(2108),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_drug_use': Covariate(
-        name='age_standardized_sev_for_drug_use',
-        kind='covariate',
-        gbd_id=cov_id(2109),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_low_fruit': Covariate(
-        name='age_and_sex_specific_sev_for_low_fruit',
-        kind='covariate',
-        gbd_id=cov_id(2110),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_low_fruit': Covariate(
-        name='age_standardized_sev_for_low_fruit',
-        kind='covariate',
-        gbd_id=cov_id(2111),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_low_vegetables': Covariate(
-        name='age_and_sex_specific_sev_for_low_vegetables',
-        kind='covariate',
-        gbd_id=cov_id(2112),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_low_vegetables': Covariate(
-        name='age_standardized_sev_for_low_vegetables',
-        kind='covariate',
-        gbd_id=cov_id(2113),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_low_legumes': Covariate(
-        name='age_and_sex_specific_sev_for_low_legumes',
-        kind='covariate',
-        gbd_id=cov_id(2114),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_low_legumes': Covariate(
-        name='age_standardized_sev_for_low_legumes',
-        kind='covariate',
-        gbd_id=cov_id(2115),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_low_whole_grains': Covariate(
-        name='age_and_sex_specific_sev_for_low_whole_grains',
-        kind='covariate',
-        gbd_id=cov_id(2116),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_low_whole_grains': Covariate(
-        name='age_standardized_sev_for_low_whole_grains',
-        kind='covariate',
-        gbd_id=cov_id(2117),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_low_nuts_and_seeds': Covariate(
-        name='age_and_sex_specific_sev_for_low_nuts_and_seeds',
-        kind='covariate',
-        gbd_id=cov_id(2118),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_low_nuts_and_seeds': Covariate(
-        name='age_standardized_sev_for_low_nuts_and_seeds',
-        kind='covariate',
-        gbd_id=cov_id(2119),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_low_milk': Covariate(
-        name='age_and_sex_specific_sev_for_low_milk',
-        kind='covariate',
-        gbd_id=cov_id(2120),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_low_milk': Covariate(
-        name='age_standardized_sev_for_low_milk',
-        kind='covariate',
-        gbd_id=cov_id(2121),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_high_red_meat': Covariate(
-        name='age_and_sex_specific_sev_for_high_red_meat',
-        kind='covariate',
-        gbd_id=cov_id(2122),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_high_red_meat': Covariate(
-        name='age_standardized_sev_for_high_red_meat',
-        kind='covariate',
-        gbd_id=cov_id(2123),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_high_processed_meat': Covariate(
-        name='age_and_sex_specific_sev_for_high_processed_meat',
-        kind='covariate',
-        gbd_id=cov_id(2124),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_high_processed_meat': Covariate(
-        name='age_standardized_sev_for_high_processed_meat',
-        kind='covariate',
-        gbd_id=cov_id(2125),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_high_sweetened_beverages': Covariate(
-        name='age_and_sex_specific_sev_for_high_sweetened_beverages',
-        kind='covariate',
-        gbd_id=cov_id(2126),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_high_sweetened_beverages': Covariate(
-        name='age_standardized_sev_for_high_sweetened_beverages',
-        kind='covariate',
-        gbd_id=cov_id(2127),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_low_fiber': Covariate(
-        name='age_and_sex_specific_sev_for_low_fiber',
-        kind='covariate',
-        gbd_id=cov_id(2128),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_low_fiber': Covariate(
-        name='age_standardized_sev_for_low_fiber',
-        kind='covariate',
-        gbd_id=cov_id(2129),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_low_calcium': Covariate(
-        name='age_and_sex_specific_sev_for_low_calcium',
-        kind='covariate',
-        gbd_id=cov_id(2130),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_low_calcium': Covariate(
-        name='age_standardized_sev_for_low_calcium',
-        kind='covariate',
-        gbd_id=cov_id(2131),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_low_omega_3': Covariate(
-        name='age_and_sex_specific_sev_for_low_omega_3',
-        kind='covariate',
-        gbd_id=cov_id(2132),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_low_omega_3': Covariate(
-        name='age_standardized_sev_for_low_omega_3',
-        kind='covariate',
-        gbd_id=cov_id(2133),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_low_pufa': Covariate(
-        name='age_and_sex_specific_sev_for_low_pufa',
-        kind='covariate',
-        gbd_id=cov_id(2134),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_low_pufa': Covariate(
-        name='age_standardized_sev_for_low_pufa',
-        kind='covariate',
-        gbd_id=cov_id(2135),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_high_trans_fat': Covariate(
-        name='age_and_sex_specific_sev_for_high_trans_fat',
-        kind='covariate',
-        gbd_id=cov_id(2136),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_high_trans_fat': Covariate(
-        name='age_standardized_sev_for_high_trans_fat',
-        kind='covariate',
-        gbd_id=cov_id(2137),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_high_sodium': Covariate(
-        name='age_and_sex_specific_sev_for_high_sodium',
-        kind='covariate',
-        gbd_id=cov_id(2138),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_high_sodium': Covariate(
-        name='age_standardized_sev_for_high_sodium',
-        kind='covariate',
-        gbd_id=cov_id(2139),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_intimate_partner_violence': Covariate(
-        name='age_and_sex_specific_sev_for_intimate_partner_violence',
-        kind='covariate',
-        gbd_id=cov_id(2140),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_intimate_partner_violence': Covariate(
-        name='age_standardized_sev_for_intimate_partner_violence',
-        kind='covariate',
-        gbd_id=cov_id(2141),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_childhood_sexual_abuse': Covariate(
-        name='age_and_sex_specific_sev_for_childhood_sexual_abuse',
-        kind='covariate',
-        gbd_id=cov_id(2142),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_childhood_sexual_abuse': Covariate(
-        name='age_standardized_sev_for_childhood_sexual_abuse',
-        kind='covariate',
-        gbd_id=cov_id(2143),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_bullying': Covariate(
-        name='age_and_sex_specific_sev_for_bullying',
-        kind='covariate',
-        gbd_id=cov_id(2144),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_bullying': Covariate(
-        name='age_standardized_sev_for_bullying',
-        kind='covariate',
-        gbd_id=cov_id(2145),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_low_physical_activity': Covariate(
-        name='age_and_sex_specific_sev_for_low_physical_activity',
-        kind='covariate',
-        gbd_id=cov_id(2148),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_low_physical_activity': Covariate(
-        name='age_standardized_sev_for_low_physical_activity',
-        kind='covariate',
-        gbd_id=cov_id(2149),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_high_fasting_plasma_glucose': Covariate(
-        name='age_and_sex_specific_sev_for_high_fasting_plasma_glucose',
-        kind='covariate',
-        gbd_id=cov_id(2150),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_high_fasting_plasma_glucose': Covariate(
-        name='age_standardized_sev_for_high_fasting_plasma_glucose',
-        kind='covariate',
-        gbd_id=cov_id(2151),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_high_ldl': Covariate(
-        name='age_and_sex_specific_sev_for_high_ldl',
-        kind='covariate',
-        gbd_id=cov_id(2152),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_high_ldl': Covariate(
-        name='age_standardized_sev_for_high_ldl',
-        kind='covariate',
-        gbd_id=cov_id(2153),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_high_blood_pressure': Covariate(
-        name='age_and_sex_specific_sev_for_high_blood_pressure',
-        kind='covariate',
-        gbd_id=cov_id(2154),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_high_blood_pressure': Covariate(
-        name='age_standardized_sev_for_high_blood_pressure',
-        kind='covariate',
-        gbd_id=cov_id(2155),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_high_body_mass_index': Covariate(
-        name='age_and_sex_specific_sev_for_high_body_mass_index',
-        kind='covariate',
-        gbd_id=cov_id(2156),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_high_body_mass_index': Covariate(
-        name='age_standardized_sev_for_high_body_mass_index',
-        kind='covariate',
-        gbd_id=cov_id(2157),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_low_bone_mineral_density': Covariate(
-        name='age_and_sex_specific_sev_for_low_bone_mineral_density',
-        kind='covariate',
-        gbd_id=cov_id(2158),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_low_bone_mineral_density': Covariate(
-        name='age_standardized_sev_for_low_bone_mineral_density',
-        kind='covariate',
-        gbd_id=cov_id(2159),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_impaired_kidney_function': Covariate(
-        name='age_and_sex_specific_sev_for_impaired_kidney_function',
-        kind='covariate',
-        gbd_id=cov_id(2160),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_impaired_kidney_function': Covariate(
-        name='age_standardized_sev_for_impaired_kidney_function',
-        kind='covariate',
-        gbd_id=cov_id(2161),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_obst_labor': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_obst_labor',
-        kind='covariate',
-        gbd_id=cov_id(2179),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_obst_labor': Covariate(
-        name='log_transformed_sev_scalar_obst_labor',
-        kind='covariate',
-        gbd_id=cov_id(2180),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_ectopic_preg': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_ectopic_preg',
-        kind='covariate',
-        gbd_id=cov_id(2181),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_ectopic_preg': Covariate(
-        name='log_transformed_sev_scalar_ectopic_preg',
-        kind='covariate',
-        gbd_id=cov_id(2182),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_neonatal': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_neonatal',
-        kind='covariate',
-        gbd_id=cov_id(2187),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_neonatal': Covariate(
-        name='log_transformed_sev_scalar_neonatal',
-        kind='covariate',
-        gbd_id=cov_id(2188),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_liver_c_nash': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_liver_c_nash',
-        kind='covariate',
-        gbd_id=cov_id(2190),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_liver_c_nash': Covariate(
-        name='log_transformed_sev_scalar_liver_c_nash',
-        kind='covariate',
-        gbd_id=cov_id(2191),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_sub_hem': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_sub_hem',
-        kind='covariate',
-        gbd_id=cov_id(2192),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_sub_hem': Covariate(
-        name='log_transformed_sev_scalar_sub_hem',
-        kind='covariate',
-        gbd_id=cov_id(2193),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_upper_digest': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_upper_digest',
-        kind='covariate',
-        gbd_id=cov_id(2198),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_upper_digest': Covariate(
-        name='log_transformed_sev_scalar_upper_digest',
-        kind='covariate',
-        gbd_id=cov_id(2199),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_blindness': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_blindness',
-        kind='covariate',
-        gbd_id=cov_id(2207),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_blindness': Covariate(
-        name='log_transformed_sev_scalar_blindness',
-        kind='covariate',
-        gbd_id=cov_id(2208),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_inj_pois_co': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_inj_pois_co',
-        kind='covariate',
-        gbd_id=cov_id(2211),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_inj_pois_co': Covariate(
-        name='log_transformed_sev_scalar_inj_pois_co',
-        kind='covariate',
-        gbd_id=cov_id(2212),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_inj_pois_oth': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_inj_pois_oth',
-        kind='covariate',
-        gbd_id=cov_id(2213),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_inj_pois_oth': Covariate(
-        name='log_transformed_sev_scalar_inj_pois_oth',
-        kind='covariate',
-        gbd_id=cov_id(2214),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_heat__and_up_cold': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_heat__and_up_cold',
-        kind='covariate',
-        gbd_id=cov_id(2215),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_heat__and_up_cold': Covariate(
-        name='log_transformed_sev_scalar_heat__and_up_cold',
-        kind='covariate',
-        gbd_id=cov_id(2216),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_mat_htn': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_mat_htn',
-        kind='covariate',
-        gbd_id=cov_id(2235),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_mat_indir': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_mat_indir',
-        kind='covariate',
-        gbd_id=cov_id(2239),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_mat_late': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_mat_late',
-        kind='covariate',
-        gbd_id=cov_id(2240),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_oth_mat': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_oth_mat',
-        kind='covariate',
-        gbd_id=cov_id(2241),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_ncd': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_ncd',
-        kind='covariate',
-        gbd_id=cov_id(2242),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_anxiety': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_anxiety',
-        kind='covariate',
-        gbd_id=cov_id(2244),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_disaster': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_disaster',
-        kind='covariate',
-        gbd_id=cov_id(2247),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_mat_hiv': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_mat_hiv',
-        kind='covariate',
-        gbd_id=cov_id(2248),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_mat_abort': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_mat_abort',
-        kind='covariate',
-        gbd_id=cov_id(2249),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_mat_abort': Covariate(
-        name='log_transformed_sev_scalar_mat_abort',
-        kind='covariate',
-        gbd_id=cov_id(2250),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'proportion_of_the_population_with_0_years_of_education_maternal': Covariate(
-        name='proportion_of_the_population_with_0_years_of_education_maternal',
-        kind='covariate',
-        gbd_id=cov_id(2265),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'stillbirth_28_weeks_to_live_birth_ratio': Covariate(
-        name='stillbirth_28_weeks_to_live_birth_ratio',
-        kind='covariate',
-        gbd_id=cov_id(2267),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_pnn_pop_aged_1_5_mo': Covariate(
-        name='proportion_pnn_pop_aged_1_5_mo',
-        kind='covariate',
-        gbd_id=cov_id(2268),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'proportion_1_4_pop_aged_1_year': Covariate(
-        name='proportion_1_4_pop_aged_1_year',
-        kind='covariate',
-        gbd_id=cov_id(2269),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'gallup_negative_experience_index': Covariate(
-        name='gallup_negative_experience_index',
-        kind='covariate',
-        gbd_id=cov_id(2270),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_of_the_population_working_in_mining_with_20_year_lag': Covariate(
-        name='proportion_of_the_population_working_in_mining_with_20_year_lag',
-        kind='covariate',
-        gbd_id=cov_id(2276),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'gold_production_kg_per_capita_smoothed_with_20_year_lag': Covariate(
-        name='gold_production_kg_per_capita_smoothed_with_20_year_lag',
-        kind='covariate',
-        gbd_id=cov_id(2277),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'diabetes_fasting_plasma_glucose_mmol_l_by_age': Covariate(
-        name='diabetes_fasting_plasma_glucose_mmol_l_by_age',
-        kind='covariate',
-        gbd_id=cov_id(2279),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'hepatitis_a_seroprevalence_anti_hav_age_standardized': Covariate(
-        name='hepatitis_a_seroprevalence_anti_hav_age_standardized',
-        kind='covariate',
-        gbd_id=cov_id(2282),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'hepatitis_b_seroprevalence_hbsag_age_standardized': Covariate(
-        name='hepatitis_b_seroprevalence_hbsag_age_standardized',
-        kind='covariate',
-        gbd_id=cov_id(2283),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'hepatitis_c_seroprevalence_anti_hcv_age_standardized': Covariate(
-        name='hepatitis_c_seroprevalence_anti_hcv_age_standardized',
-        kind='covariate',
-        gbd_id=cov_id(2284),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'hepatitis_e_seroprevalence_anti_hev_age_standardized': Covariate(
-        name='hepatitis_e_seroprevalence_anti_hev_age_standardized',
-        kind='covariate',
-        gbd_id=cov_id(2285),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'bac_law_general_population_quartile': Covariate(
-        name='bac_law_general_population_quartile',
-        kind='covariate',
-        gbd_id=cov_id(2287),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'bac_law_youth_drivers_quartile': Covariate(
-        name='bac_law_youth_drivers_quartile',
-        kind='covariate',
-        gbd_id=cov_id(2288),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'bac_law_professional_drivers_quartile': Covariate(
-        name='bac_law_professional_drivers_quartile',
-        kind='covariate',
-        gbd_id=cov_id(2289),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'speed_limit_law_urban_quartile': Covariate(
-        name='speed_limit_law_urban_quartile',
-        kind='covariate',
-        gbd_id=cov_id(2290),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'speed_limit_law_rural_quartile': Covariate(
-        name='speed_limit_law_rural_quartile',
-        kind='covariate',
-        gbd_id=cov_id(2291),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'liters_of_alcohol_consumed_per_capita': Covariate(
-        name='liters_of_alcohol_consumed_per_capita',
-        kind='covariate',
-        gbd_id=cov_id(2297),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'live_births_by_childs_sex_and_maternal_age': Covariate(
-        name='live_births_by_childs_sex_and_maternal_age',
-        kind='covariate',
-        gbd_id=cov_id(2298),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'population_15_to_30_males_proportion': Covariate(
-        name='population_15_to_30_males_proportion',
-        kind='covariate',
-        gbd_id=cov_id(2300),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'max_trachoma_population_at_risk': Covariate(
-        name='max_trachoma_population_at_risk',
-        kind='covariate',
-        gbd_id=cov_id(2302),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'schistosomiasis_prevalence_results': Covariate(
-        name='schistosomiasis_prevalence_results',
-        kind='covariate',
-        gbd_id=cov_id(2304),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'who_sth_mda_coverage': Covariate(
-        name='who_sth_mda_coverage',
-        kind='covariate',
-        gbd_id=cov_id(2305),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'bcg_lagged_five_year_coverage_covid_free_proportion': Covariate(
-        name='bcg_lagged_five_year_coverage_covid_free_proportion',
-        kind='covariate',
-        gbd_id=cov_id(2307),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'dtp3_lagged_five_year_coverage_covid_free_proportion': Covariate(
-        name='dtp3_lagged_five_year_coverage_covid_free_proportion',
-        kind='covariate',
-        gbd_id=cov_id(2308),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'mcv1_lagged_five_year_coverage_covid_free_proportion': Covariate(
-        name='mcv1_lagged_five_year_coverage_covid_free_proportion',
-        kind='covariate',
-        gbd_id=cov_id(2309),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'mcv2_lagged_five_year_coverage_covid_free_proportion': Covariate(
-        name='mcv2_lagged_five_year_coverage_covid_free_proportion',
-        kind='covariate',
-        gbd_id=cov_id(2310),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'polio3_lagged_five_year_coverage_covid_free_proportion': Covariate(
-        name='polio3_lagged_five_year_coverage_covid_free_proportion',
-        kind='covariate',
-        gbd_id=cov_id(2311),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'rcv1_lagged_five_year_coverage_covid_free_proportion': Covariate(
-        name='rcv1_lagged_five_year_coverage_covid_free_proportion',
-        kind='covariate',
-        gbd_id=cov_id(2312),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'hib3_lagged_five_year_coverage_covid_free_proportion': Covariate(
-        name='hib3_lagged_five_year_coverage_covid_free_proportion',
-        kind='covariate',
-        gbd_id=cov_id(2313),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'pcv3_lagged_five_year_coverage_covid_free_proportion': Covariate(
-        name='pcv3_lagged_five_year_coverage_covid_free_proportion',
-        kind='covariate',
-        gbd_id=cov_id(2314),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'rotac_lagged_five_year_coverage_covid_free_proportion': Covariate(
-        name='rotac_lagged_five_year_coverage_covid_free_proportion',
-        kind='covariate',
-        gbd_id=cov_id(2315),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'hepb3_lagged_five_year_coverage_covid_free_proportion': Covariate(
-        name='hepb3_lagged_five_year_coverage_covid_free_proportion',
-        kind='covariate',
-        gbd_id=cov_id(2316),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_of_population_vulnerable_to_venomous_snakebites': Covariate(
-        name='proportion_of_population_vulnerable_to_venomous_snakebites',
-        kind='covariate',
-        gbd_id=cov_id(2318),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'mean_number_of_venomous_snake_species': Covariate(
-        name='mean_number_of_venomous_snake_species',
-        kind='covariate',
-        gbd_id=cov_id(2321),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'tfr_u20_us_r_e': Covariate(
-        name='tfr_u20_us_r_e',
-        kind='covariate',
-        gbd_id=cov_id(2323),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'dengue_all_age_csmr': Covariate(
-        name='dengue_all_age_csmr',
-        kind='covariate',
-        gbd_id=cov_id(2324),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'education_years_per_capita_aggregated_by_age_15_and_up_and_sex_us_r_e': Covariate(
-        name='education_years_per_capita_aggregated_by_age_15_and_up_and_sex_us_r_e',
-        kind='covariate',
-        gbd_id=cov_id(2325),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_high_temperature': Covariate(
-        name='age_and_sex_specific_sev_for_high_temperature',
-        kind='covariate',
-        gbd_id=cov_id(2326),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_low_temperature': Covariate(
-        name='age_and_sex_specific_sev_for_low_temperature',
-        kind='covariate',
-        gbd_id=cov_id(2327),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_high_temperature': Covariate(
-        name='age_standardized_sev_for_high_temperature',
-        kind='covariate',
-        gbd_id=cov_id(2328),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_low_temperature': Covariate(
-        name='age_standardized_sev_for_low_temperature',
-        kind='covariate',
-        gbd_id=cov_id(2329),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'inpatient_utilization_envelope': Covariate(
-        name='inpatient_utilization_envelope',
-        kind='covariate',
-        gbd_id=cov_id(2331),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'chronic_hepatitis_c_age_standardized': Covariate(
-        name='chronic_hepatitis_c_age_standardized',
-        kind='covariate',
-        gbd_id=cov_id(2336),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'vaccine_adjusted_hbsag_serporevalence_age_standardized': Covariate(
-        name='vaccine_adjusted_hbsag_serporevalence_age_standardized',
-        kind='covariate',
-        gbd_id=cov_id(2339),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'hib3_transformed_population_level_coverage_including_indirect_effects_proportion': Covariate(
-        name='hib3_transformed_population_level_coverage_including_indirect_effects_proportion',
-        kind='covariate',
-        gbd_id=cov_id(2342),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_standardized_daily_smoking_prevalence_both_sexes': Covariate(
-        name='age_standardized_daily_smoking_prevalence_both_sexes',
-        kind='covariate',
-        gbd_id=cov_id(2343),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_oth_cirr': Covariate(
-        name='log_transformed_sev_scalar_oth_cirr',
-        kind='covariate',
-        gbd_id=cov_id(2345),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_oth_cirr': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_oth_cirr',
-        kind='covariate',
-        gbd_id=cov_id(2346),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_burkitt': Covariate(
-        name='log_transformed_sev_scalar_burkitt',
-        kind='covariate',
-        gbd_id=cov_id(2347),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_burkitt': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_burkitt',
-        kind='covariate',
-        gbd_id=cov_id(2348),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_oth_lymphoma': Covariate(
-        name='log_transformed_sev_scalar_oth_lymphoma',
-        kind='covariate',
-        gbd_id=cov_id(2349),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_oth_lymphoma': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_oth_lymphoma',
-        kind='covariate',
-        gbd_id=cov_id(2350),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_osteoarth_hip': Covariate(
-        name='log_transformed_sev_scalar_osteoarth_hip',
-        kind='covariate',
-        gbd_id=cov_id(2351),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_osteoarth_hip': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_osteoarth_hip',
-        kind='covariate',
-        gbd_id=cov_id(2352),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_osteoarth_knee': Covariate(
-        name='log_transformed_sev_scalar_osteoarth_knee',
-        kind='covariate',
-        gbd_id=cov_id(2353),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_osteoarth_knee': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_osteoarth_knee',
-        kind='covariate',
-        gbd_id=cov_id(2354),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'sheep_density': Covariate(
-        name='sheep_density',
-        kind='covariate',
-        gbd_id=cov_id(2358),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'total_fertility_rate_under_25': Covariate(
-        name='total_fertility_rate_under_25',
-        kind='covariate',
-        gbd_id=cov_id(2363),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'caesarean_section': Covariate(
-        name='caesarean_section',
-        kind='covariate',
-        gbd_id=cov_id(2381),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'full_maternal_care': Covariate(
-        name='full_maternal_care',
-        kind='covariate',
-        gbd_id=cov_id(2382),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_in_correctional_facility': Covariate(
-        name='proportion_in_correctional_facility',
-        kind='covariate',
-        gbd_id=cov_id(2384),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_in_correctional_facility_by_race_ethnicity': Covariate(
-        name='proportion_in_correctional_facility_by_race_ethnicity',
-        kind='covariate',
-        gbd_id=cov_id(2385),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'alcohol_availability_per_capita': Covariate(
-        name='alcohol_availability_per_capita',
-        kind='covariate',
-        gbd_id=cov_id(2386),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'alcohol_availability_per_capita_smoothed': Covariate(
-        name='alcohol_availability_per_capita_smoothed',
-        kind='covariate',
-        gbd_id=cov_id(2387),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'alcohol_places_per_capita': Covariate(
-        name='alcohol_places_per_capita',
-        kind='covariate',
-        gbd_id=cov_id(2388),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'alcohol_stores_per_capita': Covariate(
-        name='alcohol_stores_per_capita',
-        kind='covariate',
-        gbd_id=cov_id(2389),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'tobacco_stores_per_capita': Covariate(
-        name='tobacco_stores_per_capita',
-        kind='covariate',
-        gbd_id=cov_id(2390),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'tobacco_stores_per_capita_smoothed': Covariate(
-        name='tobacco_stores_per_capita_smoothed',
-        kind='covariate',
-        gbd_id=cov_id(2391),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_with_ba_and_up': Covariate(
-        name='proportion_with_ba_and_up',
-        kind='covariate',
-        gbd_id=cov_id(2392),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_with_ba_and_up_by_race_ethnicity': Covariate(
-        name='proportion_with_ba_and_up_by_race_ethnicity',
-        kind='covariate',
-        gbd_id=cov_id(2393),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_with_hs_and_up': Covariate(
-        name='proportion_with_hs_and_up',
-        kind='covariate',
-        gbd_id=cov_id(2394),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_with_hs_and_up_by_race_ethnicity': Covariate(
-        name='proportion_with_hs_and_up_by_race_ethnicity',
-        kind='covariate',
-        gbd_id=cov_id(2395),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_foreign_born': Covariate(
-        name='proportion_foreign_born',
-        kind='covariate',
-        gbd_id=cov_id(2396),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_foreign_born_by_education': Covariate(
-        name='proportion_foreign_born_by_education',
-        kind='covariate',
-        gbd_id=cov_id(2397),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_foreign_born_by_race_ethnicity': Covariate(
-        name='proportion_foreign_born_by_race_ethnicity',
-        kind='covariate',
-        gbd_id=cov_id(2398),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_hispanic': Covariate(
-        name='proportion_hispanic',
-        kind='covariate',
-        gbd_id=cov_id(2399),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'personal_income_per_capita': Covariate(
-        name='personal_income_per_capita',
-        kind='covariate',
-        gbd_id=cov_id(2400),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'average_income_per_capita_by_race_ethnicity': Covariate(
-        name='average_income_per_capita_by_race_ethnicity',
-        kind='covariate',
-        gbd_id=cov_id(2401),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'mds_per_capita': Covariate(
-        name='mds_per_capita',
-        kind='covariate',
-        gbd_id=cov_id(2402),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'mds_per_capita_state': Covariate(
-        name='mds_per_capita_state',
-        kind='covariate',
-        gbd_id=cov_id(2403),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'median_household_income': Covariate(
-        name='median_household_income',
-        kind='covariate',
-        gbd_id=cov_id(2404),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'median_property_value': Covariate(
-        name='median_property_value',
-        kind='covariate',
-        gbd_id=cov_id(2405),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'log_of_population_density': Covariate(
-        name='log_of_population_density',
-        kind='covariate',
-        gbd_id=cov_id(2406),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'population_density': Covariate(
-        name='population_density',
-        kind='covariate',
-        gbd_id=cov_id(2407),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_in_college': Covariate(
-        name='proportion_in_college',
-        kind='covariate',
-        gbd_id=cov_id(2408),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_in_poverty_by_education': Covariate(
-        name='proportion_in_poverty_by_education',
-        kind='covariate',
-        gbd_id=cov_id(2410),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_in_poverty_by_race_ethnicity': Covariate(
-        name='proportion_in_poverty_by_race_ethnicity',
-        kind='covariate',
-        gbd_id=cov_id(2411),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_land_in_reservations': Covariate(
-        name='proportion_land_in_reservations',
-        kind='covariate',
-        gbd_id=cov_id(2412),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_land_in_federal_reservations': Covariate(
-        name='proportion_land_in_federal_reservations',
-        kind='covariate',
-        gbd_id=cov_id(2413),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_land_in_state_reservations': Covariate(
-        name='proportion_land_in_state_reservations',
-        kind='covariate',
-        gbd_id=cov_id(2414),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_black': Covariate(
-        name='proportion_black',
-        kind='covariate',
-        gbd_id=cov_id(2415),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_other_race': Covariate(
-        name='proportion_other_race',
-        kind='covariate',
-        gbd_id=cov_id(2416),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_white': Covariate(
-        name='proportion_white',
-        kind='covariate',
-        gbd_id=cov_id(2417),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_non_hispanic_aian': Covariate(
-        name='proportion_non_hispanic_aian',
-        kind='covariate',
-        gbd_id=cov_id(2418),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_non_hispanic_api': Covariate(
-        name='proportion_non_hispanic_api',
-        kind='covariate',
-        gbd_id=cov_id(2419),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_non_hispanic_black': Covariate(
-        name='proportion_non_hispanic_black',
-        kind='covariate',
-        gbd_id=cov_id(2420),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_non_hispanic_white': Covariate(
-        name='proportion_non_hispanic_white',
-        kind='covariate',
-        gbd_id=cov_id(2421),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_rural': Covariate(
-        name='proportion_rural',
-        kind='covariate',
-        gbd_id=cov_id(2422),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_unemployed': Covariate(
-        name='proportion_unemployed',
-        kind='covariate',
-        gbd_id=cov_id(2423),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_unemployed_by_education': Covariate(
-        name='proportion_unemployed_by_education',
-        kind='covariate',
-        gbd_id=cov_id(2424),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_with_health_insurance_by_education': Covariate(
-        name='proportion_with_health_insurance_by_education',
-        kind='covariate',
-        gbd_id=cov_id(2425),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'population_by_age_and_sex': Covariate(
-        name='population_by_age_and_sex',
-        kind='covariate',
-        gbd_id=cov_id(2426),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'population_by_education': Covariate(
-        name='population_by_education',
-        kind='covariate',
-        gbd_id=cov_id(2427),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'population_by_race_ethnicity_1977_omb_standard': Covariate(
-        name='population_by_race_ethnicity_1977_omb_standard',
-        kind='covariate',
-        gbd_id=cov_id(2428),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'population_by_race_ethnicity_1997_omb_standard': Covariate(
-        name='population_by_race_ethnicity_1997_omb_standard',
-        kind='covariate',
-        gbd_id=cov_id(2429),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'bacille_calmette_guerin_bcg_vaccine_coverage_covid_inclusive_proportion': Covariate(
-        name='bacille_calmette_guerin_bcg_vaccine_coverage_covid_inclusive_proportion',
-        kind='covariate',
-        gbd_id=cov_id(2430),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'dtp3_coverage_covid_inclusive_proportion': Covariate(
-        name='dtp3_coverage_covid_inclusive_proportion',
-        kind='covariate',
-        gbd_id=cov_id(2431),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'measles_vaccine_coverage_covid_inclusive_proportion': Covariate(
-        name='measles_vaccine_coverage_covid_inclusive_proportion',
-        kind='covariate',
-        gbd_id=cov_id(2432),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'measles_vaccine_coverage_2_doses_covid_inclusive_proportion': Covariate(
-        name='measles_vaccine_coverage_2_doses_covid_inclusive_proportion',
-        kind='covariate',
-        gbd_id=cov_id(2433),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'polio_3_dose_coverage_covid_inclusive_proportion': Covariate(
-        name='polio_3_dose_coverage_covid_inclusive_proportion',
-        kind='covariate',
-        gbd_id=cov_id(2434),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'rubella_vaccine_coverage_covid_inclusive_proportion': Covariate(
-        name='rubella_vaccine_coverage_covid_inclusive_proportion',
-        kind='covariate',
-        gbd_id=cov_id(2435),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'hib3_vaccine_coverage_covid_inclusive_proportion': Covariate(
-        name='hib3_vaccine_coverage_covid_inclusive_proportion',
-        kind='covariate',
-        gbd_id=cov_id(2436),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'pcv3_coverage_covid_inclusive_proportion': Covariate(
-        name='pcv3_coverage_covid_inclusive_proportion',
-        kind='covariate',
-        gbd_id=cov_id(2437),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'rotavirus_coverage_covid_inclusive_proportion': Covariate(
-        name='rotavirus_coverage_covid_inclusive_proportion',
-        kind='covariate',
-        gbd_id=cov_id(2438),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'hepatitis_b_3_dose_coverage_covid_inclusive_proportion': Covariate(
-        name='hepatitis_b_3_dose_coverage_covid_inclusive_proportion',
-        kind='covariate',
-        gbd_id=cov_id(2439),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'bcg_lagged_five_year_coverage_covid_inclusive_proportion': Covariate(
-        name='bcg_lagged_five_year_coverage_covid_inclusive_proportion',
-        kind='covariate',
-        gbd_id=cov_id(2440),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'dtp3_lagged_five_year_coverage_covid_inclusive_proportion': Covariate(
-        name='dtp3_lagged_five_year_coverage_covid_inclusive_proportion',
-        kind='covariate',
-        gbd_id=cov_id(2441),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'mcv1_lagged_five_year_coverage_covid_inclusive_proportion': Covariate(
-        name='mcv1_lagged_five_year_coverage_covid_inclusive_proportion',
-        kind='covariate',
-        gbd_id=cov_id(2442),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'mcv2_lagged_five_year_coverage_covid_inclusive_proportion': Covariate(
-        name='mcv2_lagged_five_year_coverage_covid_inclusive_proportion',
-        kind='covariate',
-        gbd_id=cov_id(2443),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'rcv1_lagged_five_year_coverage_covid_inclusive_proportion': Covariate(
-        name='rcv1_lagged_five_year_coverage_covid_inclusive_proportion',
-        kind='covariate',
-        gbd_id=cov_id(2445),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'hib3_lagged_five_year_coverage_covid_inclusive_proportion': Covariate(
-        name='hib3_lagged_five_year_coverage_covid_inclusive_proportion',
-        kind='covariate',
-        gbd_id=cov_id(2446),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'pcv3_lagged_five_year_coverage_covid_inclusive_proportion': Covariate(
-        name='pcv3_lagged_five_year_coverage_covid_inclusive_proportion',
-        kind='covariate',
-        gbd_id=cov_id(2447),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'rotac_lagged_five_year_coverage_covid_inclusive_proportion': Covariate(
-        name='rotac_lagged_five_year_coverage_covid_inclusive_proportion',
-        kind='covariate',
-        gbd_id=cov_id(2448),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'hepb3_lagged_five_year_coverage_covid_inclusive_proportion': Covariate(
-        name='hepb3_lagged_five_year_coverage_covid_inclusive_proportion',
-        kind='covariate',
-        gbd_id=cov_id(2449),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'hepatitis_b_3_dose_coverage_proportion_lagged_5_years_covid_inclusive': Covariate(
-        name='hepatitis_b_3_dose_coverage_proportion_lagged_5_years_covid_inclusive',
-        kind='covariate',
-        gbd_id=cov_id(2450),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'hepatitis_b_3_dose_coverage_proportion_lagged_ten_years_covid_inclusive': Covariate(
-        name='hepatitis_b_3_dose_coverage_proportion_lagged_ten_years_covid_inclusive',
-        kind='covariate',
-        gbd_id=cov_id(2451),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'hepatitis_b_vaccine_coverage_proportion_aged_through_time_covid_inclusive': Covariate(
-        name='hepatitis_b_vaccine_coverage_proportion_aged_through_time_covid_inclusive',
-        kind='covariate',
-        gbd_id=cov_id(2452),
-        by_age=True,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'polio3_lagged_five_year_coverage_covid_inclusive_proportion': Covariate(
-        name='polio3_lagged_five_year_coverage_covid_inclusive_proportion',
-        kind='covariate',
-        gbd_id=cov_id(2454),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'sugar_sweetened_beverages_g_us_r_e': Covariate(
-        name='sugar_sweetened_beverages_g_us_r_e',
-        kind='covariate',
-        gbd_id=cov_id(2455),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'processed_meat_g_us_r_e': Covariate(
-        name='processed_meat_g_us_r_e',
-        kind='covariate',
-        gbd_id=cov_id(2456),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'coverage_of_postnatal_care_visit': Covariate(
-        name='coverage_of_postnatal_care_visit',
-        kind='covariate',
-        gbd_id=cov_id(2503),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'socio_demographic_index_us_r_e': Covariate(
-        name='socio_demographic_index_us_r_e',
-        kind='covariate',
-        gbd_id=cov_id(2504),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'college_enrollment_by_race_ethnicity': Covariate(
-        name='college_enrollment_by_race_ethnicity',
-        kind='covariate',
-        gbd_id=cov_id(2505),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_in_each_primary_race_multiracial': Covariate(
-        name='proportion_in_each_primary_race_multiracial',
-        kind='covariate',
-        gbd_id=cov_id(2506),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'unemployment_rate_by_race_ethnicity': Covariate(
-        name='unemployment_rate_by_race_ethnicity',
-        kind='covariate',
-        gbd_id=cov_id(2510),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'k_12_spending_per_student': Covariate(
-        name='k_12_spending_per_student',
-        kind='covariate',
-        gbd_id=cov_id(2511),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'dummy_covariate': Covariate(
-        name='dummy_covariate',
-        kind='covariate',
-        gbd_id=cov_id(2513),
-        by_age=False,
-        by_sex=False,
-        dichotomous=True,
-    ),
-    'proportion_of_owner_occupied_homes': Covariate(
-        name='proportion_of_owner_occupied_homes',
-        kind='covariate',
-        gbd_id=cov_id(2514),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_of_owner_occupied_homes_by_race_ethnicity_of_householder': Covariate(
-        name='proportion_of_owner_occupied_homes_by_race_ethnicity_of_householder',
-        kind='covariate',
-        gbd_id=cov_id(2515),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_in_poverty': Covariate(
-        name='proportion_in_poverty',
-        kind='covariate',
-        gbd_id=cov_id(2516),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'probability_of_homozygous_sickle_cell_disease_at_birth_ss': Covariate(
-        name='probability_of_homozygous_sickle_cell_disease_at_birth_ss',
-        kind='covariate',
-        gbd_id=cov_id(2517),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'probability_of_hemoglobin_sc_disease_at_birth': Covariate(
-        name='probability_of_hemoglobin_sc_disease_at_birth',
-        kind='covariate',
-        gbd_id=cov_id(2518),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'probability_of_homozygous_sickle_cell_disease_ss_and_g6pd_deficiency_at_birth': Covariate(
-        name='probability_of_homozygous_sickle_cell_disease_ss_and_g6pd_deficiency_at_birth',
-        kind='covariate',
-        gbd_id=cov_id(2521),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'probability_of_hemoglobin_sc_disease_sc_and_g6pd_deficiency_at_birth': Covariate(
-        name='probability_of_hemoglobin_sc_disease_sc_and_g6pd_deficiency_at_birth',
-        kind='covariate',
-        gbd_id=cov_id(2522),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'probability_of_g6pd_deficiency_at_birth': Covariate(
-        name='probability_of_g6pd_deficiency_at_birth',
-        kind='covariate',
-        gbd_id=cov_id(2523),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'population_by_marital_status': Covariate(
-        name='population_by_marital_status',
-        kind='covariate',
-        gbd_id=cov_id(2524),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'domestic_health_expenditure_per_capita': Covariate(
-        name='domestic_health_expenditure_per_capita',
-        kind='covariate',
-        gbd_id=cov_id(2525),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_non_hispanic_aian_by_educational_attainment': Covariate(
-        name='proportion_non_hispanic_aian_by_educational_attainment',
-        kind='covariate',
-        gbd_id=cov_id(2528),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_non_hispanic_api_by_educational_attainment': Covariate(
-        name='proportion_non_hispanic_api_by_educational_attainment',
-        kind='covariate',
-        gbd_id=cov_id(2529),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_non_hispanic_black_by_educational_attainment': Covariate(
-        name='proportion_non_hispanic_black_by_educational_attainment',
-        kind='covariate',
-        gbd_id=cov_id(2530),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_non_hispanic_white_by_educational_attainment': Covariate(
-        name='proportion_non_hispanic_white_by_educational_attainment',
-        kind='covariate',
-        gbd_id=cov_id(2531),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_hispanic_by_educational_attainment': Covariate(
-        name='proportion_hispanic_by_educational_attainment',
-        kind='covariate',
-        gbd_id=cov_id(2532),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_specific_cohort_cumulative_fertility_ccf': Covariate(
-        name='age_specific_cohort_cumulative_fertility_ccf',
-        kind='covariate',
-        gbd_id=cov_id(2533),
-        by_age=True,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'mobility_during_covid_19_pandemic': Covariate(
-        name='mobility_during_covid_19_pandemic',
-        kind='covariate',
-        gbd_id=cov_id(2536),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'mask_use': Covariate(
-        name='mask_use',
-        kind='covariate',
-        gbd_id=cov_id(2537),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'leprosy_prevalence_age_specific': Covariate(
-        name='leprosy_prevalence_age_specific',
-        kind='covariate',
-        gbd_id=cov_id(2540),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'stillbirth_20_weeks_to_live_birth_ratio': Covariate(
-        name='stillbirth_20_weeks_to_live_birth_ratio',
-        kind='covariate',
-        gbd_id=cov_id(2541),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'age_and_sex_specific_sev_for_no2_pollution': Covariate(
-        name='age_and_sex_specific_sev_for_no2_pollution',
-        kind='covariate',
-        gbd_id=cov_id(2544),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'age_standardized_sev_for_no2_pollution': Covariate(
-        name='age_standardized_sev_for_no2_pollution',
-        kind='covariate',
-        gbd_id=cov_id(2545),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'stillbirth_20_weeks': Covariate(
-        name='stillbirth_20_weeks',
-        kind='covariate',
-        gbd_id=cov_id(2546),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'stillbirth_28_weeks': Covariate(
-        name='stillbirth_28_weeks',
-        kind='covariate',
-        gbd_id=cov_id(2547),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'stillbirth_rate_20_weeks': Covariate(
-        name='stillbirth_rate_20_weeks',
-        kind='covariate',
-        gbd_id=cov_id(2548),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'stillbirth_rate_28_weeks': Covariate(
-        name='stillbirth_rate_28_weeks',
-        kind='covariate',
-        gbd_id=cov_id(2549),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'major_depressive_disorder_age_standardized': Covariate(
-        name='major_depressive_disorder_age_standardized',
-        kind='covariate',
-        gbd_id=cov_id(2550),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'proportion_of_full_population_covered_by_menafrivac_initiative_meningitis_meningococcal_type_a_vaccine_risk_group_model': Covariate(
-        name='proportion_of_full_population_covered_by_menafrivac_initiative_meningitis_meningococcal_type_a_vaccine_risk_group_model',
-        kind='covariate',
-        gbd_id=cov_id(2551),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_of_high_risk_population_covered_by_menafrivac_initiative_meningitis_meningococcal_type_a_vaccine_risk_group_model': Covariate(
-        name='proportion_of_high_risk_population_covered_by_menafrivac_initiative_meningitis_meningococcal_type_a_vaccine_risk_group_model',
-        kind='covariate',
-        gbd_id=cov_id(2552),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_myocarditis': Covariate(
-        name='log_transformed_sev_scalar_myocarditis',
-        kind='covariate',
-        gbd_id=cov_id(2554),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_myocarditis': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_myocarditis',
-        kind='covariate',
-        gbd_id=cov_id(2555),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_malaria': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_malaria',
-        kind='covariate',
-        gbd_id=cov_id(2560),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'intermediate_age_specific_hiv_mortality_rate_demographics_team_only': Covariate(
-        name='intermediate_age_specific_hiv_mortality_rate_demographics_team_only',
-        kind='covariate',
-        gbd_id=cov_id(2561),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_all_causes': Covariate(
-        name='log_transformed_sev_scalar_all_causes',
-        kind='covariate',
-        gbd_id=cov_id(2562),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_all_causes': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_all_causes',
-        kind='covariate',
-        gbd_id=cov_id(2563),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_ntd_and_upmalaria': Covariate(
-        name='log_transformed_sev_scalar_ntd_and_upmalaria',
-        kind='covariate',
-        gbd_id=cov_id(2564),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_ntd_and_upmalaria': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_ntd_and_upmalaria',
-        kind='covariate',
-        gbd_id=cov_id(2565),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_nutr_def': Covariate(
-        name='log_transformed_sev_scalar_nutr_def',
-        kind='covariate',
-        gbd_id=cov_id(2566),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_nutr_def': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_nutr_def',
-        kind='covariate',
-        gbd_id=cov_id(2567),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_neoplasms': Covariate(
-        name='log_transformed_sev_scalar_neoplasms',
-        kind='covariate',
-        gbd_id=cov_id(2568),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_neoplasms': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_neoplasms',
-        kind='covariate',
-        gbd_id=cov_id(2569),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_neuro': Covariate(
-        name='log_transformed_sev_scalar_neuro',
-        kind='covariate',
-        gbd_id=cov_id(2572),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_neuro': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_neuro',
-        kind='covariate',
-        gbd_id=cov_id(2573),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_mental': Covariate(
-        name='log_transformed_sev_scalar_mental',
-        kind='covariate',
-        gbd_id=cov_id(2574),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_mental': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_mental',
-        kind='covariate',
-        gbd_id=cov_id(2575),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_oth_ncd': Covariate(
-        name='log_transformed_sev_scalar_oth_ncd',
-        kind='covariate',
-        gbd_id=cov_id(2576),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_oth_ncd': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_oth_ncd',
-        kind='covariate',
-        gbd_id=cov_id(2577),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_unint_inj': Covariate(
-        name='log_transformed_sev_scalar_unint_inj',
-        kind='covariate',
-        gbd_id=cov_id(2578),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_unint_inj': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_unint_inj',
-        kind='covariate',
-        gbd_id=cov_id(2579),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_self_harm_and_ipv': Covariate(
-        name='log_transformed_sev_scalar_self_harm_and_ipv',
-        kind='covariate',
-        gbd_id=cov_id(2580),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_self_harm_and_ipv': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_self_harm_and_ipv',
-        kind='covariate',
-        gbd_id=cov_id(2581),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_hiv_aids_and_upstis': Covariate(
-        name='log_transformed_sev_scalar_hiv_aids_and_upstis',
-        kind='covariate',
-        gbd_id=cov_id(2582),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_hiv_aids_and_upstis': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_hiv_aids_and_upstis',
-        kind='covariate',
-        gbd_id=cov_id(2583),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_resp_and_uptb': Covariate(
-        name='log_transformed_sev_scalar_resp_and_uptb',
-        kind='covariate',
-        gbd_id=cov_id(2584),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_resp_and_uptb': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_resp_and_uptb',
-        kind='covariate',
-        gbd_id=cov_id(2585),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_enteric_infect': Covariate(
-        name='log_transformed_sev_scalar_enteric_infect',
-        kind='covariate',
-        gbd_id=cov_id(2586),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_enteric_infect': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_enteric_infect',
-        kind='covariate',
-        gbd_id=cov_id(2587),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_other_and_updiseases': Covariate(
-        name='log_transformed_sev_scalar_other_and_updiseases',
-        kind='covariate',
-        gbd_id=cov_id(2588),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_other_and_updiseases': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_other_and_updiseases',
-        kind='covariate',
-        gbd_id=cov_id(2589),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_mat_and_upneonat': Covariate(
-        name='log_transformed_sev_scalar_mat_and_upneonat',
-        kind='covariate',
-        gbd_id=cov_id(2590),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_mat_and_upneonat': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_mat_and_upneonat',
-        kind='covariate',
-        gbd_id=cov_id(2591),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_diabetes_and_upckd': Covariate(
-        name='log_transformed_sev_scalar_diabetes_and_upckd',
-        kind='covariate',
-        gbd_id=cov_id(2592),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_diabetes_and_upckd': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_diabetes_and_upckd',
-        kind='covariate',
-        gbd_id=cov_id(2593),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'who_sth_mda_coverage_by_age': Covariate(
-        name='who_sth_mda_coverage_by_age',
-        kind='covariate',
-        gbd_id=cov_id(2594),
-        by_age=True,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'normal_hemoglobin': Covariate(
-        name='normal_hemoglobin',
-        kind='covariate',
-        gbd_id=cov_id(2595),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'covid_19_age_standardized_death_rate': Covariate(
-        name='covid_19_age_standardized_death_rate',
-        kind='covariate',
-        gbd_id=cov_id(2598),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    '_legality_of_abortion__and_up_fetal_impairment': Covariate(
-        name='_legality_of_abortion__and_up_fetal_impairment',
-        kind='covariate',
-        gbd_id=cov_id(2603),
-        by_age=False,
-        by_sex=False,
-        dichotomous=True,
-    ),
-    'hiv_art_coverage_from_unaids_reports': Covariate(
-        name='hiv_art_coverage_from_unaids_reports',
-        kind='covariate',
-        gbd_id=cov_id(2604),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'covid_19_crude_death_rate': Covariate(
-        name='covid_19_crude_death_rate',
-        kind='covariate',
-        gbd_id=cov_id(2605),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'covid_19_age_specific_death_rate': Covariate(
-        name='covid_19_age_specific_death_rate',
-        kind='covariate',
-        gbd_id=cov_id(2606),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'covid_19_reproductive_age_crude_death_rate': Covariate(
-        name='covid_19_reproductive_age_crude_death_rate',
-        kind='covariate',
-        gbd_id=cov_id(2607),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'island_binary': Covariate(
-        name='island_binary',
-        kind='covariate',
-        gbd_id=cov_id(2608),
-        by_age=False,
-        by_sex=False,
-        dichotomous=True,
-    ),
-    'all_risk_paf': Covariate(
-        name='all_risk_paf',
-        kind='covariate',
-        gbd_id=cov_id(2609),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'antipsychotic_use_rates_in_schizophrenia': Covariate(
-        name='antipsychotic_use_rates_in_schizophrenia',
-        kind='covariate',
-        gbd_id=cov_id(2610),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'hiv_epidemic_start_year': Covariate(
-        name='hiv_epidemic_start_year',
-        kind='covariate',
-        gbd_id=cov_id(2611),
-        by_age=False,
-        by_sex=False,
-        dichotomous=True,
-    ),
-    'latent_tuberculosis_infection_prevalence_age_sex_specific': Covariate(
-        name='latent_tuberculosis_infection_prevalence_age_sex_specific',
-        kind='covariate',
-        gbd_id=cov_id(2612),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'population_by_latino_origin': Covariate(
-        name='population_by_latino_origin',
-        kind='covariate',
-        gbd_id=cov_id(2613),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'population_by_race_ethnicity_and_fips_1977_omb_standard': Covariate(
-        name='population_by_race_ethnicity_and_fips_1977_omb_standard',
-        kind='covariate',
-        gbd_id=cov_id(2614),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'population_by_race_ethnicity_and_fips_1997_omb_standard': Covariate(
-        name='population_by_race_ethnicity_and_fips_1997_omb_standard',
-        kind='covariate',
-        gbd_id=cov_id(2615),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'varicella_years_since_introduction_of_universal_vaccination': Covariate(
-        name='varicella_years_since_introduction_of_universal_vaccination',
-        kind='covariate',
-        gbd_id=cov_id(2616),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'varicella_post_vaccine_incidence_scalar': Covariate(
-        name='varicella_post_vaccine_incidence_scalar',
-        kind='covariate',
-        gbd_id=cov_id(2617),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'flu_positivity_rate': Covariate(
-        name='flu_positivity_rate',
-        kind='covariate',
-        gbd_id=cov_id(2618),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'dengue_outbreaks_magnitude': Covariate(
-        name='dengue_outbreaks_magnitude',
-        kind='covariate',
-        gbd_id=cov_id(2619),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_self_hang': Covariate(
-        name='log_transformed_sev_scalar_self_hang',
-        kind='covariate',
-        gbd_id=cov_id(2620),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_self_hang': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_self_hang',
-        kind='covariate',
-        gbd_id=cov_id(2621),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_self_fire': Covariate(
-        name='log_transformed_sev_scalar_self_fire',
-        kind='covariate',
-        gbd_id=cov_id(2623),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_self_fire': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_self_fire',
-        kind='covariate',
-        gbd_id=cov_id(2624),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_self_pest': Covariate(
-        name='log_transformed_sev_scalar_self_pest',
-        kind='covariate',
-        gbd_id=cov_id(2625),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_self_pest': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_self_pest',
-        kind='covariate',
-        gbd_id=cov_id(2626),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_sev_scalar_self_harm_by_non_pesticide_poisoning': Covariate(
-        name='log_transformed_sev_scalar_self_harm_by_non_pesticide_poisoning',
-        kind='covariate',
-        gbd_id=cov_id(2627),
-        by_age=True,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_self_harm_by_non_pesticide_poisoning': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_self_harm_by_non_pesticide_poisoning',
-        kind='covariate',
-        gbd_id=cov_id(2628),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_schiz': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_schiz',
-        kind='covariate',
-        gbd_id=cov_id(2629),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_bipolar': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_bipolar',
-        kind='covariate',
-        gbd_id=cov_id(2630),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_eating': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_eating',
-        kind='covariate',
-        gbd_id=cov_id(2631),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_bulimia': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_bulimia',
-        kind='covariate',
-        gbd_id=cov_id(2632),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'log_transformed_age_standardized_sev_scalar_conduct': Covariate(
-        name='log_transformed_age_standardized_sev_scalar_conduct',
-        kind='covariate',
-        gbd_id=cov_id(2633),
-        by_age=False,
-        by_sex=True,
-        dichotomous=False,
-    ),
-    'proportion_white_alone': Covariate(
-        name='proportion_white_alone',
-        kind='covariate',
-        gbd_id=cov_id(2634),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_black_alone': Covariate(
-        name='proportion_black_alone',
-        kind='covariate',
-        gbd_id=cov_id(2635),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_aian_alone': Covariate(
-        name='proportion_aian_alone',
-        kind='covariate',
-        gbd_id=cov_id(2636),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_api_alone': Covariate(
-        name='proportion_api_alone',
-        kind='covariate',
-        gbd_id=cov_id(2637),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'proportion_multiracial': Covariate(
-        name='proportion_multiracial',
-        kind='covariate',
-        gbd_id=cov_id(2638),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'rural_urban_continuum_code_2023': Covariate(
-        name='rural_urban_continuum_code_2023',
-        kind='covariate',
-        gbd_id=cov_id(2639),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'rural_urban_continuum_code_2013': Covariate(
-        name='rural_urban_continuum_code_2013',
-        kind='covariate',
-        gbd_id=cov_id(2640),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'rural_urban_continuum_code_2003': Covariate(
-        name='rural_urban_continuum_code_2003',
-        kind='covariate',
-        gbd_id=cov_id(2641),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-    'rural_urban_continuum_code_1993': Covariate(
-        name='rural_urban_continuum_code_1993',
-        kind='covariate',
-        gbd_id=cov_id(2642),
-        by_age=False,
-        by_sex=False,
-        dichotomous=False,
-    ),
-})
+# name, gbd_id, by_age, by_sex, dichotomous
+COVARIATE_ROWS = (
+    ('legality_of_abortion', 2, False, False, False),
+    ('absolute_value_of_average_latitude', 3, False, False, False),
+    ('antenatal_care_1_visit_coverage_proportion', 7, False, False, False),
+    ('antenatal_care_4_visits_coverage_proportion', 8, False, False, False),
+    ('age_specific_fertility_rate', 13, True, True, False),
+    ('tobacco_cigarettes_per_capita', 14, False, False, False),
+    ('coastal_population_within_10km_proportion', 16, False, False, False),
+    ('contraception_modern_prevalence_proportion_by_age', 18, True, False, False),
+    ('contraception_modern_prevalence_proportion', 19, False, False, False),
+    ('cumulative_cigarettes_10_years', 24, True, True, False),
+    ('cumulative_cigarettes_15_years', 25, True, True, False),
+    ('cumulative_cigarettes_20_years', 26, True, True, False),
+    ('cumulative_cigarettes_5_years', 27, True, True, False),
+    ('diabetes_fasting_plasma_glucose_mmol_l_age_standardized_25_and_up', 28, False, True, False),
+    ('diabetes_age_standardized_prevalence_proportion', 29, False, True, False),
+    ('dtp3_coverage_covid_free_proportion', 32, False, False, False),
+    ('education_years_per_capita', 33, True, True, False),
+    ('gold_production_binary', 42, False, False, True),
+    ('proportion_of_households_using_iodized_salt_adjusted', 46, False, False, False),
+    ('hib3_vaccine_coverage_covid_free_proportion', 47, False, False, False),
+    ('hiv_prevalence_unadjusted_proportion', 49, True, True, False),
+    ('hospital_beds_per_1000', 50, False, False, False),
+    ('in_facility_delivery_proportion', 51, False, False, False),
+    ('landlocked_nation_binary', 55, False, False, True),
+    ('average_latitude', 56, False, False, False),
+    ('ldi_income_per_capita', 57, False, False, False),
+    ('live_births_thousands', 60, False, False, False),
+    ('mean_bmi', 68, False, True, False),
+    ('low_density_lipoprotein_mmol_l', 69, False, True, False),
+    ('systolic_blood_pressure_mmhg', 70, False, True, False),
+    ('population_weighted_mean_temperature', 71, False, False, False),
+    ('measles_vaccine_coverage_covid_free_proportion', 75, False, False, False),
+    ('mortality_rate_due_to_death_shocks_in_last_10_years_per_1_person', 79, False, False, False),
+    ('live_births_35_and_up_proportion', 84, False, False, False),
+    ('live_births_40_and_up_proportion', 85, False, False, False),
+    ('pigs_per_capita', 100, False, False, False),
+    ('indoor_air_pollution_all_cooking_fuels', 105, False, False, False),
+    ('outdoor_air_pollution_pm_2_5', 106, False, False, False),
+    ('latitude_under_15_proportion', 107, False, False, False),
+    ('elevation_over_1500m_proportion', 109, False, False, False),
+    ('population_15_to_30_proportion', 110, False, True, False),
+    ('latitude_15_to_30_proportion', 111, False, False, False),
+    ('latitude_30_to_45_proportion', 112, False, False, False),
+    ('latitude_over_45_proportion', 113, False, False, False),
+    ('elevation_500_to_1500m_proportion', 114, False, False, False),
+    ('population_density_150_300_ppl_sqkm_proportion', 115, False, False, False),
+    ('population_density_300_500_ppl_sqkm_proportion', 116, False, False, False),
+    ('population_density_500_1000_ppl_sqkm_proportion', 117, False, False, False),
+    ('population_density_over_1000_ppl_sqkm_proportion', 118, False, False, False),
+    ('population_density_under_150_ppl_sqkm_proportion', 119, False, False, False),
+    ('population_over_65_proportion', 120, False, True, False),
+    ('elevation_under_100m_proportion', 121, False, False, False),
+    ('rainfall_population_weighted_mm_yr', 127, False, False, False),
+    ('rainfall_quintiles_4_5', 130, False, False, False),
+    ('rainfall_quintile_1_proportion', 131, False, False, False),
+    ('rainfall_quintile_2_proportion', 132, False, False, False),
+    ('rainfall_quintile_5_proportion', 135, False, False, False),
+    ('religion_binary_greater_than_50_percent_muslim', 137, False, False, True),
+    ('sahel_region_of_africa_binary', 141, False, False, True),
+    ('sanitation_proportion_with_access', 142, False, False, False),
+    ('skilled_birth_attendance_proportion', 143, False, False, False),
+    ('smoking_prevalence', 145, True, True, False),
+    ('smoking_prevalence_reproductive_age_standardized', 146, False, False, False),
+    ('ninetieth_percentile_climatic_temperature_in_the_given_country_year', 147, False, False, False),
+    ('tetanus_toxoid_maternal_protection_at_birth', 148, False, False, False),
+    ('total_fertility_rate', 149, False, False, False),
+    ('vehicles_2_and_up4_wheels_per_capita', 154, False, False, False),
+    ('vehicles_2_wheels_per_capita', 155, False, False, False),
+    ('vehicles_4_wheels_per_capita', 156, False, False, False),
+    ('vehicles_2_wheels_fraction_proportion', 157, False, False, False),
+    ('mortality_rate_due_to_war_shocks_per_1_person', 159, False, False, False),
+    ('improved_water_source_proportion_with_access', 160, False, False, False),
+    ('malaria_lysenko_pfpr_1_holoendemic', 183, False, False, False),
+    ('malaria_pfpr_rate', 188, False, False, False),
+    ('significant_leishmaniasis_endemicity_binary', 192, False, False, True),
+    ('year', 195, False, False, False),
+    ('birth_prevalence_of_chd', 197, False, True, False),
+    ('birth_prevalence_of_congenital_chromosomal_anomalies', 198, False, True, False),
+    ('hemoglobinopathies_prevalence_x_excess_mortality', 200, True, True, False),
+    ('age_standardize_prevalence_of_severe_anemia', 205, False, True, False),
+    ('maternal_care_and_immunization', 208, False, False, False),
+    ('neonatal_mortality_rate_per_1000', 209, False, True, False),
+    ('pcv3_coverage_covid_free_proportion', 210, False, False, False),
+    ('presence_of_leishmaniasis_binary', 211, False, False, True),
+    ('under_5_hiv_death_rate', 214, False, False, False),
+    ('syphilis_prevalence_proportion', 218, False, True, False),
+    ('population_weighted_probability_of_dengue_transmission', 247, False, False, False),
+    ('dengue_outbreaks_binary', 248, False, False, True),
+    ('proportion_of_the_population_living_in_the_classic_monsoon_region', 250, False, False, False),
+    ('proportion_of_the_population_living_in_the_classic_monsoon_region_low_income_countries', 251, False, False,
+     False),
+    ('hemoglobinopathies_prevalence_x_excess_mortality_excluding_g6pd_deficiency', 262, True, True, False),
+    ('alcohol_binge_drinker_proportion_age_standardized', 273, False, True, False),
+    ('smoking_prevalence_age_standardized_both_sexes', 282, False, False, False),
+    ('proportion_of_the_population_living_in_the_indian_ocean_monsoon_belt', 441, False, False, False),
+    ('vitamin_a_deficiency_prevalence_age_standardized', 442, False, True, False),
+    ('prevalence_of_obesity', 453, True, True, False),
+    ('prevalence_of_overweight_and_obesity', 454, True, True, False),
+    ('prevalence_of_obesity_age_standardized', 455, False, True, False),
+    ('maternal_education_years_per_capita', 463, False, False, False),
+    ('chagasprevpaho', 467, False, False, False),
+    ('enhanced_vegetation_index_long_term_average_2000_2012_mean', 479, False, False, False),
+    ('log_transformed_sev_scalar_tb', 483, True, True, False),
+    ('log_transformed_sev_scalar_oth_hiv', 485, True, True, False),
+    ('log_transformed_sev_scalar_diarrhea', 486, True, True, False),
+    ('log_transformed_sev_scalar_lri', 491, True, True, False),
+    ('log_transformed_sev_scalar_uri', 492, True, True, False),
+    ('log_transformed_sev_scalar_otitis', 493, True, True, False),
+    ('log_transformed_sev_scalar_meningitis', 494, True, True, False),
+    ('log_transformed_sev_scalar_measles', 503, True, True, False),
+    ('log_transformed_sev_scalar_malaria', 505, True, True, False),
+    ('log_transformed_sev_scalar_mat_hem', 526, True, True, False),
+    ('log_transformed_sev_scalar_mat_sepsis', 527, True, True, False),
+    ('log_transformed_sev_scalar_mat_htn', 528, True, True, False),
+    ('log_transformed_sev_scalar_mat_indir', 531, True, True, False),
+    ('log_transformed_sev_scalar_mat_late', 532, True, True, False),
+    ('log_transformed_sev_scalar_oth_mat', 533, True, True, False),
+    ('log_transformed_sev_scalar_hep', 541, True, True, False),
+    ('log_transformed_sev_scalar_hep_b', 543, True, True, False),
+    ('log_transformed_sev_scalar_hep_c', 544, True, True, False),
+    ('log_transformed_sev_scalar_esophag_c', 548, True, True, False),
+    ('log_transformed_sev_scalar_stomach_c', 549, True, True, False),
+    ('log_transformed_sev_scalar_liver_c', 550, True, True, False),
+    ('log_transformed_sev_scalar_liver_c_hepb', 551, True, True, False),
+    ('log_transformed_sev_scalar_liver_c_hepc', 552, True, True, False),
+    ('log_transformed_sev_scalar_oth_liver_c', 553, True, True, False),
+    ('log_transformed_sev_scalar_larynx_c', 554, True, True, False),
+    ('log_transformed_sev_scalar_lung_c', 555, True, True, False),
+    ('log_transformed_sev_scalar_breast_c', 556, True, True, False),
+    ('log_transformed_sev_scalar_uterus_c', 557, True, True, False),
+    ('log_transformed_sev_scalar_prostate_c', 558, True, True, False),
+    ('log_transformed_sev_scalar_colorect_c', 559, True, True, False),
+    ('log_transformed_sev_scalar_lip_oral_c', 560, True, True, False),
+    ('log_transformed_sev_scalar_nasoph_c', 561, True, True, False),
+    ('log_transformed_sev_scalar_oth_phar_c', 562, True, True, False),
+    ('log_transformed_sev_scalar_gallblad_c', 563, True, True, False),
+    ('log_transformed_sev_scalar_pancreas_c', 564, True, True, False),
+    ('log_transformed_sev_scalar_ovary_c', 567, True, True, False),
+    ('log_transformed_sev_scalar_kidney_c', 569, True, True, False),
+    ('log_transformed_sev_scalar_bladder_c', 570, True, True, False),
+    ('log_transformed_sev_scalar_thyroid_c', 572, True, True, False),
+    ('log_transformed_sev_scalar_mesothel', 573, True, True, False),
+    ('log_transformed_sev_scalar_leukemia', 577, True, True, False),
+    ('log_transformed_sev_scalar_ihd', 580, True, True, False),
+    ('log_transformed_sev_scalar_stroke', 581, True, True, False),
+    ('log_transformed_sev_scalar_isch_stroke', 582, True, True, False),
+    ('log_transformed_sev_scalar_intrahem_stroke', 583, True, True, False),
+    ('log_transformed_sev_scalar_cmp', 584, True, True, False),
+    ('log_transformed_sev_scalar_a_fib', 585, True, True, False),
+    ('log_transformed_sev_scalar_aort_an', 586, True, True, False),
+    ('log_transformed_sev_scalar_pad', 587, True, True, False),
+    ('log_transformed_sev_scalar_copd', 590, True, True, False),
+    ('log_transformed_sev_scalar_asthma', 596, True, True, False),
+    ('log_transformed_sev_scalar_cirr_hepb', 599, True, True, False),
+    ('log_transformed_sev_scalar_cirr_hepc', 600, True, True, False),
+    ('log_transformed_sev_scalar_pancreatit', 610, True, True, False),
+    ('log_transformed_sev_scalar_idiopathic_epilepsy', 614, True, True, False),
+    ('log_transformed_sev_scalar_schizo', 620, True, True, False),
+    ('log_transformed_sev_scalar_depression', 621, True, True, False),
+    ('log_transformed_sev_scalar_mdd', 622, True, True, False),
+    ('log_transformed_sev_scalar_bipolar', 624, True, True, False),
+    ('log_transformed_sev_scalar_anxiety', 625, True, True, False),
+    ('log_transformed_sev_scalar_eating', 626, True, True, False),
+    ('log_transformed_sev_scalar_bulimia', 628, True, True, False),
+    ('log_transformed_sev_scalar_conduct', 633, True, True, False),
+    ('log_transformed_sev_scalar_id', 634, True, True, False),
+    ('log_transformed_sev_scalar_osteoarth', 658, True, True, False),
+    ('log_transformed_sev_scalar_back_pain', 660, True, True, False),
+    ('log_transformed_sev_scalar_gout', 662, True, True, False),
+    ('log_transformed_sev_scalar_sense', 687, True, True, False),
+    ('log_transformed_sev_scalar_cataract', 689, True, True, False),
+    ('log_transformed_sev_scalar_hearing', 692, True, True, False),
+    ('log_transformed_sev_scalar_sids', 701, True, True, False),
+    ('log_transformed_sev_scalar_road_inj', 702, True, True, False),
+    ('log_transformed_sev_scalar_pedest', 703, True, True, False),
+    ('log_transformed_sev_scalar_cyclist', 704, True, True, False),
+    ('log_transformed_sev_scalar_mot_cyc', 705, True, True, False),
+    ('log_transformed_sev_scalar_mot_veh', 706, True, True, False),
+    ('log_transformed_sev_scalar_oth_road', 707, True, True, False),
+    ('log_transformed_sev_scalar_oth_trans', 708, True, True, False),
+    ('log_transformed_sev_scalar_falls', 709, True, True, False),
+    ('log_transformed_sev_scalar_drown', 710, True, True, False),
+    ('log_transformed_sev_scalar_fire', 711, True, True, False),
+    ('log_transformed_sev_scalar_poison', 712, True, True, False),
+    ('log_transformed_sev_scalar_mech', 713, True, True, False),
+    ('log_transformed_sev_scalar_mech_gun', 714, True, True, False),
+    ('log_transformed_sev_scalar_oth_mech', 716, True, True, False),
+    ('log_transformed_sev_scalar_animal', 718, True, True, False),
+    ('log_transformed_sev_scalar_venom', 719, True, True, False),
+    ('log_transformed_sev_scalar_non_ven', 720, True, True, False),
+    ('log_transformed_sev_scalar_f_body', 721, True, True, False),
+    ('log_transformed_sev_scalar_f_body_asp', 722, True, True, False),
+    ('log_transformed_sev_scalar_oth_f_body', 724, True, True, False),
+    ('log_transformed_sev_scalar_oth_unint', 725, True, True, False),
+    ('log_transformed_sev_scalar_self_harm', 726, True, True, False),
+    ('log_transformed_sev_scalar_violence', 727, True, True, False),
+    ('log_transformed_sev_scalar_viol_gun', 728, True, True, False),
+    ('log_transformed_sev_scalar_viol_knife', 729, True, True, False),
+    ('log_transformed_sev_scalar_oth_viol', 730, True, True, False),
+    ('log_transformed_sev_scalar_disaster', 731, True, True, False),
+    ('log_transformed_sev_scalar_mat_hiv', 733, True, True, False),
+    ('log_transformed_age_standardized_sev_scalar_tb', 737, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_oth_hiv', 739, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_diarrhea', 740, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_lri', 744, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_uri', 745, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_otitis', 746, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_measles', 747, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_mat_hem', 748, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_mat_sepsis', 749, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_hep', 751, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_hep_b', 752, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_hep_c', 753, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_esophag_c', 754, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_stomach_c', 755, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_liver_c', 756, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_liver_c_hepb', 757, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_liver_c_hepc', 758, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_oth_liver_c', 759, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_larynx_c', 760, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_lung_c', 761, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_breast_c', 762, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_uterus_c', 763, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_prostate_c', 764, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_colorect_c', 765, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_lip_oral_c', 766, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_nasoph_c', 767, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_oth_phar_c', 768, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_gallblad_c', 769, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_pancreas_c', 770, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_ovary_c', 771, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_kidney_c', 772, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_bladder_c', 773, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_thyroid_c', 774, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_mesothel', 775, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_leukemia', 776, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_ihd', 778, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_stroke', 779, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_isch_stroke', 780, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_intrahem_stroke', 781, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_cmp', 782, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_a_fib', 783, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_aort_an', 784, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_pad', 785, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_copd', 788, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_asthma', 794, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_cirr_hepb', 797, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_cirr_hepc', 798, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_pancreatit', 800, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_idiopathic_epilepsy', 801, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_depression', 802, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_mdd', 803, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_id', 805, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_osteoarth', 806, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_back_pain', 808, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_gout', 809, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_sense', 810, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_cataract', 811, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_hearing', 812, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_road_inj', 813, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_pedest', 814, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_cyclist', 815, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_mot_cyc', 816, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_mot_veh', 817, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_oth_road', 818, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_oth_trans', 819, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_falls', 820, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_drown', 821, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_fire', 822, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_poison', 823, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_mech', 824, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_mech_gun', 825, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_oth_mech', 827, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_animal', 828, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_venom', 829, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_non_ven', 830, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_f_body', 831, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_f_body_asp', 832, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_oth_f_body', 834, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_oth_unint', 835, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_self_harm', 836, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_violence', 837, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_viol_gun', 838, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_viol_knife', 839, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_oth_viol', 840, False, True, False),
+    ('education_age_standardized', 845, False, True, False),
+    ('meningitis_belt_proportion', 848, False, False, False),
+    ('gdp_per_capita_base_2010', 851, False, False, False),
+    ('urbanicity_binary', 854, False, False, False),
+    ('age_and_sex_specific_sev_for_unsafe_water', 863, True, True, False),
+    ('age_and_sex_specific_sev_for_unsafe_sanitation', 866, True, True, False),
+    ('dengue_reporting_trends_transformed_into_relative_risks_relative_to_that_countrys_mean_incidence', 872, False,
+     False, False),
+    ('echinococcosis_endemicity', 875, False, False, False),
+    ('socio_demographic_index', 881, False, False, False),
+    ('japanese_encelphalitis_endemic_area_binary', 884, False, False, True),
+    ('calcium_unadjusted_g', 890, False, False, False),
+    ('fiber_unadjusted_g', 902, False, False, False),
+    ('fruits_unadjusted_g', 914, False, False, False),
+    ('milk_unadjusted_g', 920, False, False, False),
+    ('nuts_seeds_unadjusted_g', 926, False, False, False),
+    ('pufa_adjusted_percent', 929, False, False, False),
+    ('pulses_legumes_unadjusted_g', 935, False, False, False),
+    ('red_meats_unadjusted_g', 941, False, False, False),
+    ('sugar_unadjusted_g', 962, False, False, False),
+    ('vegetables_unadjusted_g', 968, False, False, False),
+    ('energy_unadjusted_kcal', 977, False, False, False),
+    ('hiv_mortality_females_10_54', 986, False, True, False),
+    ('hiv_age_standardized_prevalence', 1016, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_maternal', 1019, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_cvd', 1022, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_chr_resp', 1025, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_cirrhosis', 1028, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_digestive', 1031, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_msk', 1034, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_trans_inj', 1037, False, True, False),
+    ('log_transformed_sev_scalar_maternal', 1040, True, True, False),
+    ('log_transformed_sev_scalar_cvd', 1043, True, True, False),
+    ('log_transformed_sev_scalar_chr_resp', 1046, True, True, False),
+    ('log_transformed_sev_scalar_cirrhosis', 1049, True, True, False),
+    ('log_transformed_sev_scalar_digestive', 1052, True, True, False),
+    ('log_transformed_sev_scalar_msk', 1055, True, True, False),
+    ('log_transformed_sev_scalar_trans_inj', 1058, True, True, False),
+    ('vitamin_a_unadjusted_iu', 1062, False, False, False),
+    ('vitamin_a_rae_unadjusted_ug', 1063, False, False, False),
+    ('dietary_zinc_unadjusted_mg', 1065, False, False, False),
+    ('proportion_of_total_population_covered_by_menafrivac_initiative_meningitis_meningococcal_type_a_vaccine', 1068,
+     False, False, False),
+    ('malaria_incidence_adjusted_for_antimalarial_coverage_and_drug_effectiveness', 1072, True, False, False),
+    ('rotavirus_coverage_covid_free_proportion', 1075, False, False, False),
+    ('proportion_of_cirrhosis_due_to_alcohol', 1076, False, True, False),
+    ('proportion_of_cirrhosis_due_to_hepatitis_b', 1077, False, True, False),
+    ('proportion_of_cirrhosis_due_to_hepatitis_c', 1078, False, True, False),
+    ('proportion_of_cirrhosis_due_to_other_causes', 1079, False, True, False),
+    ('proportion_of_liver_cancer_due_to_alcohol_age_standardized', 1080, False, True, False),
+    ('proportion_of_liver_cancer_due_to_hepatitis_b_age_standardized', 1081, False, True, False),
+    ('proportion_of_liver_cancer_due_to_hepatitis_c_age_standardized', 1082, False, True, False),
+    ('proportion_of_liver_cancer_due_to_other_causes_age_standardized', 1083, False, True, False),
+    ('major_depressive_disorder', 1086, True, True, False),
+    ('proportion_of_population_involved_in_agricultural_activities', 1087, False, True, False),
+    ('health_expenditure_per_capita', 1089, False, False, False),
+    ('fraction_of_oop_health_expenditure', 1093, False, False, False),
+    ('universal_health_coverage', 1097, False, False, False),
+    ('maternal_alcohol_consumption_during_pregnancy_proportion', 1098, False, True, False),
+    ('healthcare_access_and_quality_index', 1099, False, False, False),
+    ('age_standardized_proportion_adult_underweight', 1100, False, True, False),
+    ('ors_oral_rehydration', 1102, False, False, False),
+    ('antibiotics_for_lri', 1103, False, False, False),
+    ('live_births_by_sex', 1106, False, True, False),
+    ('age_standardized_melanoma', 1107, False, True, False),
+    ('measles_vaccine_coverage_2_doses_covid_free_proportion', 1108, False, False, False),
+    ('schisto_cumulative_treatments', 1110, False, False, False),
+    ('health_worker_density', 1111, False, False, False),
+    ('iron_energy_unadjusted_mg', 1113, False, False, False),
+    ('malaria_incidence_map', 1130, True, True, False),
+    ('antimalarial_effective_treatment_map', 1132, False, True, False),
+    ('rubella_vaccine_coverage_covid_free_proportion', 1147, False, False, False),
+    ('tuberculosis_infection_risk_weighted_prevalence_age_standardized', 1148, False, True, False),
+    ('ten_year_lag_distributed_energy_per_capita', 1150, False, False, False),
+    ('folic_acid_unadjusted_ug', 1153, False, False, False),
+    ('smooth_outphase_of_leaded_gasoline', 1154, False, False, False),
+    ('no_access_to_handwashing_facility', 1155, False, False, False),
+    ('residential_radon', 1156, False, False, False),
+    ('zinc_deficiency', 1159, False, True, False),
+    ('diet_high_in_trans_fatty_acids', 1162, False, True, False),
+    ('diet_high_in_sodium', 1163, False, True, False),
+    ('tuberculosis_prevalence_age_standardized', 1165, False, True, False),
+    ('low_bone_mineral_density', 1166, True, True, False),
+    ('age_standardized_bone_mineral_density_among_population_age_60_and_up_years', 1168, False, True, False),
+    ('malnutrition_shock_mortality_rate', 1170, False, False, False),
+    ('mean_war_mortality_rate_in_the_previous_ten_years', 1171, False, False, False),
+    ('log_transformed_age_standardized_sev_scalar_for_both_sexes_combined_tb', 1182, False, False, False),
+    ('secondhand_smoke', 1183, True, True, False),
+    ('asbestos_consumption_metric_tons_per_year_per_capita', 1185, False, False, False),
+    ('zinc_treatment_for_diarrhea', 1193, False, False, False),
+    ('fortification_standard_including_folic_acid', 1195, False, False, True),
+    ('demand_for_contraception_satisfied_with_modern_methods', 1197, False, False, False),
+    ('demand_for_contraception_satisfied_with_modern_methods_by_age', 1198, True, False, False),
+    ('polio_3_dose_coverage_covid_free_proportion', 1200, False, False, False),
+    ('hepatitis_b_3_dose_coverage_covid_free_proportion', 1201, False, False, False),
+    ('composite_fortification_standard_and_folic_acid_inclusion', 1207, False, False, False),
+    ('intravenous_drug_use_proportion_by_age', 1208, True, True, False),
+    ('intravenous_drug_use_age_standardized_proportion', 1209, False, True, False),
+    ('alcohol_consumption_age_standardized_in_grams_per_day', 1211, False, True, False),
+    ('alcohol_drinker_proportion_age_standardized', 1212, False, True, False),
+    ('proportion_of_liver_cancer_due_to_nash_age_standardized', 1216, False, True, False),
+    ('proportion_of_cirrhosis_due_to_nash', 1217, False, True, False),
+    ('muslim_religion_proportion_of_population', 1218, False, False, False),
+    ('tb_strain_prevalence_weighted_transmission_rr', 1222, False, False, False),
+    ('age_and_sex_specific_sev_for_child_underweight', 1229, True, True, False),
+    ('age_standardized_sev_for_child_underweight', 1230, False, False, False),
+    ('age_and_sex_specific_sev_for_child_stunting', 1231, True, True, False),
+    ('age_standardized_sev_for_child_stunting', 1232, False, False, False),
+    ('age_and_sex_specific_sev_for_child_wasting', 1233, True, True, False),
+    ('age_standardized_sev_for_child_wasting', 1234, False, False, False),
+    ('fortification_standard_including_iron', 1241, False, False, True),
+    ('pelvic_inflammatory_disease_age_standardized_prevalence', 1243, False, True, False),
+    ('nafld_nash_prevalence', 1245, False, True, False),
+    ('hepatitis_b_3_dose_coverage_lagged_5_years_covid_free_proportion', 1246, False, False, False),
+    ('hepatitis_b_3_dose_coverage_lagged_ten_years_covid_free_proportion', 1247, False, False, False),
+    ('age_and_sex_specific_sev_for_alcohol_use', 1250, True, True, False),
+    ('age_standardized_sev_for_alcohol_use', 1251, False, False, False),
+    ('underweight_women_age_specific', 1253, True, True, False),
+    ('log_transformed_sev_scalar_group_i', 1831, True, True, False),
+    ('log_transformed_sev_scalar_drug_sus_tb', 1832, True, True, False),
+    ('log_transformed_sev_scalar_mdr_tb', 1833, True, True, False),
+    ('log_transformed_sev_scalar_xdr_tb', 1834, True, True, False),
+    ('log_transformed_sev_scalar_hiv', 1835, True, True, False),
+    ('log_transformed_sev_scalar_drug_sus_hiv_tb', 1836, True, True, False),
+    ('log_transformed_sev_scalar_mdr_hiv_tb', 1837, True, True, False),
+    ('log_transformed_sev_scalar_xdr_hiv_tb', 1838, True, True, False),
+    ('log_transformed_sev_scalar_encepha', 1843, True, True, False),
+    ('log_transformed_sev_scalar_nn_enceph', 1846, True, True, False),
+    ('log_transformed_sev_scalar_nn_sepsis', 1847, True, True, False),
+    ('log_transformed_sev_scalar_nn_hemol', 1848, True, True, False),
+    ('log_transformed_sev_scalar_oth_nn', 1849, True, True, False),
+    ('log_transformed_sev_scalar_ncd', 1860, True, True, False),
+    ('log_transformed_sev_scalar_lymphoma', 1863, True, True, False),
+    ('log_transformed_sev_scalar_myeloma', 1864, True, True, False),
+    ('log_transformed_sev_scalar_all', 1865, True, True, False),
+    ('log_transformed_sev_scalar_cll', 1866, True, True, False),
+    ('log_transformed_sev_scalar_aml', 1867, True, True, False),
+    ('log_transformed_sev_scalar_cml', 1868, True, True, False),
+    ('log_transformed_sev_scalar_oth_leukemia', 1869, True, True, False),
+    ('log_transformed_sev_scalar_oth_cmp', 1872, True, True, False),
+    ('log_transformed_sev_scalar_pud', 1874, True, True, False),
+    ('log_transformed_sev_scalar_gall_bile', 1875, True, True, False),
+    ('log_transformed_sev_scalar_alzheimers', 1876, True, True, False),
+    ('log_transformed_sev_scalar_ms', 1878, True, True, False),
+    ('log_transformed_sev_scalar_rheu_arth', 1892, True, True, False),
+    ('log_transformed_sev_scalar_glaucoma', 1893, True, True, False),
+    ('log_transformed_sev_scalar_macular', 1894, True, True, False),
+    ('log_transformed_sev_scalar_injuries', 1895, True, True, False),
+    ('log_transformed_sev_scalar_self_firearm', 1896, True, True, False),
+    ('log_transformed_sev_scalar_self_other', 1897, True, True, False),
+    ('log_transformed_sev_scalar_sex_viol', 1898, True, True, False),
+    ('log_transformed_age_standardized_sev_scalar_group_i', 1899, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_drug_sus_tb', 1900, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_mdr_tb', 1901, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_xdr_tb', 1902, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_hiv', 1903, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_drug_sus_hiv_tb', 1904, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_mdr_hiv_tb', 1905, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_xdr_hiv_tb', 1906, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_meningitis', 1907, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_encepha', 1912, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_nn_enceph', 1917, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_nn_sepsis', 1918, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_nn_hemol', 1919, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_oth_nn', 1920, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_lymphoma', 1934, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_myeloma', 1935, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_all', 1936, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_cll', 1937, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_aml', 1938, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_cml', 1939, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_oth_leukemia', 1940, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_oth_cmp', 1943, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_pud', 1945, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_gall_bile', 1946, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_alzheimers', 1947, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_ms', 1949, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_rheu_arth', 1963, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_glaucoma', 1964, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_macular', 1965, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_sids', 1966, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_injuries', 1967, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_self_firearm', 1968, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_self_other', 1969, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_sex_viol', 1970, False, True, False),
+    ('opioids_per_million_population_per_day_ten_year_lag', 1972, False, False, False),
+    ('occupation_professionals', 1973, False, False, False),
+    ('health_industry_workers', 1974, False, False, False),
+    ('education_years_per_capita_aggregated_by_age_15_and_up_and_sex', 1975, False, False, False),
+    ('total_physical_activity_met_min_week_age_specific', 1977, True, True, False),
+    ('total_physical_activity_met_min_week_age_standardized', 1978, False, True, False),
+    ('bacille_calmette_guerin_bcg_vaccine_coverage_covid_free_proportion', 1980, False, False, False),
+    ('hepatitis_b_vaccine_coverage_aged_through_time_covid_free_proportion', 1981, True, False, False),
+    ('adolescent_birth_rates_10_19_years_of_age', 1982, False, False, False),
+    ('log_total_health_expenditure_per_capita', 1984, False, False, False),
+    ('pigs_raised_in_extensive_agricultural_systems_per_capita', 1987, False, False, False),
+    ('physicians_per_capita', 1993, False, False, False),
+    ('nurses_and_midwives_per_capita', 1994, False, False, False),
+    ('pharmacists_per_capita', 1995, False, False, False),
+    ('hiv_mortality_rate', 1996, True, True, False),
+    ('dentists_per_capita', 1999, False, False, False),
+    ('net_reproduction_rate', 2001, False, False, False),
+    ('log_transformed_coal_production_per_capita', 2002, False, False, False),
+    ('systolic_blood_pressure_mmhg_us_r_e', 2003, False, True, False),
+    ('low_density_lipoprotein_mmol_l_us_r_e', 2004, False, True, False),
+    ('mean_bmi_kg_m2_us_r_e', 2005, False, True, False),
+    ('education_years_per_capita_us_r_e', 2006, True, True, False),
+    ('ldi_income_per_capita_us_r_e', 2007, False, False, False),
+    ('fasting_plasma_glucose_us_r_e', 2008, False, True, False),
+    ('total_physical_activity_met_min_week_age_specific_us_r_e', 2009, True, True, False),
+    ('total_physical_activity_met_min_week_age_standardized_us_r_e', 2010, False, True, False),
+    ('alcohol_liters_per_capita_us_r_e', 2011, True, True, False),
+    ('smoking_prevalence_us_r_e', 2012, True, True, False),
+    ('outdoor_air_pollution_pm_2_5_us_r_e', 2013, False, False, False),
+    ('fruits_unadjusted_g_us_r_e', 2014, False, False, False),
+    ('vegetables_unadjusted_g_us_r_e', 2015, False, False, False),
+    ('education_relative_inequality_gini', 2020, True, True, False),
+    ('proportion_of_the_population_with_at_least_6_years_of_education_maternal', 2026, False, False, False),
+    ('proportion_of_the_population_with_at_least_12_years_of_education_maternal', 2027, False, False, False),
+    ('mmr_due_to_maternal_hemorrhage', 2031, True, False, False),
+    ('mmr_due_to_maternal_hypertensive_disorders', 2032, True, False, False),
+    ('mmr_due_to_sepsis_and_other_maternal_infections', 2034, True, False, False),
+    ('mmr_due_to_obstructed_labor', 2035, True, False, False),
+    ('age_standardized_sev_for_unsafe_water', 2038, False, False, False),
+    ('age_standardized_sev_for_unsafe_sanitation', 2039, False, False, False),
+    ('age_and_sex_specific_sev_for_handwashing', 2040, True, True, False),
+    ('age_standardized_sev_for_handwashing', 2041, False, False, False),
+    ('age_and_sex_specific_sev_for_ambient_particulate_matter', 2042, True, True, False),
+    ('age_standardized_sev_for_ambient_particulate_matter', 2043, False, False, False),
+    ('age_and_sex_specific_sev_for_household_air_pollution', 2044, True, True, False),
+    ('age_standardized_sev_for_household_air_pollution', 2045, False, False, False),
+    ('age_and_sex_specific_sev_for_ozone', 2046, True, True, False),
+    ('age_standardized_sev_for_ozone', 2047, False, False, False),
+    ('age_and_sex_specific_sev_for_radon', 2048, True, True, False),
+    ('age_standardized_sev_for_radon', 2049, False, False, False),
+    ('age_and_sex_specific_sev_for_lead', 2050, True, True, False),
+    ('age_standardized_sev_for_lead', 2051, False, False, False),
+    ('age_and_sex_specific_sev_for_occupational_asbestos', 2052, True, True, False),
+    ('age_standardized_sev_for_occupational_asbestos', 2053, False, False, False),
+    ('age_and_sex_specific_sev_for_occupational_arsenic', 2054, True, True, False),
+    ('age_standardized_sev_for_occupational_arsenic', 2055, False, False, False),
+    ('age_and_sex_specific_sev_for_occupational_benzene', 2056, True, True, False),
+    ('age_standardized_sev_for_occupational_benzene', 2057, False, False, False),
+    ('age_and_sex_specific_sev_for_occupational_beryllium', 2058, True, True, False),
+    ('age_standardized_sev_for_occupational_beryllium', 2059, False, False, False),
+    ('age_and_sex_specific_sev_for_occupational_cadmium', 2060, True, True, False),
+    ('age_standardized_sev_for_occupational_cadmium', 2061, False, False, False),
+    ('age_and_sex_specific_sev_for_occupational_chromium', 2062, True, True, False),
+    ('age_standardized_sev_for_occupational_chromium', 2063, False, False, False),
+    ('age_and_sex_specific_sev_for_occupational_diesel', 2064, True, True, False),
+    ('age_standardized_sev_for_occupational_diesel', 2065, False, False, False),
+    ('age_and_sex_specific_sev_for_occupational_formaldehyde', 2066, True, True, False),
+    ('age_standardized_sev_for_occupational_formaldehyde', 2067, False, False, False),
+    ('age_and_sex_specific_sev_for_occupational_nickel', 2068, True, True, False),
+    ('age_standardized_sev_for_occupational_nickel', 2069, False, False, False),
+    ('age_and_sex_specific_sev_for_occupational_pah', 2070, True, True, False),
+    ('age_standardized_sev_for_occupational_pah', 2071, False, False, False),
+    ('age_and_sex_specific_sev_for_occupational_silica', 2072, True, True, False),
+    ('age_standardized_sev_for_occupational_silica', 2073, False, False, False),
+    ('age_and_sex_specific_sev_for_occupational_sulfuric_acid', 2074, True, True, False),
+    ('age_standardized_sev_for_occupational_sulfuric_acid', 2075, False, False, False),
+    ('age_and_sex_specific_sev_for_occupational_trichloroethylene', 2076, True, True, False),
+    ('age_standardized_sev_for_occupational_trichloroethylene', 2077, False, False, False),
+    ('age_and_sex_specific_sev_for_occupational_asthmagens', 2078, True, True, False),
+    ('age_standardized_sev_for_occupational_asthmagens', 2079, False, False, False),
+    ('age_and_sex_specific_sev_for_occupational_particulates', 2080, True, True, False),
+    ('age_standardized_sev_for_occupational_particulates', 2081, False, False, False),
+    ('age_and_sex_specific_sev_for_occupational_noise', 2082, True, True, False),
+    ('age_standardized_sev_for_occupational_noise', 2083, False, False, False),
+    ('age_and_sex_specific_sev_for_occupational_ergonomic', 2086, True, True, False),
+    ('age_standardized_sev_for_occupational_ergonomic', 2087, False, False, False),
+    ('age_and_sex_specific_sev_for_non_exclusive_breastfeeding', 2088, True, True, False),
+    ('age_standardized_sev_for_non_exclusive_breastfeeding', 2089, False, False, False),
+    ('age_and_sex_specific_sev_for_discontinued_breastfeeding', 2090, True, True, False),
+    ('age_standardized_sev_for_discontinued_breastfeeding', 2091, False, False, False),
+    ('age_and_sex_specific_sev_for_short_gestation', 2092, True, True, False),
+    ('age_standardized_sev_for_short_gestation', 2093, False, False, False),
+    ('age_and_sex_specific_sev_for_low_birth_weight', 2094, True, True, False),
+    ('age_standardized_sev_for_low_birth_weight', 2095, False, False, False),
+    ('age_and_sex_specific_sev_for_iron_deficiency', 2096, True, True, False),
+    ('age_standardized_sev_for_iron_deficiency', 2097, False, False, False),
+    ('age_and_sex_specific_sev_for_vitamin_a_deficiency', 2098, True, True, False),
+    ('age_standardized_sev_for_vitamin_a_deficiency', 2099, False, False, False),
+    ('age_and_sex_specific_sev_for_zinc_deficiency', 2100, True, True, False),
+    ('age_standardized_sev_for_zinc_deficiency', 2101, False, False, False),
+    ('age_and_sex_specific_sev_for_smoking', 2102, True, True, False),
+    ('age_standardized_sev_for_smoking', 2103, False, False, False),
+    ('age_and_sex_specific_sev_for_chewing_tobacco', 2104, True, True, False),
+    ('age_standardized_sev_for_chewing_tobacco', 2105, False, False, False),
+    ('age_and_sex_specific_sev_for_secondhand_smoke', 2106, True, True, False),
+    ('age_standardized_sev_for_secondhand_smoke', 2107, False, False, False),
+    ('age_and_sex_specific_sev_for_drug_use', 2108, True, True, False),
+    ('age_standardized_sev_for_drug_use', 2109, False, False, False),
+    ('age_and_sex_specific_sev_for_low_fruit', 2110, True, True, False),
+    ('age_standardized_sev_for_low_fruit', 2111, False, False, False),
+    ('age_and_sex_specific_sev_for_low_vegetables', 2112, True, True, False),
+    ('age_standardized_sev_for_low_vegetables', 2113, False, False, False),
+    ('age_and_sex_specific_sev_for_low_legumes', 2114, True, True, False),
+    ('age_standardized_sev_for_low_legumes', 2115, False, False, False),
+    ('age_and_sex_specific_sev_for_low_whole_grains', 2116, True, True, False),
+    ('age_standardized_sev_for_low_whole_grains', 2117, False, False, False),
+    ('age_and_sex_specific_sev_for_low_nuts_and_seeds', 2118, True, True, False),
+    ('age_standardized_sev_for_low_nuts_and_seeds', 2119, False, False, False),
+    ('age_and_sex_specific_sev_for_low_milk', 2120, True, True, False),
+    ('age_standardized_sev_for_low_milk', 2121, False, False, False),
+    ('age_and_sex_specific_sev_for_high_red_meat', 2122, True, True, False),
+    ('age_standardized_sev_for_high_red_meat', 2123, False, False, False),
+    ('age_and_sex_specific_sev_for_high_processed_meat', 2124, True, True, False),
+    ('age_standardized_sev_for_high_processed_meat', 2125, False, False, False),
+    ('age_and_sex_specific_sev_for_high_sweetened_beverages', 2126, True, True, False),
+    ('age_standardized_sev_for_high_sweetened_beverages', 2127, False, False, False),
+    ('age_and_sex_specific_sev_for_low_fiber', 2128, True, True, False),
+    ('age_standardized_sev_for_low_fiber', 2129, False, False, False),
+    ('age_and_sex_specific_sev_for_low_calcium', 2130, True, True, False),
+    ('age_standardized_sev_for_low_calcium', 2131, False, False, False),
+    ('age_and_sex_specific_sev_for_low_omega_3', 2132, True, True, False),
+    ('age_standardized_sev_for_low_omega_3', 2133, False, False, False),
+    ('age_and_sex_specific_sev_for_low_pufa', 2134, True, True, False),
+    ('age_standardized_sev_for_low_pufa', 2135, False, False, False),
+    ('age_and_sex_specific_sev_for_high_trans_fat', 2136, True, True, False),
+    ('age_standardized_sev_for_high_trans_fat', 2137, False, False, False),
+    ('age_and_sex_specific_sev_for_high_sodium', 2138, True, True, False),
+    ('age_standardized_sev_for_high_sodium', 2139, False, False, False),
+    ('age_and_sex_specific_sev_for_intimate_partner_violence', 2140, True, True, False),
+    ('age_standardized_sev_for_intimate_partner_violence', 2141, False, False, False),
+    ('age_and_sex_specific_sev_for_childhood_sexual_abuse', 2142, True, True, False),
+    ('age_standardized_sev_for_childhood_sexual_abuse', 2143, False, False, False),
+    ('age_and_sex_specific_sev_for_bullying', 2144, True, True, False),
+    ('age_standardized_sev_for_bullying', 2145, False, False, False),
+    ('age_and_sex_specific_sev_for_low_physical_activity', 2148, True, True, False),
+    ('age_standardized_sev_for_low_physical_activity', 2149, False, False, False),
+    ('age_and_sex_specific_sev_for_high_fasting_plasma_glucose', 2150, True, True, False),
+    ('age_standardized_sev_for_high_fasting_plasma_glucose', 2151, False, False, False),
+    ('age_and_sex_specific_sev_for_high_ldl', 2152, True, True, False),
+    ('age_standardized_sev_for_high_ldl', 2153, False, False, False),
+    ('age_and_sex_specific_sev_for_high_blood_pressure', 2154, True, True, False),
+    ('age_standardized_sev_for_high_blood_pressure', 2155, False, False, False),
+    ('age_and_sex_specific_sev_for_high_body_mass_index', 2156, True, True, False),
+    ('age_standardized_sev_for_high_body_mass_index', 2157, False, False, False),
+    ('age_and_sex_specific_sev_for_low_bone_mineral_density', 2158, True, True, False),
+    ('age_standardized_sev_for_low_bone_mineral_density', 2159, False, False, False),
+    ('age_and_sex_specific_sev_for_impaired_kidney_function', 2160, True, True, False),
+    ('age_standardized_sev_for_impaired_kidney_function', 2161, False, False, False),
+    ('log_transformed_age_standardized_sev_scalar_obst_labor', 2179, False, True, False),
+    ('log_transformed_sev_scalar_obst_labor', 2180, True, True, False),
+    ('log_transformed_age_standardized_sev_scalar_ectopic_preg', 2181, False, True, False),
+    ('log_transformed_sev_scalar_ectopic_preg', 2182, True, True, False),
+    ('log_transformed_age_standardized_sev_scalar_neonatal', 2187, False, True, False),
+    ('log_transformed_sev_scalar_neonatal', 2188, True, True, False),
+    ('log_transformed_age_standardized_sev_scalar_liver_c_nash', 2190, False, True, False),
+    ('log_transformed_sev_scalar_liver_c_nash', 2191, True, True, False),
+    ('log_transformed_age_standardized_sev_scalar_sub_hem', 2192, False, True, False),
+    ('log_transformed_sev_scalar_sub_hem', 2193, True, True, False),
+    ('log_transformed_age_standardized_sev_scalar_upper_digest', 2198, False, True, False),
+    ('log_transformed_sev_scalar_upper_digest', 2199, True, True, False),
+    ('log_transformed_age_standardized_sev_scalar_blindness', 2207, False, True, False),
+    ('log_transformed_sev_scalar_blindness', 2208, True, True, False),
+    ('log_transformed_age_standardized_sev_scalar_inj_pois_co', 2211, False, True, False),
+    ('log_transformed_sev_scalar_inj_pois_co', 2212, True, True, False),
+    ('log_transformed_age_standardized_sev_scalar_inj_pois_oth', 2213, False, True, False),
+    ('log_transformed_sev_scalar_inj_pois_oth', 2214, True, True, False),
+    ('log_transformed_age_standardized_sev_scalar_heat__and_up_cold', 2215, False, True, False),
+    ('log_transformed_sev_scalar_heat__and_up_cold', 2216, True, True, False),
+    ('log_transformed_age_standardized_sev_scalar_mat_htn', 2235, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_mat_indir', 2239, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_mat_late', 2240, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_oth_mat', 2241, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_ncd', 2242, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_anxiety', 2244, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_disaster', 2247, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_mat_hiv', 2248, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_mat_abort', 2249, False, True, False),
+    ('log_transformed_sev_scalar_mat_abort', 2250, True, True, False),
+    ('proportion_of_the_population_with_0_years_of_education_maternal', 2265, False, False, False),
+    ('stillbirth_28_weeks_to_live_birth_ratio', 2267, False, False, False),
+    ('proportion_pnn_pop_aged_1_5_mo', 2268, False, True, False),
+    ('proportion_1_4_pop_aged_1_year', 2269, False, True, False),
+    ('gallup_negative_experience_index', 2270, False, False, False),
+    ('proportion_of_the_population_working_in_mining_with_20_year_lag', 2276, True, True, False),
+    ('gold_production_kg_per_capita_smoothed_with_20_year_lag', 2277, False, False, False),
+    ('diabetes_fasting_plasma_glucose_mmol_l_by_age', 2279, True, True, False),
+    ('hepatitis_a_seroprevalence_anti_hav_age_standardized', 2282, False, True, False),
+    ('hepatitis_b_seroprevalence_hbsag_age_standardized', 2283, False, True, False),
+    ('hepatitis_c_seroprevalence_anti_hcv_age_standardized', 2284, False, True, False),
+    ('hepatitis_e_seroprevalence_anti_hev_age_standardized', 2285, False, True, False),
+    ('bac_law_general_population_quartile', 2287, False, False, False),
+    ('bac_law_youth_drivers_quartile', 2288, False, False, False),
+    ('bac_law_professional_drivers_quartile', 2289, False, False, False),
+    ('speed_limit_law_urban_quartile', 2290, False, False, False),
+    ('speed_limit_law_rural_quartile', 2291, False, False, False),
+    ('liters_of_alcohol_consumed_per_capita', 2297, False, False, False),
+    ('live_births_by_childs_sex_and_maternal_age', 2298, True, True, False),
+    ('population_15_to_30_males_proportion', 2300, False, False, False),
+    ('max_trachoma_population_at_risk', 2302, False, False, False),
+    ('schistosomiasis_prevalence_results', 2304, True, True, False),
+    ('who_sth_mda_coverage', 2305, False, False, False),
+    ('bcg_lagged_five_year_coverage_covid_free_proportion', 2307, False, False, False),
+    ('dtp3_lagged_five_year_coverage_covid_free_proportion', 2308, False, False, False),
+    ('mcv1_lagged_five_year_coverage_covid_free_proportion', 2309, False, False, False),
+    ('mcv2_lagged_five_year_coverage_covid_free_proportion', 2310, False, False, False),
+    ('polio3_lagged_five_year_coverage_covid_free_proportion', 2311, False, False, False),
+    ('rcv1_lagged_five_year_coverage_covid_free_proportion', 2312, False, False, False),
+    ('hib3_lagged_five_year_coverage_covid_free_proportion', 2313, False, False, False),
+    ('pcv3_lagged_five_year_coverage_covid_free_proportion', 2314, False, False, False),
+    ('rotac_lagged_five_year_coverage_covid_free_proportion', 2315, False, False, False),
+    ('hepb3_lagged_five_year_coverage_covid_free_proportion', 2316, False, False, False),
+    ('proportion_of_population_vulnerable_to_venomous_snakebites', 2318, False, False, False),
+    ('mean_number_of_venomous_snake_species', 2321, False, False, False),
+    ('tfr_u20_us_r_e', 2323, False, False, False),
+    ('dengue_all_age_csmr', 2324, False, True, False),
+    ('education_years_per_capita_aggregated_by_age_15_and_up_and_sex_us_r_e', 2325, False, False, False),
+    ('age_and_sex_specific_sev_for_high_temperature', 2326, True, True, False),
+    ('age_and_sex_specific_sev_for_low_temperature', 2327, True, True, False),
+    ('age_standardized_sev_for_high_temperature', 2328, False, False, False),
+    ('age_standardized_sev_for_low_temperature', 2329, False, False, False),
+    ('inpatient_utilization_envelope', 2331, True, True, False),
+    ('chronic_hepatitis_c_age_standardized', 2336, False, True, False),
+    ('vaccine_adjusted_hbsag_serporevalence_age_standardized', 2339, False, True, False),
+    ('hib3_transformed_population_level_coverage_including_indirect_effects_proportion', 2342, False, False, False),
+    ('age_standardized_daily_smoking_prevalence_both_sexes', 2343, False, False, False),
+    ('log_transformed_sev_scalar_oth_cirr', 2345, True, True, False),
+    ('log_transformed_age_standardized_sev_scalar_oth_cirr', 2346, False, True, False),
+    ('log_transformed_sev_scalar_burkitt', 2347, True, True, False),
+    ('log_transformed_age_standardized_sev_scalar_burkitt', 2348, False, True, False),
+    ('log_transformed_sev_scalar_oth_lymphoma', 2349, True, True, False),
+    ('log_transformed_age_standardized_sev_scalar_oth_lymphoma', 2350, False, True, False),
+    ('log_transformed_sev_scalar_osteoarth_hip', 2351, True, True, False),
+    ('log_transformed_age_standardized_sev_scalar_osteoarth_hip', 2352, False, True, False),
+    ('log_transformed_sev_scalar_osteoarth_knee', 2353, True, True, False),
+    ('log_transformed_age_standardized_sev_scalar_osteoarth_knee', 2354, False, True, False),
+    ('sheep_density', 2358, False, False, False),
+    ('total_fertility_rate_under_25', 2363, False, True, False),
+    ('caesarean_section', 2381, False, False, False),
+    ('full_maternal_care', 2382, False, False, False),
+    ('proportion_in_correctional_facility', 2384, False, False, False),
+    ('proportion_in_correctional_facility_by_race_ethnicity', 2385, False, False, False),
+    ('alcohol_availability_per_capita', 2386, False, False, False),
+    ('alcohol_availability_per_capita_smoothed', 2387, False, False, False),
+    ('alcohol_places_per_capita', 2388, False, False, False),
+    ('alcohol_stores_per_capita', 2389, False, False, False),
+    ('tobacco_stores_per_capita', 2390, False, False, False),
+    ('tobacco_stores_per_capita_smoothed', 2391, False, False, False),
+    ('proportion_with_ba_and_up', 2392, False, False, False),
+    ('proportion_with_ba_and_up_by_race_ethnicity', 2393, False, False, False),
+    ('proportion_with_hs_and_up', 2394, False, False, False),
+    ('proportion_with_hs_and_up_by_race_ethnicity', 2395, False, False, False),
+    ('proportion_foreign_born', 2396, False, False, False),
+    ('proportion_foreign_born_by_education', 2397, False, False, False),
+    ('proportion_foreign_born_by_race_ethnicity', 2398, False, False, False),
+    ('proportion_hispanic', 2399, False, False, False),
+    ('personal_income_per_capita', 2400, False, False, False),
+    ('average_income_per_capita_by_race_ethnicity', 2401, False, False, False),
+    ('mds_per_capita', 2402, False, False, False),
+    ('mds_per_capita_state', 2403, False, False, False),
+    ('median_household_income', 2404, False, False, False),
+    ('median_property_value', 2405, False, False, False),
+    ('log_of_population_density', 2406, False, False, False),
+    ('population_density', 2407, False, False, False),
+    ('proportion_in_college', 2408, False, False, False),
+    ('proportion_in_poverty_by_education', 2410, False, False, False),
+    ('proportion_in_poverty_by_race_ethnicity', 2411, False, False, False),
+    ('proportion_land_in_reservations', 2412, False, False, False),
+    ('proportion_land_in_federal_reservations', 2413, False, False, False),
+    ('proportion_land_in_state_reservations', 2414, False, False, False),
+    ('proportion_black', 2415, False, False, False),
+    ('proportion_other_race', 2416, False, False, False),
+    ('proportion_white', 2417, False, False, False),
+    ('proportion_non_hispanic_aian', 2418, False, False, False),
+    ('proportion_non_hispanic_api', 2419, False, False, False),
+    ('proportion_non_hispanic_black', 2420, False, False, False),
+    ('proportion_non_hispanic_white', 2421, False, False, False),
+    ('proportion_rural', 2422, False, False, False),
+    ('proportion_unemployed', 2423, False, False, False),
+    ('proportion_unemployed_by_education', 2424, False, False, False),
+    ('proportion_with_health_insurance_by_education', 2425, False, False, False),
+    ('population_by_age_and_sex', 2426, True, True, False),
+    ('population_by_education', 2427, True, True, False),
+    ('population_by_race_ethnicity_1977_omb_standard', 2428, True, True, False),
+    ('population_by_race_ethnicity_1997_omb_standard', 2429, True, True, False),
+    ('bacille_calmette_guerin_bcg_vaccine_coverage_covid_inclusive_proportion', 2430, False, False, False),
+    ('dtp3_coverage_covid_inclusive_proportion', 2431, False, False, False),
+    ('measles_vaccine_coverage_covid_inclusive_proportion', 2432, False, False, False),
+    ('measles_vaccine_coverage_2_doses_covid_inclusive_proportion', 2433, False, False, False),
+    ('polio_3_dose_coverage_covid_inclusive_proportion', 2434, False, False, False),
+    ('rubella_vaccine_coverage_covid_inclusive_proportion', 2435, False, False, False),
+    ('hib3_vaccine_coverage_covid_inclusive_proportion', 2436, False, False, False),
+    ('pcv3_coverage_covid_inclusive_proportion', 2437, False, False, False),
+    ('rotavirus_coverage_covid_inclusive_proportion', 2438, False, False, False),
+    ('hepatitis_b_3_dose_coverage_covid_inclusive_proportion', 2439, False, False, False),
+    ('bcg_lagged_five_year_coverage_covid_inclusive_proportion', 2440, False, False, False),
+    ('dtp3_lagged_five_year_coverage_covid_inclusive_proportion', 2441, False, False, False),
+    ('mcv1_lagged_five_year_coverage_covid_inclusive_proportion', 2442, False, False, False),
+    ('mcv2_lagged_five_year_coverage_covid_inclusive_proportion', 2443, False, False, False),
+    ('rcv1_lagged_five_year_coverage_covid_inclusive_proportion', 2445, False, False, False),
+    ('hib3_lagged_five_year_coverage_covid_inclusive_proportion', 2446, False, False, False),
+    ('pcv3_lagged_five_year_coverage_covid_inclusive_proportion', 2447, False, False, False),
+    ('rotac_lagged_five_year_coverage_covid_inclusive_proportion', 2448, False, False, False),
+    ('hepb3_lagged_five_year_coverage_covid_inclusive_proportion', 2449, False, False, False),
+    ('hepatitis_b_3_dose_coverage_proportion_lagged_5_years_covid_inclusive', 2450, False, False, False),
+    ('hepatitis_b_3_dose_coverage_proportion_lagged_ten_years_covid_inclusive', 2451, False, False, False),
+    ('hepatitis_b_vaccine_coverage_proportion_aged_through_time_covid_inclusive', 2452, True, False, False),
+    ('polio3_lagged_five_year_coverage_covid_inclusive_proportion', 2454, False, False, False),
+    ('sugar_sweetened_beverages_g_us_r_e', 2455, False, False, False),
+    ('processed_meat_g_us_r_e', 2456, False, False, False),
+    ('coverage_of_postnatal_care_visit', 2503, False, False, False),
+    ('socio_demographic_index_us_r_e', 2504, False, False, False),
+    ('college_enrollment_by_race_ethnicity', 2505, False, False, False),
+    ('proportion_in_each_primary_race_multiracial', 2506, False, False, False),
+    ('unemployment_rate_by_race_ethnicity', 2510, False, False, False),
+    ('k_12_spending_per_student', 2511, False, False, False),
+    ('dummy_covariate', 2513, False, False, True),
+    ('proportion_of_owner_occupied_homes', 2514, False, False, False),
+    ('proportion_of_owner_occupied_homes_by_race_ethnicity_of_householder', 2515, False, False, False),
+    ('proportion_in_poverty', 2516, False, False, False),
+    ('probability_of_homozygous_sickle_cell_disease_at_birth_ss', 2517, False, False, False),
+    ('probability_of_hemoglobin_sc_disease_at_birth', 2518, False, False, False),
+    ('probability_of_homozygous_sickle_cell_disease_ss_and_g6pd_deficiency_at_birth', 2521, False, True, False),
+    ('probability_of_hemoglobin_sc_disease_sc_and_g6pd_deficiency_at_birth', 2522, False, True, False),
+    ('probability_of_g6pd_deficiency_at_birth', 2523, False, True, False),
+    ('population_by_marital_status', 2524, True, True, False),
+    ('domestic_health_expenditure_per_capita', 2525, False, False, False),
+    ('proportion_non_hispanic_aian_by_educational_attainment', 2528, False, False, False),
+    ('proportion_non_hispanic_api_by_educational_attainment', 2529, False, False, False),
+    ('proportion_non_hispanic_black_by_educational_attainment', 2530, False, False, False),
+    ('proportion_non_hispanic_white_by_educational_attainment', 2531, False, False, False),
+    ('proportion_hispanic_by_educational_attainment', 2532, False, False, False),
+    ('age_specific_cohort_cumulative_fertility_ccf', 2533, True, False, False),
+    ('mobility_during_covid_19_pandemic', 2536, False, False, False),
+    ('mask_use', 2537, False, False, False),
+    ('leprosy_prevalence_age_specific', 2540, True, True, False),
+    ('stillbirth_20_weeks_to_live_birth_ratio', 2541, False, False, False),
+    ('age_and_sex_specific_sev_for_no2_pollution', 2544, True, True, False),
+    ('age_standardized_sev_for_no2_pollution', 2545, False, False, False),
+    ('stillbirth_20_weeks', 2546, False, False, False),
+    ('stillbirth_28_weeks', 2547, False, False, False),
+    ('stillbirth_rate_20_weeks', 2548, False, False, False),
+    ('stillbirth_rate_28_weeks', 2549, False, False, False),
+    ('major_depressive_disorder_age_standardized', 2550, False, True, False),
+    ('proportion_of_full_population_covered_by_menafrivac_initiative_meningitis_meningococcal_type_a_vaccine_risk_group_model',
+     2551, False, False, False),
+    ('proportion_of_high_risk_population_covered_by_menafrivac_initiative_meningitis_meningococcal_type_a_vaccine_risk_group_model',
+     2552, False, False, False),
+    ('log_transformed_sev_scalar_myocarditis', 2554, True, True, False),
+    ('log_transformed_age_standardized_sev_scalar_myocarditis', 2555, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_malaria', 2560, False, True, False),
+    ('intermediate_age_specific_hiv_mortality_rate_demographics_team_only', 2561, True, True, False),
+    ('log_transformed_sev_scalar_all_causes', 2562, True, True, False),
+    ('log_transformed_age_standardized_sev_scalar_all_causes', 2563, False, True, False),
+    ('log_transformed_sev_scalar_ntd_and_upmalaria', 2564, True, True, False),
+    ('log_transformed_age_standardized_sev_scalar_ntd_and_upmalaria', 2565, False, True, False),
+    ('log_transformed_sev_scalar_nutr_def', 2566, True, True, False),
+    ('log_transformed_age_standardized_sev_scalar_nutr_def', 2567, False, True, False),
+    ('log_transformed_sev_scalar_neoplasms', 2568, True, True, False),
+    ('log_transformed_age_standardized_sev_scalar_neoplasms', 2569, False, True, False),
+    ('log_transformed_sev_scalar_neuro', 2572, True, True, False),
+    ('log_transformed_age_standardized_sev_scalar_neuro', 2573, False, True, False),
+    ('log_transformed_sev_scalar_mental', 2574, True, True, False),
+    ('log_transformed_age_standardized_sev_scalar_mental', 2575, False, True, False),
+    ('log_transformed_sev_scalar_oth_ncd', 2576, True, True, False),
+    ('log_transformed_age_standardized_sev_scalar_oth_ncd', 2577, False, True, False),
+    ('log_transformed_sev_scalar_unint_inj', 2578, True, True, False),
+    ('log_transformed_age_standardized_sev_scalar_unint_inj', 2579, False, True, False),
+    ('log_transformed_sev_scalar_self_harm_and_ipv', 2580, True, True, False),
+    ('log_transformed_age_standardized_sev_scalar_self_harm_and_ipv', 2581, False, True, False),
+    ('log_transformed_sev_scalar_hiv_aids_and_upstis', 2582, True, True, False),
+    ('log_transformed_age_standardized_sev_scalar_hiv_aids_and_upstis', 2583, False, True, False),
+    ('log_transformed_sev_scalar_resp_and_uptb', 2584, True, True, False),
+    ('log_transformed_age_standardized_sev_scalar_resp_and_uptb', 2585, False, True, False),
+    ('log_transformed_sev_scalar_enteric_infect', 2586, True, True, False),
+    ('log_transformed_age_standardized_sev_scalar_enteric_infect', 2587, False, True, False),
+    ('log_transformed_sev_scalar_other_and_updiseases', 2588, True, True, False),
+    ('log_transformed_age_standardized_sev_scalar_other_and_updiseases', 2589, False, True, False),
+    ('log_transformed_sev_scalar_mat_and_upneonat', 2590, True, True, False),
+    ('log_transformed_age_standardized_sev_scalar_mat_and_upneonat', 2591, False, True, False),
+    ('log_transformed_sev_scalar_diabetes_and_upckd', 2592, True, True, False),
+    ('log_transformed_age_standardized_sev_scalar_diabetes_and_upckd', 2593, False, True, False),
+    ('who_sth_mda_coverage_by_age', 2594, True, False, False),
+    ('normal_hemoglobin', 2595, True, True, False),
+    ('covid_19_age_standardized_death_rate', 2598, False, True, False),
+    ('_legality_of_abortion__and_up_fetal_impairment', 2603, False, False, True),
+    ('hiv_art_coverage_from_unaids_reports', 2604, True, True, False),
+    ('covid_19_crude_death_rate', 2605, False, True, False),
+    ('covid_19_age_specific_death_rate', 2606, True, True, False),
+    ('covid_19_reproductive_age_crude_death_rate', 2607, False, True, False),
+    ('island_binary', 2608, False, False, True),
+    ('all_risk_paf', 2609, False, True, False),
+    ('antipsychotic_use_rates_in_schizophrenia', 2610, True, True, False),
+    ('hiv_epidemic_start_year', 2611, False, False, True),
+    ('latent_tuberculosis_infection_prevalence_age_sex_specific', 2612, True, True, False),
+    ('population_by_latino_origin', 2613, True, True, False),
+    ('population_by_race_ethnicity_and_fips_1977_omb_standard', 2614, True, True, False),
+    ('population_by_race_ethnicity_and_fips_1997_omb_standard', 2615, True, True, False),
+    ('varicella_years_since_introduction_of_universal_vaccination', 2616, False, False, False),
+    ('varicella_post_vaccine_incidence_scalar', 2617, False, False, False),
+    ('flu_positivity_rate', 2618, True, True, False),
+    ('dengue_outbreaks_magnitude', 2619, False, False, False),
+    ('log_transformed_sev_scalar_self_hang', 2620, True, True, False),
+    ('log_transformed_age_standardized_sev_scalar_self_hang', 2621, False, True, False),
+    ('log_transformed_sev_scalar_self_fire', 2623, True, True, False),
+    ('log_transformed_age_standardized_sev_scalar_self_fire', 2624, False, True, False),
+    ('log_transformed_sev_scalar_self_pest', 2625, True, True, False),
+    ('log_transformed_age_standardized_sev_scalar_self_pest', 2626, False, True, False),
+    ('log_transformed_sev_scalar_self_harm_by_non_pesticide_poisoning', 2627, True, True, False),
+    ('log_transformed_age_standardized_sev_scalar_self_harm_by_non_pesticide_poisoning', 2628, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_schiz', 2629, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_bipolar', 2630, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_eating', 2631, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_bulimia', 2632, False, True, False),
+    ('log_transformed_age_standardized_sev_scalar_conduct', 2633, False, True, False),
+    ('proportion_white_alone', 2634, False, False, False),
+    ('proportion_black_alone', 2635, False, False, False),
+    ('proportion_aian_alone', 2636, False, False, False),
+    ('proportion_api_alone', 2637, False, False, False),
+    ('proportion_multiracial', 2638, False, False, False),
+    ('rural_urban_continuum_code_2023', 2639, False, False, False),
+    ('rural_urban_continuum_code_2013', 2640, False, False, False),
+    ('rural_urban_continuum_code_2003', 2641, False, False, False),
+    ('rural_urban_continuum_code_1993', 2642, False, False, False),
+)
+
+covariates = _load_collection("covariates", COVARIATE_ROWS)
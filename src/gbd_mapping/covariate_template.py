@@ -4,7 +4,7 @@ This code is automatically generated by gbd_mapping_generator/covariate_builder.
 
 Any manual changes will be lost.
 """
-from .base_template import GbdRecord, ModelableEntity
+from .base_template import GbdCollection, ModelableEntity
 from .id import cov_id
 
 
@@ -30,7 +30,7 @@ class Covariate(ModelableEntity):
         self.dichotomous = dichotomous
 
 
-class Covariates(GbdRecord):
+class Covariates(GbdCollection):
     """Container for GBD covariates."""
     __slots__ = ('legality_of_abortion', 'absolute_value_of_average_latitude',
                  'antenatal_care_1_visit_coverage_proportion', 'antenatal_care_4_visits_coverage_proportion',
@@ -4,238 +4,56 @@ This code is automatically generated by gbd_mapping_generator/etiology_builder.p
 
 Any manual changes will be lost.
 """
-from .etiology_template import Etiologies, Etiology
-from .id import rei_id
+from . import _load_collection
 
-etiologies = Etiologies(
-    acinetobacter_baumannii=Etiology(
-        name="acinetobacter_baumannii",
-        kind="etiology",
-        gbd_id=rei_id(414),
-    ),
-    adenovirus=Etiology(
-        name="adenovirus",
-        kind="etiology",
-        gbd_id=rei_id(185),
-    ),
-    aeromonas=Etiology(
-        name="aeromonas",
-        kind="etiology",
-        gbd_id=rei_id(182),
-    ),
-    aspergillus_spp=Etiology(
-        name="aspergillus_spp.",
-        kind="etiology",
-        gbd_id=rei_id(620),
-    ),
-    campylobacter=Etiology(
-        name="campylobacter",
-        kind="etiology",
-        gbd_id=rei_id(178),
-    ),
-    candida_spp=Etiology(
-        name="candida_spp.",
-        kind="etiology",
-        gbd_id=rei_id(631),
-    ),
-    chlamydia_spp=Etiology(
-        name="chlamydia_spp.",
-        kind="etiology",
-        gbd_id=rei_id(415),
-    ),
-    cholera=Etiology(
-        name="cholera",
-        kind="etiology",
-        gbd_id=rei_id(173),
-    ),
-    citrobacter_spp=Etiology(
-        name="citrobacter_spp.",
-        kind="etiology",
-        gbd_id=rei_id(622),
-    ),
-    clostridium_difficile=Etiology(
-        name="clostridium_difficile",
-        kind="etiology",
-        gbd_id=rei_id(183),
-    ),
-    coagulase_negative_staphylococci=Etiology(
-        name="coagulase_negative_staphylococci",
-        kind="etiology",
-        gbd_id=rei_id(632),
-    ),
-    cryptosporidium=Etiology(
-        name="cryptosporidium",
-        kind="etiology",
-        gbd_id=rei_id(180),
-    ),
-    entamoeba=Etiology(
-        name="entamoeba",
-        kind="etiology",
-        gbd_id=rei_id(179),
-    ),
-    enterobacter_spp=Etiology(
-        name="enterobacter_spp.",
-        kind="etiology",
-        gbd_id=rei_id(416),
-    ),
-    enteropathogenic_e_coli=Etiology(
-        name="enteropathogenic_e_coli",
-        kind="etiology",
-        gbd_id=rei_id(176),
-    ),
-    enterotoxigenic_e_coli=Etiology(
-        name="enterotoxigenic_e_coli",
-        kind="etiology",
-        gbd_id=rei_id(177),
-    ),
-    escherichia_coli=Etiology(
-        name="escherichia_coli",
-        kind="etiology",
-        gbd_id=rei_id(417),
-    ),
-    group_a_streptococcus=Etiology(
-        name="group_a_streptococcus",
-        kind="etiology",
-        gbd_id=rei_id(630),
-    ),
-    group_b_streptococcus=Etiology(
-        name="group_b_streptococcus",
-        kind="etiology",
-        gbd_id=rei_id(393),
-    ),
-    haemophilus_influenzae=Etiology(
-        name="haemophilus_influenzae",
-        kind="etiology",
-        gbd_id=rei_id(419),
-    ),
-    influenza=Etiology(
-        name="influenza",
-        kind="etiology",
-        gbd_id=rei_id(187),
-    ),
-    klebsiella_pneumoniae=Etiology(
-        name="klebsiella_pneumoniae",
-        kind="etiology",
-        gbd_id=rei_id(420),
-    ),
-    legionella_spp=Etiology(
-        name="legionella_spp.",
-        kind="etiology",
-        gbd_id=rei_id(421),
-    ),
-    listeria_monocytogenes=Etiology(
-        name="listeria_monocytogenes",
-        kind="etiology",
-        gbd_id=rei_id(422),
-    ),
-    morganella_spp=Etiology(
-        name="morganella_spp.",
-        kind="etiology",
-        gbd_id=rei_id(626),
-    ),
-    mycoplasma=Etiology(
-        name="mycoplasma",
-        kind="etiology",
-        gbd_id=rei_id(423),
-    ),
-    neisseria_meningitidis=Etiology(
-        name="neisseria_meningitidis",
-        kind="etiology",
-        gbd_id=rei_id(431),
-    ),
-    non_polio_enteroviruses=Etiology(
-        name="non_polio_enteroviruses",
-        kind="etiology",
-        gbd_id=rei_id(633),
-    ),
-    non_typhoidal_salmonella=Etiology(
-        name="non_typhoidal_salmonella",
-        kind="etiology",
-        gbd_id=rei_id(174),
-    ),
-    norovirus=Etiology(
-        name="norovirus",
-        kind="etiology",
-        gbd_id=rei_id(184),
-    ),
-    other_acinetobacter_species=Etiology(
-        name="other_acinetobacter_species",
-        kind="etiology",
-        gbd_id=rei_id(621),
-    ),
-    other_bacterial_and_viral_pathogens=Etiology(
-        name="other_bacterial_and_viral_pathogens",
-        kind="etiology",
-        gbd_id=rei_id(424),
-    ),
-    other_fungi=Etiology(
-        name="other_fungi",
-        kind="etiology",
-        gbd_id=rei_id(623),
-    ),
-    other_gram_negative_bacteria=Etiology(
-        name="other_gram_negative_bacteria",
-        kind="etiology",
-        gbd_id=rei_id(624),
-    ),
-    other_klebsiella_species=Etiology(
-        name="other_klebsiella_species",
-        kind="etiology",
-        gbd_id=rei_id(625),
-    ),
-    other_mycobacterium_species_non_tb_non_leprosy=Etiology(
-        name="other_mycobacterium_species_non_tb_non_leprosy",
-        kind="etiology",
-        gbd_id=rei_id(627),
-    ),
-    other_streptococcus_species=Etiology(
-        name="other_streptococcus_species",
-        kind="etiology",
-        gbd_id=rei_id(634),
-    ),
-    proteus_spp=Etiology(
-        name="proteus_spp.",
-        kind="etiology",
-        gbd_id=rei_id(628),
-    ),
-    pseudomonas_aeruginosa=Etiology(
-        name="pseudomonas_aeruginosa",
-        kind="etiology",
-        gbd_id=rei_id(427),
-    ),
-    respiratory_syncytial_virus=Etiology(
-        name="respiratory_syncytial_virus",
-        kind="etiology",
-        gbd_id=rei_id(190),
-    ),
-    rotavirus=Etiology(
-        name="rotavirus",
-        kind="etiology",
-        gbd_id=rei_id(181),
-    ),
-    serratia_spp=Etiology(
-        name="serratia_spp.",
-        kind="etiology",
-        gbd_id=rei_id(629),
-    ),
-    shigella=Etiology(
-        name="shigella",
-        kind="etiology",
-        gbd_id=rei_id(175),
-    ),
-    staphylococcus_aureus=Etiology(
-        name="staphylococcus_aureus",
-        kind="etiology",
-        gbd_id=rei_id(428),
-    ),
-    streptococcus_pneumoniae=Etiology(
-        name="streptococcus_pneumoniae",
-        kind="etiology",
-        gbd_id=rei_id(430),
-    ),
-    other_viral_etiologies_of_meningitis=Etiology(
-        name="other_viral_etiologies_of_meningitis",
-        kind="etiology",
-        gbd_id=rei_id(917),
-    ),
+# attribute, name, gbd_id
+ETIOLOGY_ROWS = (
+    ('cholera', 'cholera', 173),
+    ('non_typhoidal_salmonella', 'non_typhoidal_salmonella', 174),
+    ('shigella', 'shigella', 175),
+    ('enteropathogenic_e_coli', 'enteropathogenic_e_coli', 176),
+    ('enterotoxigenic_e_coli', 'enterotoxigenic_e_coli', 177),
+    ('campylobacter', 'campylobacter', 178),
+    ('entamoeba', 'entamoeba', 179),
+    ('cryptosporidium', 'cryptosporidium', 180),
+    ('rotavirus', 'rotavirus', 181),
+    ('aeromonas', 'aeromonas', 182),
+    ('clostridium_difficile', 'clostridium_difficile', 183),
+    ('norovirus', 'norovirus', 184),
+    ('adenovirus', 'adenovirus', 185),
+    ('influenza', 'influenza', 187),
+    ('respiratory_syncytial_virus', 'respiratory_syncytial_virus', 190),
+    ('group_b_streptococcus', 'group_b_streptococcus', 393),
+    ('acinetobacter_baumannii', 'acinetobacter_baumannii', 414),
+    ('chlamydia_spp', 'chlamydia_spp.', 415),
+    ('enterobacter_spp', 'enterobacter_spp.', 416),
+    ('escherichia_coli', 'escherichia_coli', 417),
+    ('haemophilus_influenzae', 'haemophilus_influenzae', 419),
+    ('klebsiella_pneumoniae', 'klebsiella_pneumoniae', 420),
+    ('legionella_spp', 'legionella_spp.', 421),
+    ('listeria_monocytogenes', 'listeria_monocytogenes', 422),
+    ('mycoplasma', 'mycoplasma', 423),
+    ('other_bacterial_and_viral_pathogens', 'other_bacterial_and_viral_pathogens', 424),
+    ('pseudomonas_aeruginosa', 'pseudomonas_aeruginosa', 427),
+    ('staphylococcus_aureus', 'staphylococcus_aureus', 428),
+    ('streptococcus_pneumoniae', 'streptococcus_pneumoniae', 430),
+    ('neisseria_meningitidis', 'neisseria_meningitidis', 431),
+    ('aspergillus_spp', 'aspergillus_spp.', 620),
+    ('other_acinetobacter_species', 'other_acinetobacter_species', 621),
+    ('citrobacter_spp', 'citrobacter_spp.', 622),
+    ('other_fungi', 'other_fungi', 623),
+    ('other_gram_negative_bacteria', 'other_gram_negative_bacteria', 624),
+    ('other_klebsiella_species', 'other_klebsiella_species', 625),
+    ('morganella_spp', 'morganella_spp.', 626),
+    ('other_mycobacterium_species_non_tb_non_leprosy', 'other_mycobacterium_species_non_tb_non_leprosy', 627),
+    ('proteus_spp', 'proteus_spp.', 628),
+    ('serratia_spp', 'serratia_spp.', 629),
+    ('group_a_streptococcus', 'group_a_streptococcus', 630),
+    ('candida_spp', 'candida_spp.', 631),
+    ('coagulase_negative_staphylococci', 'coagulase_negative_staphylococci', 632),
+    ('non_polio_enteroviruses', 'non_polio_enteroviruses', 633),
+    ('other_streptococcus_species', 'other_streptococcus_species', 634),
+    ('other_viral_etiologies_of_meningitis', 'other_viral_etiologies_of_meningitis', 917),
 )
+
+etiologies = _load_collection("etiologies", ETIOLOGY_ROWS)
@@ -5,7 +5,7 @@ This code is automatically generated by gbd_mapping_generator/etiology_builder.p
 Any manual changes will be lost.
 """
 
-from .base_template import GbdRecord, ModelableEntity
+from .base_template import GbdCollection, ModelableEntity
 from .id import rei_id
 
 
@@ -30,7 +30,7 @@ class Etiology(ModelableEntity):
         self.gbd_id = gbd_id
 
 
-class Etiologies(GbdRecord):
+class Etiologies(GbdCollection):
     """Container for GBD etiologies."""
 
     __slots__ = (
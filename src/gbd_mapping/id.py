@@ -8,42 +8,116 @@ Any manual changes will be lost.
 
 class me_id(int):
     """Modelable Entity ID"""
+    __slots__ = ()
+    _cache = {}
+
+    def __new__(cls, value=0, *args, **kwargs):
+        if not args and not kwargs:
+            try:
+                return cls._cache[value]
+            except KeyError:
+                pass
+        new = super().__new__(cls, value, *args, **kwargs)
+        return cls._cache.setdefault(new, new)
+
     def __repr__(self):
         return "me_id({:d})".format(self)
 
 
 class rei_id(int):
     """Risk-Etiology-Impairment ID"""
+    __slots__ = ()
+    _cache = {}
+
+    def __new__(cls, value=0, *args, **kwargs):
+        if not args and not kwargs:
+            try:
+                return cls._cache[value]
+            except KeyError:
+                pass
+        new = super().__new__(cls, value, *args, **kwargs)
+        return cls._cache.setdefault(new, new)
+
     def __repr__(self):
         return "rei_id({:d})".format(self)
 
 
 class c_id(int):
     """Cause ID"""
+    __slots__ = ()
+    _cache = {}
+
+    def __new__(cls, value=0, *args, **kwargs):
+        if not args and not kwargs:
+            try:
+                return cls._cache[value]
+            except KeyError:
+                pass
+        new = super().__new__(cls, value, *args, **kwargs)
+        return cls._cache.setdefault(new, new)
+
     def __repr__(self):
         return "c_id({:d})".format(self)
 
 
 class s_id(int):
     """Sequela ID"""
+    __slots__ = ()
+    _cache = {}
+
+    def __new__(cls, value=0, *args, **kwargs):
+        if not args and not kwargs:
+            try:
+                return cls._cache[value]
+            except KeyError:
+                pass
+        new = super().__new__(cls, value, *args, **kwargs)
+        return cls._cache.setdefault(new, new)
+
     def __repr__(self):
         return "s_id({:d})".format(self)
 
 
 class cov_id(int):
     """Covariate ID"""
+    __slots__ = ()
+    _cache = {}
+
+    def __new__(cls, value=0, *args, **kwargs):
+        if not args and not kwargs:
+            try:
+                return cls._cache[value]
+            except KeyError:
+                pass
+        new = super().__new__(cls, value, *args, **kwargs)
+        return cls._cache.setdefault(new, new)
+
     def __repr__(self):
         return "cov_id({:d})".format(self)
 
 
 class hs_id(int):
     """Health State ID"""
+    __slots__ = ()
+    _cache = {}
+
+    def __new__(cls, value=0, *args, **kwargs):
+        if not args and not kwargs:
+            try:
+                return cls._cache[value]
+            except KeyError:
+                pass
+        new = super().__new__(cls, value, *args, **kwargs)
+        return cls._cache.setdefault(new, new)
+
     def __repr__(self):
         return "hs_id({:d})".format(self)
 
 
 class scalar(float):
     """Raw Measure Value"""
+    __slots__ = ()
+
     def __repr__(self):
         return "scalar({:f})".format(self)
 
@@ -53,10 +127,18 @@ class Unknown:
     def __repr__(self):
         return "UNKNOWN"
 
+    def __reduce__(self):
+        return "UNKNOWN"
+
 
 UNKNOWN = Unknown()
 
 
+def _is_known(value):
+    """Whether an id is known, i.e. neither ``None`` nor ``UNKNOWN``."""
+    return value is not None and not isinstance(value, Unknown)
+
+
 class UnknownEntityError(Exception):
     """Exception raised when a quantity is requested from vivarium_inputs with an `UNKNOWN` id."""
     pass
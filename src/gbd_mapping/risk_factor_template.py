@@ -6,10 +6,14 @@ Any manual changes will be lost.
 """
 from __future__ import annotations
 
-from .base_template import Categories, GbdRecord, ModelableEntity, Restrictions, Tmred
-from .cause_template import Cause
+from typing import TYPE_CHECKING
+
+from .base_template import Categories, GbdCollection, ModelableEntity, Restrictions, Tmred
 from .id import rei_id, scalar
 
+if TYPE_CHECKING:
+    from .cause_template import Cause
+
 
 class RiskFactor(ModelableEntity):
     """Container for risk GBD ids and metadata."""
@@ -56,7 +60,7 @@ class RiskFactor(ModelableEntity):
         self.relative_risk_scalar = relative_risk_scalar
 
 
-class RiskFactors(GbdRecord):
+class RiskFactors(GbdCollection):
     """Container for GBD risks."""
     __slots__ = ('unsafe_water_sanitation_and_handwashing', 'unsafe_water_source', 'unsafe_sanitation',
                  'air_pollution', 'ambient_particulate_matter_pollution', 'household_air_pollution_from_solid_fuels',
@@ -4,7 +4,7 @@ This code is automatically generated by gbd_mapping_generator/sequela_builder.py
 
 Any manual changes will be lost.
 """
-from .base_template import GbdRecord, ModelableEntity
+from .base_template import GbdCollection, ModelableEntity
 from .id import hs_id, me_id, s_id
 
 
@@ -44,7 +44,7 @@ class Sequela(ModelableEntity):
         self.healthstate = healthstate
 
 
-class Sequelae(GbdRecord):
+class Sequelae(GbdCollection):
     """Container for GBD sequelae."""
     __slots__ = ('acute_typhoid_infection', 'severe_typhoid_fever', 'intestinal_perforation_due_to_typhoid',
                  'acute_paratyphoid_infection', 'moderate_paratyphoid_fever', 'severe_paratyphoid_fever',
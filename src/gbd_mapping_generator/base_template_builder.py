@@ -1,6 +1,19 @@
-from .util import DOUBLE_SPACING, make_import, make_module_docstring, make_record
+from .util import (
+    DOUBLE_SPACING,
+    SINGLE_SPACING,
+    make_import,
+    make_module_docstring,
+    make_record,
+)
 
-IMPORTABLES_DEFINED = ("GbdRecord", "ModelableEntity", "Restrictions", "Tmred", "Categories")
+IMPORTABLES_DEFINED = (
+    "GbdRecord",
+    "GbdCollection",
+    "ModelableEntity",
+    "Restrictions",
+    "Tmred",
+    "Categories",
+)
 
 
 gbd_record_attrs = ()
@@ -25,7 +38,6 @@ tmred_attrs = (
     ("min", "scalar = None"),
     ("max", "scalar = None"),
 )
-categories_attrs = tuple([(f"cat{i}", "str = None") for i in range(1, 150)])
 
 
 def get_base_types():
@@ -45,36 +57,212 @@ def get_base_types():
             "superclass": ("GbdRecord", gbd_record_attrs),
             "docstring": "Container for theoretical minimum risk exposure distribution data.",
         },
-        "Categories": {
-            "attrs": categories_attrs,
-            "superclass": ("GbdRecord", gbd_record_attrs),
-            "docstring": "Container for categorical risk exposure levels.",
-        },
     }
 
 
 def make_gbd_record():
     out = '''class GbdRecord:
-    """Base class for entities modeled in the GBD."""
-    __slots__ = ()
-    
-    def to_dict(self):
-        out = {}
+    """Base class for entities modeled in the GBD.
+
+    Records in the mapping are frozen once they are built and linked. Frozen records
+    can't be changed and hash by ``(kind, gbd_id)``, or by ``(kind, name)`` if they have
+    no id, so entities can be used as dictionary keys and set members. Records without
+    a kind hash by their fields. Records can also be weakly referenced, e.g. as keys of a
+    ``weakref.WeakKeyDictionary``.
+    """
+    __slots__ = ('_deferred', '_cached_dict', '_hash', '_frozen', '__weakref__', )
+    _fields = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Set once per class so membership tests don't scan __slots__.
+        cls._fields = frozenset(cls.__slots__)
+
+    def __init__(self):
+        object.__setattr__(self, '_frozen', False)
+
+    def __setattr__(self, name, value):
+        if getattr(self, '_frozen', False):
+            raise AttributeError(f"'{self.__class__.__name__}' object is frozen")
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name):
+        if getattr(self, '_frozen', False):
+            raise AttributeError(f"'{self.__class__.__name__}' object is frozen")
+        object.__delattr__(self, name)
+
+    def _freeze(self):
+        """Makes the record read-only, though its deferred attributes can still be built."""
+        if 'kind' in self._fields:
+            object.__setattr__(self, '_hash', hash(self._identity()))
+        object.__setattr__(self, '_frozen', True)
+
+    def __reduce_ex__(self, protocol):
+        # Frozen records of the mapping are pickled as references that are resolved
+        # against the mapping of the process unpickling them, others by value.
+        from ._tables import reference
+
+        return reference(self) or (_new_record, (self.__class__,), self.__getstate__())
+
+    def __getstate__(self):
+        fields = {}
         for item in self.__slots__:
-            attr = getattr(self, item)
-            if isinstance(attr, GbdRecord):
-                out[item] = attr.to_dict()
-            elif isinstance(attr, tuple) and attr:
-                if isinstance(attr[0], GbdRecord):
-                    out[item] = tuple(r.to_dict() for r in attr)
-            elif attr is not None:
-                out[item] = attr
-            else:
+            try:
+                fields[item] = getattr(self, item)
+            except AttributeError:
+                pass
+        # Hashes of strings differ between processes, so the hash is computed again.
+        return fields, getattr(self, '_frozen', False)
+
+    def __setstate__(self, state):
+        fields, frozen = state
+        for item, value in fields.items():
+            object.__setattr__(self, item, value)
+        if frozen:
+            self._freeze()
+
+    def _identity(self):
+        if 'kind' not in self._fields:
+            # Nested and linked records are left out, so cycles of links don't recurse.
+            return (self.__class__.__name__, tuple(
+                attr for attr in self
+                if not isinstance(attr, GbdRecord) and not _is_records(attr)))
+        gbd_id = self.gbd_id
+        return (self.kind, gbd_id) if _is_known(gbd_id) else (self.kind, self.name)
+
+    def to_dict(self, max_depth=None):
+        """Returns the fields of the record as a dictionary.
+
+        Nested records are expanded into dictionaries up to ``max_depth`` levels deep,
+        or fully if it is ``None``. Parents, named records beyond ``max_depth`` and
+        records that would contain themselves are given by name instead.
+
+        Fully expanded results of frozen records are cached on them, as they can't
+        change, but every call returns new dictionaries. Within one result, a record
+        nested in several places is expanded into one dictionary shared between them.
+        """
+        frozen = getattr(self, '_frozen', False)
+        cached = getattr(self, '_cached_dict', None) if frozen else None
+        if max_depth is None and cached is not None:
+            return _copy_dict(cached)
+        # Frames are [record, depth, parent frame, fields, nested results, uncacheable].
+        root = [self, 0, None, None, {}, False]
+        stack = [root]
+        expanding = set()
+        while stack:
+            frame = stack[-1]
+            record, depth, parent, fields, nested = frame[:5]
+            if fields is None:  # First visit, schedule nested records.
+                expanding.add(id(record))
+                frame[3] = fields = record._items()
+                for item, attr in fields:
+                    if item == "parent":
+                        continue
+                    children = attr if isinstance(attr, tuple) else (attr,)
+                    for child in children:
+                        if not isinstance(child, GbdRecord) or id(child) in nested:
+                            continue
+                        if id(child) in expanding:
+                            nested[id(child)] = child.name
+                            frame[5] = True
+                        elif (max_depth is not None and depth >= max_depth
+                              and hasattr(child, "name")):
+                            nested[id(child)] = child.name
+                        elif (max_depth is None and getattr(child, '_frozen', False)
+                              and hasattr(child, '_cached_dict')):
+                            nested[id(child)] = child._cached_dict
+                        else:
+                            nested[id(child)] = None
+                            stack.append([child, depth + 1, frame, None, {}, False])
                 continue
-        return out        
+            stack.pop()
+            expanding.discard(id(record))
+            out = {}
+            for item, attr in fields:
+                if item == "parent":
+                    out[item] = attr.name if hasattr(attr, "name") else attr.__repr__()
+                elif isinstance(attr, GbdRecord):
+                    out[item] = nested[id(attr)]
+                elif isinstance(attr, tuple) and attr:
+                    if isinstance(attr[0], GbdRecord):
+                        out[item] = tuple(nested[id(r)] for r in attr)
+                elif attr is not None:
+                    out[item] = attr
+            # Results cut short by a cycle depend on where expansion started and those of
+            # records that aren't frozen, or hold ones that aren't, may change.
+            frame[5] = frame[5] or not getattr(record, '_frozen', False)
+            if max_depth is None and not frame[5]:
+                object.__setattr__(record, '_cached_dict', out)
+            if parent is not None:
+                parent[4][id(record)] = out
+                parent[5] = parent[5] or frame[5]
+        # Fully expanded results may hold cached dictionaries, which are never handed out.
+        return _copy_dict(out) if max_depth is None else out
+
+    def _items(self):
+        """Returns (field, value) pairs of the record, in the order of its slots.
+
+        Fields left out of the mapping, see ``__getattr__``, are skipped.
+        """
+        items = []
+        for item in self.__slots__:
+            try:
+                items.append((item, getattr(self, item)))
+            except AttributeError:
+                pass
+        return items
+
+    @classmethod
+    def _from_deferred(cls, resolve, values):
+        """Creates a record whose attributes are built as ``resolve(values[name])`` on first
+        access."""
+        record = cls.__new__(cls)
+        object.__setattr__(record, '_frozen', False)
+        record._deferred = {name: (resolve, value) for name, value in values.items()}
+        return record
+
+    def _defer(self, name, resolve, value):
+        """Replaces attribute ``name`` with ``resolve(value)``, evaluated on first access."""
+        try:
+            object.__delattr__(self, name)
+        except AttributeError:
+            pass
+        try:
+            deferred = self._deferred
+        except AttributeError:
+            deferred = self._deferred = {}
+        deferred[name] = (resolve, value)
+
+    def __getattr__(self, item):
+        # Only reached for unset slots, so fully built records never pay for this.
+        if item in GbdRecord.__slots__ or item.startswith('__'):  # Never deferred.
+            raise AttributeError(item)
+        try:
+            deferred = self._deferred
+        except AttributeError:
+            deferred = {}
+        if item not in deferred:
+            if item in self._fields:
+                # Slim mappings leave out links to entities they don't hold.
+                raise AttributeError(
+                    f"'{self.__class__.__name__}' object has no attribute '{item}', "
+                    "it was left out of this mapping"
+                )
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute '{item}'"
+            )
+        with _DEFERRED_LOCK:
+            if item in deferred:  # Not built by another thread while we waited.
+                resolve, value = deferred[item]
+                object.__setattr__(self, item, resolve(value))
+                del deferred[item]
+        return object.__getattribute__(self, item)
 
     def __contains__(self, item):
-        return item in self.__slots__
+        try:
+            return item in self._fields
+        except TypeError:  # Unhashable, so not a field name.
+            return False
 
     def __getitem__(self, item):
         if item in self:
@@ -85,15 +273,48 @@ def make_gbd_record():
     def __iter__(self):
         for item in self.__slots__:
             yield getattr(self, item)
-            
+
+    def __hash__(self):
+        try:
+            return self._hash
+        except AttributeError:
+            pass
+        out = hash(self._identity())
+        if getattr(self, '_frozen', False):
+            object.__setattr__(self, '_hash', out)
+        return out
+
     def __eq__(self, other):
-        return all([getattr(self, item) == getattr(other, item) for item in self.__slots__
-                    if not isinstance(getattr(self, item), GbdRecord)])
+        if self is other:
+            return True
+        if not isinstance(other, GbdRecord):
+            return NotImplemented
+        try:
+            if self._hash != other._hash:
+                return False
+        except AttributeError:
+            pass
+        if 'kind' in self._fields and 'kind' in other._fields:
+            if self.kind != other.kind or self.gbd_id != other.gbd_id:
+                return False
+        if self._fields is not other._fields and self._fields != other._fields:
+            return False
+        # Stops at the first difference. Shared values are equal without comparing them.
+        for item in self.__slots__:
+            mine, theirs = getattr(self, item, _MISSING), getattr(other, item, _MISSING)
+            if mine is theirs:
+                continue
+            if item == 'parent' or _is_records(mine):
+                if not _same_links(mine, theirs):
+                    return False
+            elif mine != theirs:
+                return False
+        return True
 
     def __repr__(self):
         out = f'{self.__class__.__name__}('
         for i, slot in enumerate(self.__slots__):
-            attr = self[slot]
+            attr = getattr(self, slot, None)
             if attr is None:
                 continue
             if i != 0:
@@ -110,6 +331,251 @@ def make_gbd_record():
     return out
 
 
+def make_gbd_collection():
+    out = '''class GbdCollection(GbdRecord):
+    """Base class for collections of GBD entities."""
+    __slots__ = ('_by_id', '_id_table', )
+
+    def by_id(self, gbd_id):
+        """Returns the entity with the given GBD id, raising a ``KeyError`` if there is none.
+
+        The first lookup builds an index of every entity in the collection.
+        """
+        return self._id_index()[gbd_id]
+
+    def by_ids(self, gbd_ids):
+        """Returns a tuple of the entities with the given GBD ids, in the same order."""
+        index = self._id_index()
+        return tuple(index[gbd_id] for gbd_id in gbd_ids)
+
+    def _id_index(self):
+        try:
+            return self._by_id
+        except AttributeError:
+            pass
+        # Entities without a known id can't be looked up by it.
+        index = {entity.gbd_id: entity for entity in self
+                 if _is_known(entity.gbd_id)}
+        object.__setattr__(self, '_by_id', index)
+        return index
+
+    def ids_to_codes(self, gbd_ids):
+        """Returns the codes in ``categorical_dtype()`` of the entities with the given ids.
+
+        ``gbd_ids`` is a NumPy array or pandas ``Series`` of ids, translated in one
+        vectorized step; a ``Series`` gives a ``Series`` with the same index. Ids no entity
+        has, including missing ones, get the code ``-1``. The first translation builds a
+        dense table of every id in the collection.
+        """
+        from ._arrays import ids_to_codes
+        return ids_to_codes(self._dense_id_table(), gbd_ids)
+
+    def ids_to_names(self, gbd_ids):
+        """Returns the names of the entities with the given GBD ids, like ``ids_to_codes``.
+
+        Names are in an object array, with ``None`` for ids no entity has.
+        """
+        from ._arrays import ids_to_names
+        return ids_to_names(self._dense_id_table(), gbd_ids)
+
+    def ids_to_categorical(self, gbd_ids):
+        """Returns a pandas ``Categorical`` of the names of the entities with the given ids.
+
+        Its dtype is ``categorical_dtype()`` and ids no entity has are missing values.
+        """
+        from ._arrays import ids_to_categorical
+        return ids_to_categorical(self._dense_id_table(), gbd_ids)
+
+    def categorical_dtype(self):
+        """Returns a cached pandas ``CategoricalDtype`` of the names of the entities.
+
+        The names are in the order of the entities' GBD ids, which new entities come after,
+        so columns stored as its codes keep their meaning across processes and, unless
+        entities are removed, across versions of the mapping.
+        """
+        return self._dense_id_table().categorical_dtype()
+
+    def _dense_id_table(self):
+        try:
+            return self._id_table
+        except AttributeError:
+            pass
+        from ._arrays import IdTable
+        object.__setattr__(self, '_id_table', IdTable(self))
+        return self._id_table
+
+    def write_json(self, f, lines=False):
+        """Writes the entities to the text file ``f`` as JSON, one entity at a time.
+
+        The entities are written as one object keyed by attribute name or, if ``lines``,
+        as JSON Lines with one entity per line. Links to other entities are written as
+        their names and ``UNKNOWN`` as ``null``.
+        """
+        encode = json.JSONEncoder(default=_unknown_to_none).encode
+        if lines:
+            for entity in self:
+                f.write(encode(_linked_dict(entity)) + '\\n')
+            return
+        f.write('{')
+        for i, (name, entity) in enumerate(zip(self.__slots__, self)):
+            f.write(',\\n' if i else '\\n')
+            f.write(f'{encode(name)}: {encode(_linked_dict(entity))}')
+        f.write('\\n}\\n')
+
+
+def _copy_dict(result):
+    # Copies the dictionaries of a to_dict result, nested ones included, without recursing.
+    # A dictionary nested in several places is copied once, so the copy is shared within
+    # the new result, as it was in the old one, but not with any other result.
+    copies = {id(result): {}}
+    stack = [result]
+    while stack:
+        source = stack.pop()
+        target = copies[id(source)]
+        for key, value in source.items():
+            nested = value if isinstance(value, tuple) else (value,)
+            for v in nested:
+                if isinstance(v, dict) and id(v) not in copies:
+                    copies[id(v)] = {}
+                    stack.append(v)
+            if isinstance(value, dict):
+                target[key] = copies[id(value)]
+            elif isinstance(value, tuple) and any(isinstance(v, dict) for v in value):
+                target[key] = tuple(copies[id(v)] if isinstance(v, dict) else v for v in value)
+            else:
+                target[key] = value
+    return copies[id(result)]
+
+
+def _linked_dict(record):
+    # Like GbdRecord.to_dict, but linked records, in parent or in tuples, are given by name.
+    out = {}
+    for item in record.__slots__:
+        attr = getattr(record, item, None)
+        if attr is None:
+            continue
+        if item == 'parent':
+            out[item] = attr.name
+        elif isinstance(attr, GbdRecord):
+            out[item] = attr.to_dict()
+        elif isinstance(attr, tuple) and attr and isinstance(attr[0], GbdRecord):
+            out[item] = tuple(r.name for r in attr)
+        else:
+            out[item] = attr
+    return out
+
+
+def _new_record(cls):
+    record = cls.__new__(cls)
+    object.__setattr__(record, '_frozen', False)
+    return record
+
+
+def _is_records(value):
+    return isinstance(value, tuple) and bool(value) and isinstance(value[0], GbdRecord)
+
+
+def _same_links(mine, theirs):
+    # Linked entities are compared by kind and id rather than field by field, as links can
+    # form cycles. Comparing collections still compares every entity in full.
+    if not isinstance(mine, tuple):
+        mine, theirs = (mine,), (theirs,)
+    if not isinstance(theirs, tuple) or len(mine) != len(theirs):
+        return False
+    return all(a is b or isinstance(a, GbdRecord) and isinstance(b, GbdRecord)
+               and a._identity() == b._identity() for a, b in zip(mine, theirs))
+
+
+def _unknown_to_none(value):
+    if isinstance(value, Unknown):
+        return None
+    raise TypeError(f'Object of type {value.__class__.__name__} is not JSON serializable')
+'''
+    return out
+
+
+def make_categories():
+    out = '''class _IndexedCategories(GbdRecord):
+    # Slots of a base class are not fields of the record, see GbdCollection.
+    __slots__ = ('_index', )
+
+
+class Categories(_IndexedCategories):
+    """Container for categorical risk exposure levels.
+
+    Holds the labels of the levels a risk uses in the order of their codes, ``cat1``,
+    ``cat2`` and so on, which may have gaps. Labels are available as attributes or
+    items, e.g. ``categories.cat3``, which is ``None`` for codes the risk does not use.
+    """
+    __slots__ = ('codes', 'labels', )
+
+    def __init__(self, **labels: str):
+        super().__init__()
+        for code in labels:
+            if not _is_category_code(code):
+                raise TypeError(f"Categories() got an unexpected keyword argument '{code}'")
+        items = sorted(((code, label) for code, label in labels.items() if label is not None),
+                       key=lambda item: int(item[0][3:]))
+        self.codes = tuple(code for code, _ in items)
+        self.labels = tuple(label for _, label in items)
+
+    def code(self, label):
+        """Returns the code of the level with the given label."""
+        return self._lookups()[1][label]
+
+    def items(self):
+        """Returns (code, label) pairs in the order of the codes."""
+        return list(zip(self.codes, self.labels))
+
+    def categorical_dtype(self, labels=False):
+        """Returns a cached pandas ``CategoricalDtype`` of the codes, or of the labels if
+        ``labels``, in the order of the codes."""
+        from ._arrays import categorical_dtype
+        return categorical_dtype(self.labels if labels else self.codes)
+
+    def _items(self):
+        return self.items()
+
+    def _lookups(self):
+        # Label by code and code by label, built on first use. They aren't fields, so
+        # they're built again after unpickling.
+        try:
+            return self._index
+        except AttributeError:
+            pass
+        index = dict(zip(self.codes, self.labels)), dict(zip(self.labels, self.codes))
+        object.__setattr__(self, '_index', index)
+        return index
+
+    def __getattr__(self, item):
+        if _is_category_code(item):
+            return self._lookups()[0].get(item)
+        return super().__getattr__(item)
+
+    def __contains__(self, item):
+        # Every code is an item, as it was when each one had a slot.
+        return _is_category_code(item) or super().__contains__(item)
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __iter__(self):
+        return iter(self.labels)
+
+    def __dir__(self):
+        return [*super().__dir__(), *self.codes]
+
+    def __repr__(self):
+        items = ','.join(f'\\n{code}={label!r}' for code, label in self.items())
+        return f'Categories({items})'
+
+
+def _is_category_code(item):
+    return isinstance(item, str) and item.startswith('cat') and item[3:].isdigit()
+'''
+    return out
+
+
 def build_mapping() -> str:
     """
     Generate string representations of class definitions.
@@ -121,25 +587,34 @@ def build_mapping() -> str:
 
     """
     templates = make_module_docstring("Template classes for GBD entities", __file__)
-    templates += (
-        make_import(
-            ".id",
-            [
-                "c_id",
-                "s_id",
-                "hs_id",
-                "me_id",
-                "cov_id",
-                "rei_id",
-                "scalar",
-            ],
-        )
-        + DOUBLE_SPACING
+    templates += make_import("json") + "\n"
+    templates += make_import("threading") + SINGLE_SPACING
+    templates += make_import(
+        ".id",
+        [
+            "Unknown",
+            "_is_known",
+            "c_id",
+            "cov_id",
+            "hs_id",
+            "me_id",
+            "rei_id",
+            "s_id",
+            "scalar",
+        ],
     )
+    # Guards building deferred attributes so each is built exactly once.
+    templates += SINGLE_SPACING + "_DEFERRED_LOCK = threading.RLock()\n"
+    # Stands in for fields left out of the mapping when comparing records.
+    templates += "_MISSING = object()\n" + DOUBLE_SPACING
     templates += make_gbd_record()
+    templates += DOUBLE_SPACING
+    templates += make_gbd_collection()
 
     for entity, info in get_base_types().items():
         templates += DOUBLE_SPACING
         templates += make_record(entity, **info)
 
+    templates += DOUBLE_SPACING
+    templates += make_categories()
     return templates
@@ -1,3 +1,4 @@
+import ast
 import os
 import shutil
 import tempfile
@@ -14,6 +15,8 @@ from gbd_mapping_generator import (
     id_builder,
     risk_builder,
     sequela_builder,
+    slim_builder,
+    snapshot_builder,
 )
 
 AUTO_MAPPINGS = {
@@ -26,20 +29,35 @@ AUTO_MAPPINGS = {
     "covariate": covariate_builder,
 }
 
+# Mappings whose collections can be written either as tables of rows or as literals.
+TABLE_MAPPINGS = ("cause", "sequela", "etiology", "risk_factor", "covariate")
+
+SNAPSHOT = "snapshot"
+
 ROOT = Path(__file__).resolve().parent.parent.joinpath("gbd_mapping")  # type: Path
 
 
 @click.command()
 @click.argument("mapping_type", default="id")
+@click.option(
+    "--literal",
+    is_flag=True,
+    help="Write one constructor call per entity instead of a table of rows.",
+)
 @click.option("--pdb", "with_debugger", is_flag=True)
-def build_mapping(mapping_type, with_debugger):
-    if mapping_type not in AUTO_MAPPINGS:
+def build_mapping(mapping_type, literal, with_debugger):
+    if mapping_type not in AUTO_MAPPINGS and mapping_type != SNAPSHOT:
         raise ValueError(
             f"Unknown mapping type {mapping_type}. "
-            f"Mapping type must be one of {list(AUTO_MAPPINGS.keys())}"
+            f"Mapping type must be one of {list(AUTO_MAPPINGS.keys()) + [SNAPSHOT]}"
         )
 
     try:
+        if mapping_type == SNAPSHOT:
+            # Built from the generated modules, so run this after regenerating them.
+            snapshot_builder.write_snapshot()
+            return
+
         make_dirs_and_init(mapping_type)
 
         builder = AUTO_MAPPINGS[mapping_type]
@@ -48,8 +66,9 @@ def build_mapping(mapping_type, with_debugger):
             with ROOT.joinpath(f"{mapping_type}_template.py").open("w") as f:
                 f.write(builder.build_mapping_template())
 
+        kwargs = {"literal": literal} if mapping_type in TABLE_MAPPINGS else {}
         with ROOT.joinpath(f"{mapping_type}.py").open("w") as f:
-            f.write(builder.build_mapping())
+            f.write(builder.build_mapping(**kwargs))
     except (BdbQuit, KeyboardInterrupt):
         raise
     except Exception as e:
@@ -63,30 +82,79 @@ def build_mapping(mapping_type, with_debugger):
             raise
 
 
+@click.command()
+@click.argument("entity_names", nargs=-1, required=True)
+@click.option(
+    "-o",
+    "--output-dir",
+    required=True,
+    type=click.Path(file_okay=False),
+    help="Directory to write the slim gbd_mapping package into.",
+)
+def build_slim_mapping(entity_names, output_dir):
+    """Build a gbd_mapping package holding only ENTITY_NAMES and the entities they need.
+
+    ENTITY_NAMES are attribute names of causes, risk factors or other entities, e.g.
+    ``diarrheal_diseases unsafe_water_source``. Their parents, sub-entities and the
+    sequelae, etiologies and causes they refer to are included as well.
+    """
+    try:
+        package = slim_builder.build_slim_mapping(list(entity_names), output_dir)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="ENTITY_NAMES")
+    click.echo(f"Wrote {package}")
+
+
+def _exported_names(tree):
+    """Returns the names the package imports eagerly and the ones it exports lazily."""
+    imported, lazy = set(), set()
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom):
+            imported.update(alias.asname or alias.name for alias in node.names)
+        elif isinstance(node, ast.Assign) and isinstance(node.value, ast.Dict):
+            if any(getattr(target, "id", None) == "_LAZY_IMPORTS" for target in node.targets):
+                lazy.update(key.value for key in node.value.keys)
+    return imported, lazy
+
+
 def make_dirs_and_init(mapping_type):
     ROOT.mkdir(exist_ok=True)
     init_path = ROOT.joinpath("__init__.py")
 
-    init_stanza = f"from .{mapping_type} import {', '.join(AUTO_MAPPINGS[mapping_type].IMPORTABLES_DEFINED)}\n"
+    importables = AUTO_MAPPINGS[mapping_type].IMPORTABLES_DEFINED
+    init_stanza = f"from .{mapping_type} import {', '.join(importables)}\n"
 
     if not init_path.exists():  # Create a new init file
         with init_path.open("w") as init_file:
             init_file.write(init_stanza)
-    else:  # Replace the init_stanza if it exists, otherwise append it to the end of the file.
-        replaced = False
-
-        temp_file, temp_path = tempfile.mkstemp()
-        with open(temp_file, "w") as new_init_file:
-            with open(init_path) as old_init_file:
-                for line in old_init_file:
-                    if f"from .{mapping_type} import " in line:
-                        new_init_file.write(init_stanza)
-                        replaced = True
-                    else:
-                        new_init_file.write(line)
-
-                if not replaced:
-                    new_init_file.write(init_stanza)
-
-        os.remove(str(init_path))
-        shutil.move(temp_path, str(init_path))
+        return
+
+    source = init_path.read_text()
+    tree = ast.parse(source)
+    imported, lazy = _exported_names(tree)
+    if set(importables) <= imported | lazy:
+        # Already exported, either imported eagerly or through the package's __getattr__.
+        return
+
+    # Replace the whole import of the module, which may span several lines, otherwise
+    # append the init_stanza to the end of the file.
+    lines = source.splitlines(keepends=True)
+    for node in tree.body:
+        if (
+            isinstance(node, ast.ImportFrom)
+            and node.level == 1
+            and node.module == mapping_type
+        ):
+            lines[node.lineno - 1 : node.end_lineno] = [init_stanza]
+            break
+    else:
+        if lines and not lines[-1].endswith("\n"):
+            lines[-1] += "\n"
+        lines.append(init_stanza)
+
+    temp_file, temp_path = tempfile.mkstemp()
+    with open(temp_file, "w") as new_init_file:
+        new_init_file.writelines(lines)
+
+    os.remove(str(init_path))
+    shutil.move(temp_path, str(init_path))
@@ -1,4 +1,6 @@
 """Tools for automatically generating the GBD cause mapping."""
+from gbd_mapping._tables import CAUSE_FIELDS
+
 from .base_template_builder import gbd_record_attrs, modelable_entity_attrs
 from .data import get_cause_data, get_cause_list
 from .globals import ID_TYPES
@@ -7,17 +9,22 @@ from .util import (
     SINGLE_SPACING,
     TAB,
     TEXTWIDTH,
+    make_attribute_name,
     make_import,
     make_module_docstring,
     make_record,
+    make_rows,
     text_wrap,
+    to_builtin,
     to_id,
 )
 
 IMPORTABLES_DEFINED = ("Cause", "causes")
 
 
-def get_base_types():
+def get_base_types(names: list[str] | None = None):
+    if names is None:
+        names = get_cause_list()
     cause_attrs = [
         ("name", "str"),
         ("kind", "str"),
@@ -41,8 +48,8 @@ def get_base_types():
             "docstring": "Container for cause GBD ids and metadata",
         },
         "Causes": {
-            "attrs": tuple([(name, "Cause") for name in get_cause_list()]),
-            "superclass": ("GbdRecord", gbd_record_attrs),
+            "attrs": tuple([(name, "Cause") for name in names]),
+            "superclass": ("GbdCollection", gbd_record_attrs),
             "docstring": "Container for GBD causes.",
         },
     }
@@ -77,7 +84,7 @@ def make_cause(
                 if entity_name == "sub_causes":
                     item_name = f"causes.{item}, "
                 else:
-                    item_name = f"{entity_name}.{item}, "
+                    item_name = f"{entity_name}.{make_attribute_name(item)}, "
 
                 if char_count == offset:
                     out += item_name
@@ -139,26 +146,66 @@ def make_causes(causes_list):
     return out
 
 
-def build_mapping_template():
+def make_cause_rows(causes_list) -> list[tuple]:
+    rows = []
+    for (
+        name,
+        c_id,
+        me_id,
+        most_detailed,
+        cause_level,
+        parent,
+        restrictions,
+        sequelae,
+        etiologies,
+        sub_causes,
+    ) in causes_list:
+        rows.append(
+            (
+                name,
+                to_builtin(c_id),
+                to_builtin(me_id),
+                bool(most_detailed),
+                to_builtin(cause_level),
+                tuple(to_builtin(value) for _, value in restrictions),
+                tuple(sequelae or ()),
+                tuple(make_attribute_name(e) for e in etiologies or ()),
+                None if name == parent else parent,
+                tuple(s for s in sub_causes if s != name) if sub_causes else None,
+            )
+        )
+    return rows
+
+
+def build_mapping_template(names: list[str] | None = None):
     out = make_module_docstring("Mapping templates for GBD causes.", __file__)
     out += make_import("__future__", ("annotations",)) + "\n"
-    out += make_import(".base_template", ("GbdRecord", "ModelableEntity", "Restrictions"))
-    out += make_import(".etiology_template", ("Etiology",))
-    out += make_import(".id", ("Unknown", ID_TYPES.C_ID, ID_TYPES.ME_ID))
-    out += make_import(".sequela_template", ("Sequela",))
-
-    for entity, info in get_base_types().items():
+    out += make_import("typing", ("TYPE_CHECKING",)) + "\n"
+    out += make_import(".base_template", ("GbdCollection", "ModelableEntity", "Restrictions"))
+    out += make_import(".id", ("Unknown", ID_TYPES.C_ID, ID_TYPES.ME_ID)) + "\n"
+    # Only needed for annotations, importing them would import the sequela templates.
+    out += "if TYPE_CHECKING:\n"
+    out += "    " + make_import(".etiology_template", ("Etiology",))
+    out += "    " + make_import(".sequela_template", ("Sequela",))
+
+    for entity, info in get_base_types(names).items():
         out += DOUBLE_SPACING
         out += make_record(entity, **info)
     return out
 
 
-def build_mapping():
+def build_mapping(literal: bool = False):
     out = make_module_docstring("Mapping of GBD causes.", __file__)
-    out += make_import(".base_template", ("Restrictions",))
-    out += make_import(".cause_template", ("Cause", "Causes"))
-    out += make_import(".etiology", ("etiologies",))
-    out += make_import(".id", ("UNKNOWN", ID_TYPES.C_ID, ID_TYPES.ME_ID))
-    out += make_import(".sequela", ("sequelae",)) + SINGLE_SPACING
-    out += make_causes(get_cause_data())
+    if literal:
+        out += make_import(".base_template", ("Restrictions",))
+        out += make_import(".cause_template", ("Cause", "Causes"))
+        out += make_import(".etiology", ("etiologies",))
+        out += make_import(".id", ("UNKNOWN", ID_TYPES.C_ID, ID_TYPES.ME_ID))
+        out += make_import(".sequela", ("sequelae",)) + SINGLE_SPACING
+        out += make_causes(get_cause_data())
+        return out
+
+    out += make_import(".", ("_load_collection",)) + SINGLE_SPACING
+    out += make_rows("CAUSE_ROWS", CAUSE_FIELDS, make_cause_rows(get_cause_data()))
+    out += SINGLE_SPACING + 'causes = _load_collection("causes", CAUSE_ROWS)\n'
     return out
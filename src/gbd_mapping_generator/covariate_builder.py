@@ -1,3 +1,5 @@
+from gbd_mapping._tables import COVARIATE_FIELDS
+
 from .base_template_builder import gbd_record_attrs, modelable_entity_attrs
 from .data import get_covariate_data, get_covariate_list
 from .globals import ID_TYPES, CovariateDataSeq
@@ -8,12 +10,16 @@ from .util import (
     make_import,
     make_module_docstring,
     make_record,
+    make_rows,
+    to_builtin,
 )
 
 IMPORTABLES_DEFINED = ("Covariate", "covariates")
 
 
-def get_base_types():
+def get_base_types(names: list[str] | None = None):
+    if names is None:
+        names = get_covariate_list()
     cov_attrs = [
         ("name", "str"),
         ("kind", "str"),
@@ -30,8 +36,8 @@ def get_base_types():
             "docstring": "Container for covariate GBD ids and metadata.",
         },
         "Covariates": {
-            "attrs": tuple([(name, "Covariate") for name in get_covariate_list()]),
-            "superclass": ("GbdRecord", gbd_record_attrs),
+            "attrs": tuple([(name, "Covariate") for name in names]),
+            "superclass": ("GbdCollection", gbd_record_attrs),
             "docstring": "Container for GBD covariates.",
         },
     }
@@ -95,20 +101,48 @@ def make_covariates(covariate_list: CovariateDataSeq) -> str:
     return out
 
 
-def build_mapping_template():
+def make_covariate_rows(covariate_list: CovariateDataSeq) -> list[tuple]:
+    """Generates the table of covariate rows.
+
+    Parameters
+    ----------
+    covariate_list
+        Sequence of covariate data from which to generate the rows
+
+    Returns
+    -------
+    list[tuple]
+        One row of builtin values per covariate.
+
+    """
+    return [
+        (name, to_builtin(cov_id), bool(by_age), bool(by_sex), bool(dichotomous))
+        for name, cov_id, by_age, by_sex, dichotomous in covariate_list
+    ]
+
+
+def build_mapping_template(names: list[str] | None = None):
     out = make_module_docstring("Mapping templates for GBD covariates.", __file__)
-    out += make_import(".base_template", ("GbdRecord", "ModelableEntity"))
+    out += make_import(".base_template", ("GbdCollection", "ModelableEntity"))
     out += make_import(".id", (ID_TYPES.COV_ID,))
 
-    for entity, info in get_base_types().items():
+    for entity, info in get_base_types(names).items():
         out += DOUBLE_SPACING
         out += make_record(entity, **info)
     return out
 
 
-def build_mapping():
+def build_mapping(literal: bool = False):
     out = make_module_docstring("Mapping of GBD covariates.", __file__)
-    out += make_import(".covariate_template", ("Covariate", "Covariates"))
-    out += make_import(".id", (ID_TYPES.COV_ID,)) + SINGLE_SPACING
-    out += make_covariates(get_covariate_data())
+    if literal:
+        out += make_import(".covariate_template", ("Covariate", "Covariates"))
+        out += make_import(".id", (ID_TYPES.COV_ID,)) + SINGLE_SPACING
+        out += make_covariates(get_covariate_data())
+        return out
+
+    out += make_import(".", ("_load_collection",)) + SINGLE_SPACING
+    out += make_rows(
+        "COVARIATE_ROWS", COVARIATE_FIELDS, make_covariate_rows(get_covariate_data())
+    )
+    out += SINGLE_SPACING + 'covariates = _load_collection("covariates", COVARIATE_ROWS)\n'
     return out
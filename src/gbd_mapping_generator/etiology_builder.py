@@ -1,3 +1,5 @@
+from gbd_mapping._tables import ETIOLOGY_FIELDS
+
 from .base_template_builder import gbd_record_attrs, modelable_entity_attrs
 from .data import get_etiology_data, get_etiology_list
 from .globals import ID_TYPES
@@ -5,15 +7,20 @@ from .util import (
     DOUBLE_SPACING,
     SINGLE_SPACING,
     TAB,
+    make_attribute_name,
     make_import,
     make_module_docstring,
     make_record,
+    make_rows,
+    to_builtin,
 )
 
 IMPORTABLES_DEFINED = ("Etiology", "etiologies")
 
 
-def get_base_types():
+def get_base_types(names: list[str] | None = None):
+    if names is None:
+        names = get_etiology_list()
     etiology_attrs = [
         ("name", "str"),
         ("kind", "str"),
@@ -27,8 +34,8 @@ def get_base_types():
             "docstring": "Container for etiology GBD ids and metadata.",
         },
         "Etiologies": {
-            "attrs": tuple([(name, "Etiology") for name in get_etiology_list()]),
-            "superclass": ("GbdRecord", gbd_record_attrs),
+            "attrs": tuple([(make_attribute_name(name), "Etiology") for name in names]),
+            "superclass": ("GbdCollection", gbd_record_attrs),
             "docstring": "Container for GBD etiologies.",
         },
     }
@@ -36,7 +43,7 @@ def get_base_types():
 
 def make_etiology(name: str, rei_id: float) -> str:
     out = ""
-    out += TAB + f"{name}=Etiology(\n"
+    out += TAB + f"{make_attribute_name(name)}=Etiology(\n"
     out += TAB * 2 + f"name='{name}',\n"
     out += TAB * 2 + f"kind='etiology',\n"
     out += TAB * 2 + f"gbd_id={ID_TYPES.REI_ID}({rei_id}),\n"
@@ -52,20 +59,35 @@ def make_etiologies(etiology_list: list[tuple[str, float]]) -> str:
     return out
 
 
-def build_mapping_template() -> str:
+def make_etiology_rows(etiology_list: list[tuple[str, float]]) -> list[tuple]:
+    return [
+        (make_attribute_name(name), name, to_builtin(rei_id))
+        for name, rei_id in etiology_list
+    ]
+
+
+def build_mapping_template(names: list[str] | None = None) -> str:
     out = make_module_docstring("Mapping templates for GBD etiologies.", __file__)
-    out += make_import(".base_template", ("GbdRecord", "ModelableEntity"))
+    out += make_import(".base_template", ("GbdCollection", "ModelableEntity"))
     out += make_import(".id", (ID_TYPES.REI_ID,))
 
-    for entity, info in get_base_types().items():
+    for entity, info in get_base_types(names).items():
         out += DOUBLE_SPACING
         out += make_record(entity, **info)
     return out
 
 
-def build_mapping() -> str:
+def build_mapping(literal: bool = False) -> str:
     out = make_module_docstring("Mapping of GBD etiologies.", __file__)
-    out += make_import(".etiology_template", ("Etiologies", "Etiology"))
-    out += make_import(".id", (ID_TYPES.REI_ID,)) + SINGLE_SPACING
-    out += make_etiologies(get_etiology_data())
+    if literal:
+        out += make_import(".etiology_template", ("Etiologies", "Etiology"))
+        out += make_import(".id", (ID_TYPES.REI_ID,)) + SINGLE_SPACING
+        out += make_etiologies(get_etiology_data())
+        return out
+
+    out += make_import(".", ("_load_collection",)) + SINGLE_SPACING
+    out += make_rows(
+        "ETIOLOGY_ROWS", ETIOLOGY_FIELDS, make_etiology_rows(get_etiology_data())
+    )
+    out += SINGLE_SPACING + 'etiologies = _load_collection("etiologies", ETIOLOGY_ROWS)\n'
     return out
@@ -20,8 +20,15 @@ def make_unknown_flag():
     out += "class Unknown:\n"
     out += TAB + '"""Marker for unknown values."""\n'
     out += TAB + "def __repr__(self):\n"
+    out += 2 * TAB + 'return "UNKNOWN"\n\n'
+    # Unpickles as the module's UNKNOWN, so it can still be compared by identity.
+    out += TAB + "def __reduce__(self):\n"
     out += 2 * TAB + 'return "UNKNOWN"\n' + DOUBLE_SPACING
     out += "UNKNOWN = Unknown()\n" + DOUBLE_SPACING
+    out += "def _is_known(value):\n"
+    out += TAB + '"""Whether an id is known, i.e. neither ``None`` nor ``UNKNOWN``."""\n'
+    out += TAB + "return value is not None and not isinstance(value, Unknown)\n"
+    out += DOUBLE_SPACING
     out += "class UnknownEntityError(Exception):\n"
     out += (
         TAB
@@ -37,12 +44,26 @@ def build_mapping():
         out += DOUBLE_SPACING
         out += f"class {k}(int):\n"
         out += TAB + f'"""{v}"""\n'
+        out += TAB + "__slots__ = ()\n"
+        # Each id value is stored once per type, e.g. ids shared by many entities.
+        out += TAB + "_cache = {}\n\n"
+        # Takes the arguments of int, e.g. a string and its base, which aren't the value.
+        out += TAB + "def __new__(cls, value=0, *args, **kwargs):\n"
+        out += 2 * TAB + "if not args and not kwargs:\n"
+        out += 3 * TAB + "try:\n"
+        out += 4 * TAB + "return cls._cache[value]\n"
+        out += 3 * TAB + "except KeyError:\n"
+        out += 4 * TAB + "pass\n"
+        # Keyed by the new id itself, so the value it was made from isn't kept alive.
+        out += 2 * TAB + "new = super().__new__(cls, value, *args, **kwargs)\n"
+        out += 2 * TAB + "return cls._cache.setdefault(new, new)\n\n"
         out += TAB + "def __repr__(self):\n"
         out += 2 * TAB + f'return "{k}({{:d}})".format(self)\n'
 
     out += DOUBLE_SPACING
     out += "class scalar(float):\n"
     out += TAB + '"""Raw Measure Value"""\n'
+    out += TAB + "__slots__ = ()\n\n"
     out += TAB + "def __repr__(self):\n"
     out += 2 * TAB + 'return "scalar({:f})".format(self)\n'
     out += DOUBLE_SPACING
@@ -1,3 +1,5 @@
+from gbd_mapping._tables import RISK_FACTOR_FIELDS
+
 from .base_template_builder import gbd_record_attrs, modelable_entity_attrs
 from .data import get_risk_data, get_risk_list
 from .globals import ID_TYPES
@@ -10,13 +12,17 @@ from .util import (
     make_import,
     make_module_docstring,
     make_record,
+    make_rows,
     text_wrap,
+    to_builtin,
 )
 
 IMPORTABLES_DEFINED = ("RiskFactor", "risk_factors")
 
 
-def get_base_types():
+def get_base_types(names: list[str] | None = None):
+    if names is None:
+        names = get_risk_list()
     risk_attrs = [
         ("name", "str"),
         ("kind", "str"),
@@ -45,8 +51,8 @@ def get_base_types():
             "docstring": "Container for risk GBD ids and metadata.",
         },
         "RiskFactors": {
-            "attrs": tuple([(name, "RiskFactor") for name in get_risk_list()]),
-            "superclass": ("GbdRecord", gbd_record_attrs),
+            "attrs": tuple([(name, "RiskFactor") for name in names]),
+            "superclass": ("GbdCollection", gbd_record_attrs),
             "docstring": "Container for GBD risks.",
         },
     }
@@ -192,29 +198,95 @@ def make_risks(risk_list: list) -> str:
     return out
 
 
-def build_mapping_template():
+def make_risk_rows(risk_list: list) -> list[tuple]:
+    rows = []
+    for (
+        name,
+        rei_id,
+        most_detailed,
+        level,
+        paf_calculation_type,
+        affected_causes,
+        paf_of_one_causes,
+        distribution,
+        levels,
+        tmred,
+        scalar,
+        restrictions,
+        parent,
+        sub_risks,
+        affected_risks,
+    ) in risk_list:
+        is_root = name == parent
+        if tmred:
+            tmred = dict(tmred)
+            tmred = (
+                tmred["distribution"],
+                bool(tmred["inverted"]),
+                to_builtin(tmred["min"]),
+                to_builtin(tmred["max"]),
+            )
+        rows.append(
+            (
+                name,
+                to_builtin(rei_id),
+                to_builtin(level),
+                bool(most_detailed),
+                distribution,
+                paf_calculation_type,
+                tuple(to_builtin(value) for _, value in restrictions),
+                tuple(affected_causes),
+                tuple(paf_of_one_causes),
+                None if is_root else parent,
+                (
+                    tuple(r for r in sub_risks if r != name)
+                    if sub_risks and not is_root
+                    else None
+                ),
+                tuple(affected_risks) if affected_risks and not is_root else None,
+                tuple(levels) if levels else None,
+                tmred or None,
+                to_builtin(scalar) if scalar else None,
+            )
+        )
+    return rows
+
+
+def build_mapping_template(names: list[str] | None = None):
     out = make_module_docstring("Mapping templates for GBD risk factors.", __file__)
     out += make_import("__future__", ("annotations",)) + "\n"
+    out += make_import("typing", ("TYPE_CHECKING",)) + "\n"
     out += make_import(
         ".base_template",
-        ("Categories", "GbdRecord", "ModelableEntity", "Restrictions", "Tmred"),
+        ("Categories", "GbdCollection", "ModelableEntity", "Restrictions", "Tmred"),
     )
-    out += make_import(".cause_template", ("Cause",))
-    out += make_import(".id", (ID_TYPES.REI_ID, "scalar"))
+    out += make_import(".id", (ID_TYPES.REI_ID, "scalar")) + "\n"
+    # Only needed for annotations, importing it would import the cause templates.
+    out += "if TYPE_CHECKING:\n"
+    out += "    " + make_import(".cause_template", ("Cause",))
 
-    for entity, info in get_base_types().items():
+    for entity, info in get_base_types(names).items():
         out += DOUBLE_SPACING
         out += make_record(entity, **info)
     return out
 
 
-def build_mapping() -> str:
+def build_mapping(literal: bool = False) -> str:
     out = make_module_docstring("Mapping of GBD risk factors.", __file__)
-    out += make_import(".base_template", ("Categories", "Restrictions", "Tmred"))
-    out += make_import(".cause", ("causes",))
-    out += make_import(".id", (ID_TYPES.REI_ID, "scalar"))
+    if literal:
+        out += make_import(".base_template", ("Categories", "Restrictions", "Tmred"))
+        out += make_import(".cause", ("causes",))
+        out += make_import(".id", (ID_TYPES.REI_ID, "scalar"))
+        out += (
+            make_import(".risk_factor_template", ("RiskFactor", "RiskFactors"))
+            + SINGLE_SPACING
+        )
+        out += make_risks(get_risk_data())
+        return out
+
+    out += make_import(".", ("_load_collection",)) + SINGLE_SPACING
+    out += make_rows("RISK_FACTOR_ROWS", RISK_FACTOR_FIELDS, make_risk_rows(get_risk_data()))
     out += (
-        make_import(".risk_factor_template", ("RiskFactor", "RiskFactors")) + SINGLE_SPACING
+        SINGLE_SPACING + 'risk_factors = _load_collection("risk_factors", RISK_FACTOR_ROWS)\n'
     )
-    out += make_risks(get_risk_data())
     return out
@@ -1,3 +1,5 @@
+from gbd_mapping._tables import SEQUELA_FIELDS
+
 from .base_template_builder import gbd_record_attrs, modelable_entity_attrs
 from .data import get_sequela_data, get_sequela_list
 from .globals import ID_TYPES
@@ -8,13 +10,17 @@ from .util import (
     make_import,
     make_module_docstring,
     make_record,
+    make_rows,
+    to_builtin,
     to_id,
 )
 
 IMPORTABLES_DEFINED = ("Healthstate", "Sequela", "sequelae")
 
 
-def get_base_types():
+def get_base_types(names: list[str] | None = None):
+    if names is None:
+        names = get_sequela_list()
     sequela_attrs = [
         ("name", "str"),
         ("kind", "str"),
@@ -40,8 +46,8 @@ def get_base_types():
             "docstring": "Container for sequela GBD ids and metadata.",
         },
         "Sequelae": {
-            "attrs": tuple([(name, "Sequela") for name in get_sequela_list()]),
-            "superclass": ("GbdRecord", gbd_record_attrs),
+            "attrs": tuple([(name, "Sequela") for name in names]),
+            "superclass": ("GbdCollection", gbd_record_attrs),
             "docstring": "Container for GBD sequelae.",
         },
     }
@@ -73,23 +79,42 @@ def make_sequelae(sequela_list: list[str]) -> str:
     return out
 
 
-def build_mapping_template() -> str:
+def make_sequela_rows(sequela_list: list) -> list[tuple]:
+    return [
+        (
+            name,
+            to_builtin(sid),
+            to_builtin(mei_id),
+            None if hs_name == "nan" else hs_name,
+            to_builtin(hsid),
+        )
+        for name, sid, mei_id, hs_name, hsid in sequela_list
+    ]
+
+
+def build_mapping_template(names: list[str] | None = None) -> str:
     out = make_module_docstring("Mapping templates for GBD sequelae.", __file__)
-    out += make_import(".base_template", ("GbdRecord", "ModelableEntity"))
+    out += make_import(".base_template", ("GbdCollection", "ModelableEntity"))
     out += make_import(".id", (ID_TYPES.HS_ID, ID_TYPES.ME_ID, ID_TYPES.S_ID))
 
-    for entity, info in get_base_types().items():
+    for entity, info in get_base_types(names).items():
         out += DOUBLE_SPACING
         out += make_record(entity, **info)
     return out
 
 
-def build_mapping() -> str:
+def build_mapping(literal: bool = False) -> str:
     out = make_module_docstring("Mapping of GBD sequelae.", __file__)
-    out += make_import(".id", (ID_TYPES.HS_ID, ID_TYPES.ME_ID, ID_TYPES.S_ID))
-    out += (
-        make_import(".sequela_template", ("Healthstate", "Sequela", "Sequelae"))
-        + SINGLE_SPACING
-    )
-    out += make_sequelae(get_sequela_data())
+    if literal:
+        out += make_import(".id", (ID_TYPES.HS_ID, ID_TYPES.ME_ID, ID_TYPES.S_ID))
+        out += (
+            make_import(".sequela_template", ("Healthstate", "Sequela", "Sequelae"))
+            + SINGLE_SPACING
+        )
+        out += make_sequelae(get_sequela_data())
+        return out
+
+    out += make_import(".", ("_load_collection",)) + SINGLE_SPACING
+    out += make_rows("SEQUELA_ROWS", SEQUELA_FIELDS, make_sequela_rows(get_sequela_data()))
+    out += SINGLE_SPACING + 'sequelae = _load_collection("sequelae", SEQUELA_ROWS)\n'
     return out
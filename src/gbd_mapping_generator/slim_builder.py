@@ -0,0 +1,251 @@
+"""Tools for building a slim copy of the mapping that only holds a model's entities."""
+
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+from gbd_mapping import _snapshot, _tables
+
+from . import (
+    cause_builder,
+    covariate_builder,
+    etiology_builder,
+    risk_builder,
+    sequela_builder,
+)
+from .util import SINGLE_SPACING, make_import, make_module_docstring, make_rows
+
+# Modules copied unchanged from the full mapping.
+SHARED_MODULES = (
+    "__init__",
+    "_arrays",
+    "_index",
+    "_profile",
+    "_snapshot",
+    "_tables",
+    "id",
+    "base_template",
+)
+
+# Collection name -> (builder, description, rows variable, fields).
+COLLECTION_MODULES = {
+    "sequelae": (
+        sequela_builder,
+        "Mapping of GBD sequelae.",
+        "SEQUELA_ROWS",
+        _tables.SEQUELA_FIELDS,
+    ),
+    "etiologies": (
+        etiology_builder,
+        "Mapping of GBD etiologies.",
+        "ETIOLOGY_ROWS",
+        _tables.ETIOLOGY_FIELDS,
+    ),
+    "covariates": (
+        covariate_builder,
+        "Mapping of GBD covariates.",
+        "COVARIATE_ROWS",
+        _tables.COVARIATE_FIELDS,
+    ),
+    "causes": (
+        cause_builder,
+        "Mapping of GBD causes.",
+        "CAUSE_ROWS",
+        _tables.CAUSE_FIELDS,
+    ),
+    "risk_factors": (
+        risk_builder,
+        "Mapping of GBD risk factors.",
+        "RISK_FACTOR_ROWS",
+        _tables.RISK_FACTOR_FIELDS,
+    ),
+}
+
+# Collection name -> {row field linking to other entities: collection linked to}.
+LINKS = {
+    "causes": {"sequelae": "sequelae", "etiologies": "etiologies", "sub_causes": "causes"},
+    "risk_factors": {
+        "affected_causes": "causes",
+        "population_attributable_fraction_of_one_causes": "causes",
+        "sub_risk_factors": "risk_factors",
+        "affected_risk_factors": "risk_factors",
+    },
+}
+SUB_ENTITIES = ("sub_causes", "sub_risk_factors")
+# Kept whole on every selected cause, so they never look empty when they are not.
+CAUSE_PARTS = ("sequelae", "etiologies")
+REFERENCES = (
+    "parent",
+    "sequelae",
+    "etiologies",
+    "affected_causes",
+    "population_attributable_fraction_of_one_causes",
+)
+
+
+def _load_collections() -> dict:
+    import gbd_mapping
+
+    return {name: getattr(gbd_mapping, name) for name in _snapshot.COLLECTIONS}
+
+
+def _references(record, attributes):
+    for attribute in attributes:
+        value = getattr(record, attribute, None)
+        if value is None:
+            continue
+        yield from value if isinstance(value, tuple) else (value,)
+
+
+def _add_closure(selected: dict, records: list, attributes: tuple[str, ...]) -> None:
+    pending = list(records)
+    while pending:
+        for reference in _references(pending.pop(), attributes):
+            if id(reference) not in selected:
+                selected[id(reference)] = reference
+                pending.append(reference)
+
+
+def select_entities(entity_names: list[str]) -> dict[str, list[str]]:
+    """Find every entity a slim mapping needs to support the given entities.
+
+    The given entities and all of their sub-entities are selected along with the
+    parents, sequelae, etiologies and causes they refer to. Entities only selected
+    because they are referred to bring their parents along, but not their own
+    sub-entities or causes. Every selected cause brings all of its sequelae and
+    etiologies.
+
+    Bringing every linked entity along would bring the whole mapping, as every entity
+    is linked to the root of its hierarchy and the root to all of its descendants.
+    Links to entities that are not selected are left out of the slim mapping instead,
+    see :func:`build_slim_mapping`.
+
+    Parameters
+    ----------
+    entity_names
+        Attribute names of entities in any collection, e.g. ``"diarrheal_diseases"``.
+
+    Returns
+    -------
+    dict[str, list[str]]
+        The attribute names of the selected entities in each collection, in the order of
+        the full mapping.
+
+    Raises
+    ------
+    ValueError
+        If a name is not an entity in the mapping.
+
+    """
+    collections = _load_collections()
+    records = {}
+    for collection in collections.values():
+        records.update(zip(collection.__slots__, collection))
+    unknown = sorted(set(entity_names) - set(records))
+    if unknown:
+        raise ValueError(f"Unknown entities: {unknown}.")
+
+    selected = {id(records[name]): records[name] for name in entity_names}
+    _add_closure(selected, list(selected.values()), SUB_ENTITIES)
+    for record in list(selected.values()):
+        for reference in _references(record, REFERENCES):
+            selected.setdefault(id(reference), reference)
+    _add_closure(selected, list(selected.values()), ("parent",))
+    for record in list(selected.values()):
+        for reference in _references(record, CAUSE_PARTS):
+            selected.setdefault(id(reference), reference)
+
+    return {
+        name: [key for key, record in zip(c.__slots__, c) if id(record) in selected]
+        for name, c in collections.items()
+    }
+
+
+def _select_rows(name: str, collection, selected: dict[str, list[str]], keys: dict):
+    # Links to any entity that is not selected are left out whole, never cut short.
+    fields = COLLECTION_MODULES[name][3]
+    links = [
+        (fields.index(field), set(selected[linked]))
+        for field, linked in LINKS.get(name, {}).items()
+    ]
+    rows = []
+    records = [getattr(collection, key) for key in selected[name]]
+    for row in _snapshot._TO_ROWS[name](records, keys):
+        row = list(row)
+        for i, kept in links:
+            if row[i] is not None and not kept.issuperset(row[i]):
+                row[i] = _tables.LEFT_OUT
+        rows.append(tuple(row))
+    return rows
+
+
+def make_collection_module(name: str, rows: list[tuple]) -> str:
+    """Generate a data module that builds a collection from its rows."""
+    builder, description, rows_name, fields = COLLECTION_MODULES[name]
+    out = make_module_docstring(description, builder.__file__)
+    out += make_import(".", ("_load_collection",)) + SINGLE_SPACING
+    out += make_rows(rows_name, fields, rows)
+    out += SINGLE_SPACING + f'{name} = _load_collection("{name}", {rows_name})\n'
+    return out
+
+
+def build_slim_mapping(entity_names: list[str], output_dir: str | Path) -> Path:
+    """Write a slim mapping package holding only the entities a model needs.
+
+    The package has the same API as ``gbd_mapping``, including its snapshot, but its
+    collections only hold the entities found by :func:`select_entities`.
+
+    A link of an entity that refers to any entity the slim mapping doesn't hold, e.g.
+    the ``sub_causes`` of a cause only held as a parent, is left out. Accessing it
+    raises an ``AttributeError`` rather than giving part of the links, and it is
+    skipped by ``to_dict``. Every other link is the same as in the full mapping.
+
+    Parameters
+    ----------
+    entity_names
+        Attribute names of the entities the model uses.
+    output_dir
+        Directory to write the ``gbd_mapping`` package into. Put it first on the
+        ``PYTHONPATH`` of the model to use the slim mapping instead of the full one.
+
+    Returns
+    -------
+    Path
+        The path of the written package.
+
+    """
+    import gbd_mapping
+
+    selected = select_entities(entity_names)
+    collections = _load_collections()
+    keys = _tables.attribute_names(*collections.values())
+
+    source = Path(gbd_mapping.__file__).parent
+    package = Path(output_dir).joinpath("gbd_mapping")
+    package.mkdir(parents=True, exist_ok=True)
+    for module in SHARED_MODULES:
+        shutil.copyfile(source.joinpath(f"{module}.py"), package.joinpath(f"{module}.py"))
+    package.joinpath("_version.py").write_text(f'__version__ = "{gbd_mapping.__version__}"\n')
+
+    for name, (builder, *_) in COLLECTION_MODULES.items():
+        module = _snapshot.COLLECTIONS[name]
+        rows = _select_rows(name, collections[name], selected, keys)
+        package.joinpath(f"{module}_template.py").write_text(
+            builder.build_mapping_template(selected[name])
+        )
+        package.joinpath(f"{module}.py").write_text(make_collection_module(name, rows))
+
+    # The snapshot digests the new modules, so it is written by the new package itself.
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; sys.path.insert(0, sys.argv[1]);"
+            "from gbd_mapping_generator import snapshot_builder;"
+            "snapshot_builder.write_snapshot()",
+            str(output_dir),
+        ],
+        check=True,
+    )
+    return package
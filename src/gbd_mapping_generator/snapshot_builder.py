@@ -0,0 +1,59 @@
+"""Tools for writing the binary snapshot of the generated GBD mapping."""
+
+import importlib
+import os
+import tempfile
+
+from gbd_mapping import _snapshot
+
+SNAPSHOT_FILE = _snapshot.SNAPSHOT_FILE
+
+# Collection name -> rows variable of its generated module.
+ROW_VARIABLES = {
+    "sequelae": "SEQUELA_ROWS",
+    "etiologies": "ETIOLOGY_ROWS",
+    "covariates": "COVARIATE_ROWS",
+    "causes": "CAUSE_ROWS",
+    "risk_factors": "RISK_FACTOR_ROWS",
+}
+
+
+def build_snapshot() -> bytes:
+    """Generate the binary snapshot from the generated mapping modules.
+
+    The collections are always built from the rows of the generated modules, never
+    loaded from an existing snapshot, so the result reflects the current sources.
+
+    Returns
+    -------
+    bytes
+        The serialized snapshot.
+
+    """
+    collections = {}
+    # Collections only refer to ones built before them.
+    for name, module in _snapshot.COLLECTIONS.items():
+        rows = getattr(importlib.import_module(f"gbd_mapping.{module}"), ROW_VARIABLES[name])
+        collections[name] = _snapshot.build_collection(name, rows, collections.get)
+    return _snapshot.dumps(collections)
+
+
+def write_snapshot():
+    """Write the snapshot next to the generated mapping modules it is built from.
+
+    Processes using the mapping memory map the snapshot, so it is never changed in place.
+    The new snapshot is written to a temporary file that then replaces the old one, which
+    those processes keep reading until they exit.
+    """
+    data = build_snapshot()
+    fd, temp_path = tempfile.mkstemp(prefix=f".{SNAPSHOT_FILE}.", dir=_snapshot._ROOT)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, _snapshot._ROOT.joinpath(SNAPSHOT_FILE))
+    except BaseException:
+        os.remove(temp_path)
+        raise
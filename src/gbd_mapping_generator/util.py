@@ -1,5 +1,7 @@
 import os
+import pprint
 import re
+import textwrap
 from pathlib import Path
 from typing import Any
 
@@ -192,6 +194,75 @@ def to_id(number: float, id_type: str) -> str:
         return id_type + f"({int(number)})"
 
 
+def to_builtin(value: Any) -> Any:
+    """Convert numpy scalars to their builtin equivalent, mapping NaN to None.
+
+    Parameters
+    ----------
+    value
+        The value to convert.
+
+    Returns
+    -------
+    Any
+        A value whose repr is a valid python literal.
+
+    """
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (bool, np.bool_)):
+        return bool(value)
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    if isinstance(value, (float, np.floating)):
+        return None if np.isnan(value) else float(value)
+    return value
+
+
+def make_attribute_name(name: str) -> str:
+    """Strip characters that are not valid in a python identifier from an entity name.
+
+    Parameters
+    ----------
+    name
+        A cleaned entity name.
+
+    Returns
+    -------
+    str
+        The name under which the entity is stored in its collection.
+
+    """
+    return re.sub(r"\W", "", name)
+
+
+def make_rows(name: str, fields: tuple[str, ...], rows: list[tuple]) -> str:
+    """Generate a module level table of rows of builtin values.
+
+    Parameters
+    ----------
+    name
+        Name of the generated variable.
+    fields
+        Names of the row fields, written as a comment above the table.
+    rows
+        The rows of the table.
+
+    Returns
+    -------
+    str
+        String representation of the table.
+
+    """
+    out = "".join(f"# {line}\n" for line in textwrap.wrap(", ".join(fields), TEXTWIDTH - 2))
+    out += f"{name} = (\n"
+    for row in rows:
+        row = pprint.pformat(row, width=TEXTWIDTH - len(TAB), compact=True)
+        out += textwrap.indent(row, TAB) + ",\n"
+    out += ")\n"
+    return out
+
+
 def make_class_sig(name, superclass=None, docstring=None) -> str:
     """Generate class signature from a name and additional information.
 
@@ -1,8 +1,17 @@
+import json
+import platform
+
 import pytest
 
 
 def pytest_addoption(parser):
     parser.addoption("--runslow", action="store_true", default=False, help="run slow tests")
+    parser.addoption(
+        "--benchmark-json",
+        action="store",
+        default=None,
+        help="write benchmark results as JSON to this path",
+    )
 
 
 def pytest_configure(config):
@@ -17,3 +26,19 @@ def pytest_collection_modifyitems(config, items):
     for item in items:
         if "slow" in item.keywords:
             item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
+def benchmark_results(request):
+    """Collects benchmark measurements and writes them to ``--benchmark-json``."""
+    results = {}
+    yield results
+    path = request.config.getoption("--benchmark-json")
+    if path and results:
+        report = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "results": results,
+        }
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
@@ -1,4 +1,14 @@
-from gbd_mapping.base_template import GbdRecord
+import gc
+import io
+import json
+import pickle
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from gbd_mapping.base_template import Categories, GbdCollection, GbdRecord, ModelableEntity
+from gbd_mapping.id import UNKNOWN, c_id
 
 
 class TestGbdRecord(GbdRecord):
@@ -15,3 +25,231 @@ def test_to_dict():
     record2 = TestGbdRecord(name="record2", parent=record)
     record.parent = record2
     record.to_dict()
+
+
+def test_deferred_attributes_are_built_once():
+    calls = []
+
+    def resolve(value):
+        calls.append(value)
+        return TestGbdRecord(name=value)
+
+    record = TestGbdRecord._from_deferred(resolve, {"name": "record1"})
+    record._defer("parent", resolve, "record2")
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        parents = list(executor.map(lambda _: record.parent, range(32)))
+
+    assert all(parent is parents[0] for parent in parents)
+    assert record.name.name == "record1"
+    assert sorted(calls) == ["record1", "record2"]
+    assert not record._deferred
+    with pytest.raises(AttributeError):
+        record.missing
+
+
+def test_subclasses_need_not_call_init():
+    class Plain(GbdRecord):
+        __slots__ = ("name",)
+
+        def __init__(self, name):
+            self.name = name
+
+    record = Plain("a")
+    hash(record)
+    record.name = "b"
+    del record.name
+    record.name = "c"
+    record._freeze()
+
+    with pytest.raises(AttributeError, match="frozen"):
+        record.name = "d"
+
+
+def test_contains_and_getitem():
+    record = TestGbdRecord(name="record1")
+
+    assert TestGbdRecord._fields == frozenset(TestGbdRecord.__slots__)
+    assert "parent" in record and "missing" not in record and ["name"] not in record
+    assert record["name"] == "record1"
+    with pytest.raises(KeyError):
+        record["missing"]
+
+
+class LinkedRecord(GbdRecord):
+    __slots__ = ("name", "links")
+
+    def __init__(self, name, links=()):
+        super().__init__()
+        self.name = name
+        self.links = links
+
+
+def test_to_dict_cycles_and_depth():
+    a, b = LinkedRecord("a"), LinkedRecord("b")
+    a.links, b.links = (b,), (a,)
+
+    assert a.to_dict() == {"name": "a", "links": ({"name": "b", "links": ("a",)},)}
+    assert b.to_dict() == {"name": "b", "links": ({"name": "a", "links": ("b",)},)}
+    assert a.to_dict(max_depth=0) == {"name": "a", "links": ("b",)}
+    assert a.to_dict() is not a.to_dict()
+
+
+def test_to_dict_results_are_independent():
+    shared = LinkedRecord("shared")
+    x, y = LinkedRecord("x", (shared,)), LinkedRecord("y", (shared,))
+    record = LinkedRecord("record", (x, y))
+    for r in (shared, x, y, record):
+        r._freeze()
+    x_dict, y_dict = record.to_dict()["links"]
+    # Within one result a nested record's dictionary is shared.
+    assert x_dict["links"][0] is y_dict["links"][0]
+    x_dict["links"][0]["name"] = "changed"
+
+    assert record.to_dict()["links"][0]["links"][0]["name"] == "shared"
+    assert x.to_dict()["links"][0]["name"] == "shared"
+    assert shared.to_dict() == {"name": "shared", "links": ()}
+
+
+def test_to_dict_is_only_cached_for_frozen_records():
+    record = ModelableEntity(name="a", kind="cause", gbd_id=None)
+    parent = LinkedRecord("parent", (record,))
+    parent._freeze()
+    record.to_dict(), parent.to_dict()
+    record.name = "b"
+
+    assert record.to_dict()["name"] == "b"
+    assert parent.to_dict()["links"][0]["name"] == "b"
+
+
+def test_to_dict_is_iterative():
+    record = LinkedRecord("0")
+    for i in range(1, 5000):
+        record = LinkedRecord(str(i), (record,))
+
+    out = record.to_dict()
+    for _ in range(4999):
+        out = out["links"][0]
+    assert out == {"name": "0", "links": ()}
+
+
+def test_frozen_records_hash_by_kind_and_id():
+    record = ModelableEntity(name="a", kind="cause", gbd_id=c_id(1))
+    record.name = "b"
+    record._freeze()
+
+    assert hash(record) == hash(("cause", c_id(1)))
+    assert {record: 1}[ModelableEntity(name="b", kind="cause", gbd_id=c_id(1))] == 1
+    assert record != ModelableEntity(name="b", kind="cause", gbd_id=c_id(2))
+    assert record != ModelableEntity(name="b", kind="sequela", gbd_id=c_id(1))
+    assert hash(ModelableEntity(name="c", kind="healthstate", gbd_id=UNKNOWN)) == hash(
+        ("healthstate", "c")
+    )
+    with pytest.raises(AttributeError, match="frozen"):
+        record.name = "c"
+    with pytest.raises(AttributeError, match="frozen"):
+        del record.name
+
+
+def test_eq_compares_links_by_identity():
+    a, b = LinkedRecord("a"), LinkedRecord("b")
+    a.links, b.links = (b,), (a,)
+    a2, b2 = LinkedRecord("a"), LinkedRecord("b")
+    a2.links, b2.links = (b2,), (a2,)
+
+    assert a == a2 and b == b2  # Cycles don't recurse.
+    assert a != LinkedRecord("a", (LinkedRecord("c"),))
+    assert a != LinkedRecord("a") and a != TestGbdRecord(name="a")
+    assert LinkedRecords(a, b) == LinkedRecords(a2, b2)
+    assert LinkedRecords(a, b) != LinkedRecords(a2, LinkedRecord("b"))
+
+
+def test_records_outside_the_mapping_pickle_by_value():
+    a, b = LinkedRecord("a"), LinkedRecord("b", (TestGbdRecord(name=UNKNOWN),))
+    a.links, b.links = (b,), (*b.links, a)
+    a._freeze()
+
+    a2 = pickle.loads(pickle.dumps(a))
+    assert a2 == a and a2.links[0].links[1] is a2
+    assert a2.links[0].links[0].name is UNKNOWN
+    with pytest.raises(AttributeError, match="frozen"):
+        a2.name = "c"
+
+
+class LinkedRecords(GbdCollection):
+    __slots__ = ("a", "b")
+
+    def __init__(self, a, b):
+        super().__init__()
+        self.a = a
+        self.b = b
+
+
+def test_write_json():
+    a = LinkedRecord("a", (TestGbdRecord(name=UNKNOWN),))
+    b = LinkedRecord("b", (a,))
+    a.links += (b,)
+    records = LinkedRecords(a, b)
+    expected = {"a": {"name": "a", "links": [None, "b"]}, "b": {"name": "b", "links": ["a"]}}
+
+    f = io.StringIO()
+    records.write_json(f)
+    assert json.loads(f.getvalue()) == expected
+
+    f = io.StringIO()
+    records.write_json(f, lines=True)
+    assert [json.loads(line) for line in f.getvalue().splitlines()] == list(expected.values())
+
+
+def test_categories():
+    categories = Categories(cat10="c", cat2="b", cat1="a", cat3=None)
+
+    assert categories.codes == ("cat1", "cat2", "cat10")
+    assert list(categories) == ["a", "b", "c"] and len(categories) == 3
+    assert categories.cat10 == categories["cat10"] == "c"
+    assert categories.cat3 is categories["cat3"] is None
+    assert categories.code("b") == "cat2"
+    assert "cat2" in categories and "cat3" in categories and "level1" not in categories
+    assert "cat3" not in categories.codes
+    assert categories.to_dict() == {"cat1": "a", "cat2": "b", "cat10": "c"}
+    assert categories == Categories(cat1="a", cat2="b", cat10="c")
+    assert categories != Categories(cat1="a", cat2="b", cat11="c")
+    with pytest.raises(KeyError):
+        categories.code("d")
+    with pytest.raises(KeyError):
+        categories["level1"]
+    with pytest.raises(TypeError):
+        Categories(level1="a")
+    assert pickle.loads(pickle.dumps(categories)).code("c") == "cat10"
+
+
+def test_categories_categorical_dtype():
+    categories = Categories(cat10="c", cat2="b", cat1="a")
+
+    dtype = categories.categorical_dtype()
+    assert list(dtype.categories) == ["cat1", "cat2", "cat10"] and not dtype.ordered
+    assert list(categories.categorical_dtype(labels=True).categories) == ["a", "b", "c"]
+    assert Categories(cat1="a", cat2="b", cat10="c").categorical_dtype() is dtype
+
+
+def test_records_are_weakly_referenceable():
+    record = ModelableEntity(name="a", kind="cause", gbd_id=c_id(1))
+    record._freeze()
+    cache = weakref.WeakKeyDictionary({record: "derived"})
+
+    assert cache[record] == "derived" and weakref.ref(record)() is record
+    del record
+    gc.collect()
+    assert not cache
+
+
+def test_collection_by_id():
+    known = ModelableEntity(name="a", kind="cause", gbd_id=c_id(1))
+    unknown = ModelableEntity(name="b", kind="cause", gbd_id=UNKNOWN)
+    records = LinkedRecords(known, unknown)
+
+    assert records.by_id(1) is records.by_id(c_id(1)) is known
+    assert records.by_ids([c_id(1), 1]) == (known, known)
+    with pytest.raises(KeyError):
+        records.by_id(UNKNOWN)
+    with pytest.raises(KeyError):
+        records.by_ids([1, 2])
@@ -0,0 +1,258 @@
+"""Import-time, memory and lookup benchmarks for the generated mapping.
+
+These are slow and only run with ``--runslow``. Add ``--benchmark-json=PATH`` to write
+the measurements as JSON, e.g.::
+
+    pytest tests/test_benchmarks.py --runslow --benchmark-json=benchmarks.json
+
+Import and memory measurements run in fresh interpreters so each one sees a cold
+package. All measurements use the checked-in mapping and need no network access.
+
+Each measurement fails if it is worse than in ``benchmark_baseline.json`` by more than
+the tolerance of its group, a factor that leaves room for slower machines. After a
+deliberate change, update the baseline from the results of ``--benchmark-json``.
+"""
+import importlib
+import json
+import os
+import subprocess
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+pytestmark = pytest.mark.slow
+
+REPEATS = 5
+
+BASELINE = json.loads(Path(__file__).with_name("benchmark_baseline.json").read_text())
+
+MODULES = [
+    "id",
+    "base_template",
+    "sequela_template",
+    "sequela",
+    "etiology_template",
+    "etiology",
+    "covariate_template",
+    "covariate",
+    "cause_template",
+    "cause",
+    "risk_factor_template",
+    "risk_factor",
+]
+COLLECTIONS = ["sequelae", "etiologies", "covariates", "causes", "risk_factors"]
+
+# Module import times include importing the ``gbd_mapping`` package itself.
+_IMPORT_TIME = """
+import importlib, json, time
+start = time.perf_counter()
+importlib.import_module({module!r})
+print(json.dumps({{"seconds": time.perf_counter() - start}}))
+"""
+
+_COLLECTION_MEMORY = """
+import json, os, time, tracemalloc
+import gbd_mapping
+
+def rss():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+if {traced}:
+    tracemalloc.start()
+else:
+    before = rss()
+start = time.perf_counter()
+records = list(getattr(gbd_mapping, {name!r}))
+seconds = time.perf_counter() - start
+if {traced}:
+    print(json.dumps({{"allocated_bytes": tracemalloc.get_traced_memory()[0]}}))
+else:
+    result = {{"rss_bytes": rss() - before, "seconds": seconds, "records": len(records)}}
+    print(json.dumps(result))
+"""
+
+# Memory a forked worker stops sharing with its parent once it runs a garbage collection.
+_FORKED_WORKER_MEMORY = """
+import gc, json, os
+import gbd_mapping
+
+def private_dirty():
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            if line.startswith("Private_Dirty:"):
+                return int(line.split()[1]) * 1024
+
+if {sealed}:
+    gbd_mapping.seal()
+else:
+    for name in ("sequelae", "etiologies", "covariates", "causes", "risk_factors"):
+        list(getattr(gbd_mapping, name))
+    gc.collect()
+read, write = os.pipe()
+if os.fork() == 0:
+    before = private_dirty()
+    gc.collect()
+    os.write(write, str(private_dirty() - before).encode())
+    os._exit(0)
+os.wait()
+print(json.dumps({{"private_dirty_bytes": int(os.read(read, 64))}}))
+"""
+
+
+def _run(code):
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout)
+
+
+def _best(code, key):
+    return min(_run(code)[key] for _ in range(REPEATS))
+
+
+def _check(value, group, key, metric=None):
+    # Rates must not drop below the baseline divided by the tolerance, everything else
+    # must not rise above the baseline times the tolerance.
+    baseline = BASELINE["results"][group][key]
+    name = group
+    if metric is not None:
+        baseline = baseline[metric]
+        name = f"{group}.{metric}"
+    tolerance = BASELINE["tolerances"][name]
+    message = f"{name} of {key} is {value:.3g}, the baseline is {baseline} ({tolerance}x)"
+    if group.endswith("_per_second"):
+        assert value >= baseline / tolerance, message
+    else:
+        assert value <= baseline * tolerance, message
+
+
+@pytest.mark.parametrize("module", MODULES)
+def test_cold_import_time(benchmark_results, module):
+    seconds = _best(_IMPORT_TIME.format(module=f"gbd_mapping.{module}"), "seconds")
+    benchmark_results.setdefault("import_seconds", {})[module] = seconds
+    _check(seconds, "import_seconds", module)
+
+
+def test_package_import_time(benchmark_results):
+    seconds = _best(_IMPORT_TIME.format(module="gbd_mapping"), "seconds")
+    benchmark_results.setdefault("import_seconds", {})["gbd_mapping"] = seconds
+    _check(seconds, "import_seconds", "gbd_mapping")
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads /proc/self/statm")
+@pytest.mark.parametrize("name", COLLECTIONS)
+def test_collection_memory(benchmark_results, name):
+    result = min(
+        (_run(_COLLECTION_MEMORY.format(name=name, traced=False)) for _ in range(REPEATS)),
+        key=lambda r: r["seconds"],
+    )
+    result.update(_run(_COLLECTION_MEMORY.format(name=name, traced=True)))
+    benchmark_results.setdefault("collections", {})[name] = result
+    assert result["records"] > 0
+    for metric in ("seconds", "rss_bytes", "allocated_bytes"):
+        _check(result[metric], "collections", name, metric)
+
+
+@pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="reads /proc/self/smaps_rollup"
+)
+@pytest.mark.parametrize("sealed", [False, True])
+def test_forked_worker_memory(benchmark_results, sealed):
+    code = _FORKED_WORKER_MEMORY.format(sealed=sealed)
+    dirty = _best(code, "private_dirty_bytes")
+    key = "sealed" if sealed else "unsealed"
+    benchmark_results.setdefault("forked_worker_private_dirty_bytes", {})[key] = dirty
+    _check(dirty, "forked_worker_private_dirty_bytes", key)
+
+
+@pytest.mark.parametrize(
+    "name, statement",
+    [
+        ("collection_attribute", "causes.tuberculosis"),
+        ("record_attribute", "tuberculosis.gbd_id"),
+        ("record_getitem", "tuberculosis['gbd_id']"),
+        ("contains", "'tuberculosis' in causes"),
+    ],
+)
+def test_lookup_latency(benchmark_results, name, statement):
+    import gbd_mapping
+
+    namespace = {
+        "causes": gbd_mapping.causes,
+        "tuberculosis": gbd_mapping.causes.tuberculosis,
+    }
+    number = 100_000
+    seconds = min(timeit.repeat(statement, globals=namespace, number=number, repeat=REPEATS))
+    benchmark_results.setdefault("lookup_ns", {})[name] = seconds / number * 1e9
+    _check(seconds / number * 1e9, "lookup_ns", name)
+
+
+@pytest.mark.parametrize("name", ["causes", "risk_factors", "sequelae"])
+def test_to_dict_throughput(benchmark_results, name):
+    import gbd_mapping
+
+    records = list(getattr(gbd_mapping, name))
+    # The first repeat also builds deferred attributes, taking the best one excludes that.
+    seconds = min(
+        timeit.repeat(lambda: [r.to_dict() for r in records], number=1, repeat=REPEATS)
+    )
+    benchmark_results.setdefault("to_dict_per_second", {})[name] = len(records) / seconds
+    _check(len(records) / seconds, "to_dict_per_second", name)
+
+
+@pytest.mark.parametrize("name", ["causes", "risk_factors", "sequelae"])
+def test_write_json_peak_memory(benchmark_results, name):
+    import gbd_mapping
+
+    collection = getattr(gbd_mapping, name)
+    with open(os.devnull, "w") as f:
+        collection.write_json(f)
+        tracemalloc.start()
+        collection.write_json(f)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    benchmark_results.setdefault("write_json_peak_bytes", {})[name] = peak
+    _check(peak, "write_json_peak_bytes", name)
+
+
+@pytest.mark.parametrize(
+    "name, rows, build",
+    [
+        ("causes", "CAUSE_ROWS", "build_causes"),
+        ("risk_factors", "RISK_FACTOR_ROWS", "build_risk_factors"),
+        ("sequelae", "SEQUELA_ROWS", "build_sequelae"),
+    ],
+)
+def test_collection_eq_latency(benchmark_results, name, rows, build):
+    import gbd_mapping
+    from gbd_mapping import _snapshot, _tables
+
+    collection = getattr(gbd_mapping, name)
+    module = importlib.import_module(f"gbd_mapping.{_snapshot.COLLECTIONS[name]}")
+    # A separately built copy, so no entity is shared between the two.
+    copy = getattr(_tables, build)(getattr(module, rows))
+    seconds = min(timeit.repeat(lambda: collection == copy, number=1, repeat=REPEATS))
+    benchmark_results.setdefault("collection_eq_seconds", {})[name] = seconds
+    _check(seconds, "collection_eq_seconds", name)
+    assert collection == copy
+
+
+@pytest.mark.parametrize("name", ["causes", "sequelae"])
+def test_id_translation_throughput(benchmark_results, name):
+    import numpy as np
+
+    import gbd_mapping
+
+    collection = getattr(gbd_mapping, name)
+    known = [entity.gbd_id for entity in collection]
+    ids = np.random.default_rng(0).choice(known, size=1_000_000)
+    seconds = min(
+        timeit.repeat(lambda: collection.ids_to_names(ids), number=1, repeat=REPEATS)
+    )
+    benchmark_results.setdefault("ids_to_names_per_second", {})[name] = len(ids) / seconds
+    _check(len(ids) / seconds, "ids_to_names_per_second", name)
+    assert collection.ids_to_names(ids[:1])[0] == collection.by_id(ids[0]).name
@@ -1,2 +1,137 @@
+import ast
+import mmap
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from gbd_mapping import _snapshot
+from gbd_mapping_generator import build_mapping, slim_builder, snapshot_builder
+from gbd_mapping_generator.util import make_attribute_name, make_rows, to_builtin
+
+
 def test_generator():
     pass
+
+
+def test_to_builtin():
+    assert to_builtin(np.int64(3)) == 3 and type(to_builtin(np.int64(3))) is int
+    assert to_builtin(np.bool_(True)) is True
+    assert to_builtin(np.float64("nan")) is None
+    assert to_builtin("name") == "name"
+
+
+def test_make_rows_is_valid_python():
+    rows = [("a", 1, None, (True, 2.0)), ("b" * 60, 2, 3, tuple("c" * 20 for _ in range(10)))]
+    namespace = {}
+    exec(make_rows("ROWS", ("name", "gbd_id", "me_id", "other"), rows), namespace)
+    assert namespace["ROWS"] == tuple(rows)
+
+
+def test_make_attribute_name():
+    assert make_attribute_name("chlamydia_spp.") == "chlamydia_spp"
+
+
+def test_select_entities():
+    selected = slim_builder.select_entities(["diarrheal_diseases", "unsafe_water_source"])
+
+    assert selected["causes"] == [
+        "all_causes",
+        "communicable_maternal_neonatal_and_nutritional_diseases",
+        "diarrheal_diseases",
+        "enteric_infections",
+    ]
+    assert "unsafe_water_sanitation_and_handwashing" in selected["risk_factors"]
+    assert len(selected["sequelae"]) == 4 and "cholera" in selected["etiologies"]
+    assert selected["covariates"] == []
+    # Causes only referred to still keep all of their sequelae and etiologies.
+    referenced = slim_builder.select_entities(["unsafe_water_source"])
+    assert "diarrheal_diseases" in referenced["causes"]
+    assert referenced["sequelae"] == selected["sequelae"]
+    assert referenced["etiologies"] == selected["etiologies"]
+    with pytest.raises(ValueError, match="not_an_entity"):
+        slim_builder.select_entities(["not_an_entity"])
+
+
+@pytest.mark.parametrize("use_snapshot", ["1", "0"])
+def test_build_slim_mapping(tmp_path, use_snapshot):
+    # Diarrheal diseases are only in the slim mapping as a cause of unsafe water.
+    slim_builder.build_slim_mapping(["unsafe_water_source"], tmp_path)
+    code = (
+        f"import sys; sys.path.insert(0, {str(tmp_path)!r}); import gbd_mapping as g;"
+        "from gbd_mapping import _snapshot;"
+        "parent = g.causes.diarrheal_diseases.parent;"
+        "print(g.__file__.startswith(sys.path[0]),"
+        "_snapshot._read_payload()['sources'] != {},"
+        "len(g.causes.__slots__), parent.name,"
+        "hasattr(parent, 'sub_causes'), 'sub_causes' in parent.to_dict(),"
+        "g.risk_factors.unsafe_water_source.affected_causes[-1].name,"
+        "len(g.causes.diarrheal_diseases.sequelae),"
+        "len(g.causes.diarrheal_diseases.etiologies));"
+        "g.seal(); parent.sub_causes"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "GBD_MAPPING_SNAPSHOT": use_snapshot},
+    )
+    assert result.stdout.split() == [
+        "True",
+        "True",
+        "4",
+        "enteric_infections",
+        "False",
+        "False",
+        "enteric_infections",
+        "4",
+        "13",
+    ], result.stderr
+    # Only part of the sub-causes are in the slim mapping, so none of them are given.
+    assert result.stderr.strip().endswith(
+        "AttributeError: 'Cause' object has no attribute 'sub_causes', "
+        "it was left out of this mapping"
+    )
+
+
+def test_write_snapshot_leaves_mapped_snapshots_intact(monkeypatch, tmp_path):
+    snapshot = tmp_path.joinpath(_snapshot.SNAPSHOT_FILE)
+    snapshot.write_bytes(b"old snapshot")
+    monkeypatch.setattr(_snapshot, "_ROOT", tmp_path)
+    monkeypatch.setattr(snapshot_builder, "build_snapshot", lambda: b"new")
+    with snapshot.open("rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    snapshot_builder.write_snapshot()
+
+    assert mapped[:] == b"old snapshot"
+    assert snapshot.read_bytes() == b"new"
+    assert [path.name for path in tmp_path.iterdir()] == [_snapshot.SNAPSHOT_FILE]
+
+
+def test_make_dirs_and_init_handles_multi_line_imports(monkeypatch, tmp_path):
+    source = Path(_snapshot.__file__).with_name("__init__.py").read_text()
+    init_path = tmp_path.joinpath("__init__.py")
+    init_path.write_text(source)
+    monkeypatch.setattr(build_mapping, "ROOT", tmp_path)
+
+    for mapping_type in ["id", "base_template", "cause"]:
+        build_mapping.make_dirs_and_init(mapping_type)
+    assert init_path.read_text() == source
+
+    # A name missing from a multi-line import gets the whole import replaced.
+    init_path.write_text(source.replace("    Tmred,\n", ""))
+    build_mapping.make_dirs_and_init("base_template")
+    tree = ast.parse(init_path.read_text())
+    imports = [
+        node
+        for node in tree.body
+        if isinstance(node, ast.ImportFrom) and node.module == "base_template"
+    ]
+    assert len(imports) == 1
+    assert [a.name for a in imports[0].names] == list(
+        build_mapping.AUTO_MAPPINGS["base_template"].IMPORTABLES_DEFINED
+    )
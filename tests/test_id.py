@@ -0,0 +1,36 @@
+import pickle
+
+import pytest
+
+from gbd_mapping.id import c_id, cov_id, hs_id, me_id, rei_id, s_id, scalar
+
+
+@pytest.mark.parametrize("id_type", [c_id, cov_id, hs_id, me_id, rei_id, s_id])
+def test_ids_are_interned(id_type):
+    value = id_type(123456789)
+
+    assert id_type(123456789) is value
+    assert id_type(int("123456789")) is value
+    assert pickle.loads(pickle.dumps(value)) is value
+    assert type(value) is id_type and value == 123456789
+    assert not hasattr(value, "__dict__")
+
+
+def test_ids_are_interned_per_type():
+    assert c_id(7) is not s_id(7)
+    assert type(s_id(7)) is s_id
+
+
+def test_scalars_are_slotted_but_not_interned():
+    # Interning by equality would turn -0.0 into 0.0.
+    assert str(float(scalar(-0.0))) == "-0.0"
+    assert not hasattr(scalar(1.5), "__dict__")
+
+
+@pytest.mark.parametrize("id_type", [c_id, cov_id, hs_id, me_id, rei_id, s_id])
+def test_ids_take_the_arguments_of_int(id_type):
+    assert id_type() == 0 and type(id_type()) is id_type
+    assert id_type("ff", 16) is id_type(255)
+    assert id_type("0x1f", base=0) is id_type(31)
+    with pytest.raises(ValueError):
+        id_type("not an id")
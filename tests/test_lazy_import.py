@@ -0,0 +1,104 @@
+import subprocess
+import sys
+
+import pytest
+
+
+def _run(code):
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+def test_import_does_not_load_collections():
+    out = _run(
+        "import sys, gbd_mapping;"
+        "print(sorted(m for m in sys.modules if m.startswith('gbd_mapping.')))"
+    )
+    assert "gbd_mapping.cause" not in out
+    assert "gbd_mapping.sequela" not in out
+
+
+def test_collection_loaded_on_first_access():
+    out = _run(
+        "import sys, gbd_mapping;"
+        "gbd_mapping.covariates;"
+        "print('gbd_mapping.covariate_template' in sys.modules,"
+        "'gbd_mapping.sequela_template' in sys.modules)"
+    )
+    assert out == "True False"
+
+
+def test_references_to_other_collections_load_on_first_access():
+    for module in ("gbd_mapping", "gbd_mapping.risk_factor"):
+        out = _run(
+            "import sys, gbd_mapping;"
+            f"from {module} import risk_factors;"
+            "loaded = lambda: [m in sys.modules for m in"
+            " ('gbd_mapping.cause_template', 'gbd_mapping.sequela_template')];"
+            "before = loaded();"
+            "risk_factors.unsafe_water_source.affected_causes;"
+            "print(before, loaded())"
+        )
+        assert out == "[False, False] [True, False]"
+
+
+@pytest.mark.parametrize("use_snapshot", ["1", "0"])
+def test_concurrent_first_access_loads_one_collection(monkeypatch, use_snapshot):
+    monkeypatch.setenv("GBD_MAPPING_SNAPSHOT", use_snapshot)
+    out = _run(
+        "import threading, gbd_mapping;"
+        "barrier, loaded = threading.Barrier(8), [];"
+        "load = lambda: (barrier.wait(), loaded.append(gbd_mapping.causes));"
+        "threads = [threading.Thread(target=load) for _ in range(8)];"
+        "[t.start() for t in threads]; [t.join() for t in threads];"
+        "print(len({id(c) for c in loaded}), len({id(c.tuberculosis) for c in loaded}))"
+    )
+    assert out == "1 1"
+
+
+@pytest.mark.parametrize("use_snapshot", ["1", "0"])
+def test_generated_modules_share_the_package_collections(monkeypatch, use_snapshot):
+    monkeypatch.setenv("GBD_MAPPING_SNAPSHOT", use_snapshot)
+    for first, second in [
+        ("gbd_mapping.cause", "gbd_mapping"),
+        ("gbd_mapping", "gbd_mapping.cause"),
+    ]:
+        out = _run(
+            "import pickle;"
+            f"from {first} import causes as first;"
+            f"from {second} import causes as second;"
+            "print(first is second, len(pickle.dumps(first.tuberculosis)) < 200)"
+        )
+        assert out == "True True"
+
+
+def test_seal_builds_and_freezes_the_mapping():
+    out = _run(
+        "import gc, gbd_mapping;"
+        "gbd_mapping.seal();"
+        "collections = [gbd_mapping.causes, gbd_mapping.risk_factors, gbd_mapping.sequelae];"
+        "print(gc.get_freeze_count() > 0,"
+        "any(getattr(r, '_deferred', None) for c in collections for r in (c, *c)))"
+    )
+    assert out == "True False"
+
+
+def test_lazy_names_resolve():
+    import gbd_mapping
+    from gbd_mapping import Cause, causes
+
+    assert isinstance(causes.tuberculosis, Cause)
+    assert gbd_mapping.causes is causes
+    assert "sequelae" in dir(gbd_mapping)
+
+
+def test_generated_modules_are_package_attributes():
+    out = _run(
+        "import gbd_mapping;"
+        "print(gbd_mapping.cause.causes is gbd_mapping.causes,"
+        "gbd_mapping.sequela_template.Sequela is gbd_mapping.Sequela,"
+        "hasattr(gbd_mapping, 'not_a_module'))"
+    )
+    assert out == "True True False"
@@ -0,0 +1,152 @@
+import pickle
+import subprocess
+import sys
+
+import pytest
+
+
+def _run(code):
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+def test_records_are_frozen_and_hashable():
+    from gbd_mapping import causes
+
+    cause = causes.tuberculosis
+    assert {cause: "value"}[causes.tuberculosis] == "value"
+    assert len(set(causes)) == len(causes.__slots__)
+    assert cause.parent.sub_causes  # Deferred links still resolve.
+    with pytest.raises(AttributeError, match="frozen"):
+        cause.name = "tb"
+    with pytest.raises(AttributeError, match="frozen"):
+        cause.restrictions.male_only = True
+
+
+def test_changing_to_dict_results_does_not_change_other_results():
+    from gbd_mapping import causes, risk_factors
+
+    causes.hiv_aids.to_dict(), causes.diarrheal_diseases.to_dict()
+    causes.tuberculosis.to_dict()["restrictions"]["male_only"] = True
+    affected_causes = risk_factors.unsafe_water_source.to_dict()["affected_causes"]
+    next(c for c in affected_causes if c["name"] == "diarrheal_diseases")["name"] = "changed"
+
+    assert causes.hiv_aids.to_dict()["restrictions"]["male_only"] is False
+    assert causes.diarrheal_diseases.to_dict()["name"] == "diarrheal_diseases"
+    assert causes.tuberculosis.restrictions.male_only is False
+
+
+def test_equal_nested_records_are_shared():
+    from gbd_mapping import causes, risk_factors, sequelae
+
+    restrictions = {}
+    for cause in causes:
+        key = tuple((type(value), value) for value in cause.restrictions)
+        assert restrictions.setdefault(key, cause.restrictions) is cause.restrictions
+    assert len(restrictions) < len(causes.__slots__)
+    healthstates = {s.healthstate for s in sequelae}
+    assert len({id(h) for h in healthstates}) == len(healthstates)
+    tmreds = [r.tmred for r in risk_factors if r.tmred is not None]
+    assert len({id(t) for t in tmreds}) < len(tmreds)
+
+
+def test_records_pickle_by_reference():
+    from gbd_mapping import causes, etiologies, risk_factors, sequelae
+
+    risk_factor = risk_factors.unsafe_water_source
+    records = [
+        risk_factor,
+        risk_factor.categories,
+        next(r.tmred for r in risk_factors if r.tmred is not None),
+        causes.tuberculosis.restrictions,
+        sequelae.acute_typhoid_infection.healthstate,
+        etiologies.chlamydia_spp,  # Named "chlamydia_spp."
+    ]
+    for record in records:
+        assert pickle.loads(pickle.dumps(record)) is record
+    assert len(pickle.dumps(risk_factor)) < 200
+
+    data = pickle.dumps(causes.tuberculosis).hex()
+    out = _run(
+        "import pickle, gbd_mapping;"
+        f"cause = pickle.loads(bytes.fromhex({data!r}));"
+        "print(cause is gbd_mapping.causes.tuberculosis)"
+    )
+    assert out == "True"
+
+
+def test_collections_look_up_entities_by_id():
+    from gbd_mapping import c_id, causes, etiologies
+
+    assert causes.by_id(c_id(297)) is causes.by_id(297) is causes.tuberculosis
+    assert etiologies.by_ids([e.gbd_id for e in etiologies]) == tuple(etiologies)
+
+
+def test_entities_by_me_id():
+    from gbd_mapping import UNKNOWN, causes, entities_by_me_id, me_id, sequelae
+
+    assert entities_by_me_id(me_id(1424)) == (causes.pertussis, sequelae.whooping_cough)
+    assert entities_by_me_id(1249) == (sequelae.acute_typhoid_infection,)
+    assert entities_by_me_id(UNKNOWN) == entities_by_me_id(-1) == ()
+    assert all(
+        entity in entities_by_me_id(entity.me_id)
+        for entity in (*causes, *sequelae)
+        if entity.me_id is not UNKNOWN
+    )
+
+
+def test_healthstate_indexes():
+    from gbd_mapping import healthstate_by_id, hs_id, sequelae, sequelae_by_healthstate
+
+    healthstate = sequelae.acute_typhoid_infection.healthstate
+    with_healthstate = sequelae_by_healthstate(healthstate)
+
+    assert healthstate_by_id(hs_id(352)) is healthstate_by_id(352) is healthstate
+    assert sequelae.acute_typhoid_infection in with_healthstate and len(with_healthstate) > 1
+    assert all(s.healthstate is healthstate for s in with_healthstate)
+    healthstates = {s.healthstate for s in sequelae}
+    indexed = [s for h in healthstates for s in sequelae_by_healthstate(h)]
+    assert sorted(s.name for s in indexed) == sorted(s.name for s in sequelae)
+    with pytest.raises(KeyError):
+        healthstate_by_id(-1)
+
+
+def test_collections_translate_id_arrays():
+    import numpy as np
+    import pandas as pd
+
+    from gbd_mapping import causes
+
+    by_id = sorted(causes, key=lambda c: c.gbd_id)
+    ids = np.array([c.gbd_id for c in by_id] + [1, -1])
+    codes = causes.ids_to_codes(ids)
+    assert codes.tolist() == list(range(len(by_id))) + [-1, -1]
+    assert causes.ids_to_names(ids).tolist() == [c.name for c in by_id] + [None, None]
+
+    column = pd.Series([297.0, np.nan, 302.0], index=[3, 5, 8], name="cause_id")
+    categorical = causes.ids_to_categorical(column)
+    assert categorical.index.tolist() == [3, 5, 8] and categorical.name == "cause_id"
+    assert categorical.dtype is causes.categorical_dtype()
+    assert categorical.tolist()[::2] == ["tuberculosis", "diarrheal_diseases"]
+    assert categorical.isna().tolist() == [False, True, False]
+    names = causes.ids_to_names(column)
+    assert names.index.tolist() == [3, 5, 8] and names.dtype == object
+    assert names.tolist() == ["tuberculosis", None, "diarrheal_diseases"]
+    nullable = pd.Series([297, None], dtype="Int64")
+    assert causes.ids_to_codes(nullable).tolist() == [codes[2], -1]
+
+
+def test_categorical_dtypes():
+    import pandas as pd
+
+    from gbd_mapping import causes, risk_factors
+
+    dtype = causes.categorical_dtype()
+    assert dtype is causes.categorical_dtype() and not dtype.ordered
+    assert list(dtype.categories) == [c.name for c in sorted(causes, key=lambda c: c.gbd_id)]
+    column = pd.Series(["tuberculosis", "hiv_aids"], dtype=dtype)
+    assert column.cat.codes.tolist() == causes.ids_to_codes([297, 298]).tolist()
+    categories = risk_factors.child_underweight.categories
+    assert list(categories.categorical_dtype().categories) == list(categories.codes)
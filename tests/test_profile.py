@@ -0,0 +1,41 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from gbd_mapping import _profile
+
+
+def _run_profiled(code):
+    code = (
+        f"import json, gbd_mapping; {code}; print(json.dumps(gbd_mapping.profile_report()))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "GBD_MAPPING_PROFILE": "1"},
+    )
+    return json.loads(result.stdout)
+
+
+def test_profile_report_records_modules_and_collections():
+    report = _run_profiled("gbd_mapping.causes")
+    entries = {(entry["kind"], entry["name"]): entry for entry in report}
+
+    assert ("module", "base_template") in entries
+    assert ("module", "cause_template") in entries
+    causes = entries["collection", "causes"]
+    assert causes["seconds"] >= causes["self_seconds"] >= 0
+    assert causes["allocated_bytes"] > 0
+    assert causes["objects"] > 0
+
+
+@pytest.mark.skipif(_profile.ENABLED, reason="profiling is enabled for this session")
+def test_profile_report_is_empty_when_disabled():
+    from gbd_mapping import profile_report
+
+    assert profile_report() == []
@@ -0,0 +1,94 @@
+import mmap
+
+import pytest
+
+from gbd_mapping import _snapshot
+from gbd_mapping.cause import causes as module_causes
+from gbd_mapping.etiology import etiologies as module_etiologies
+from gbd_mapping.sequela import sequelae as module_sequelae
+
+
+@pytest.fixture
+def snapshot_bytes():
+    return _snapshot.dumps(
+        {
+            "sequelae": module_sequelae,
+            "etiologies": module_etiologies,
+            "causes": module_causes,
+        }
+    )
+
+
+def test_snapshot_round_trip(snapshot_bytes):
+    payload = _snapshot.loads(snapshot_bytes)
+    sequelae = _snapshot._FROM_ROWS["sequelae"](payload["rows"]["sequelae"])
+    etiologies = _snapshot._FROM_ROWS["etiologies"](payload["rows"]["etiologies"])
+    collections = {"sequelae": sequelae, "etiologies": etiologies}
+    causes = _snapshot._FROM_ROWS["causes"](payload["rows"]["causes"], collections.get)
+
+    assert sequelae.__slots__ == module_sequelae.__slots__
+    assert causes.tuberculosis.to_dict() == module_causes.tuberculosis.to_dict()
+    assert causes.tuberculosis.parent is causes.respiratory_infections_and_tuberculosis
+    assert causes.diarrheal_diseases.etiologies
+    assert all(
+        any(etiology is e for e in etiologies)
+        for etiology in causes.diarrheal_diseases.etiologies
+    )
+
+
+def test_lazy_build_matches_eager(snapshot_bytes):
+    rows = _snapshot.loads(snapshot_bytes)["rows"]
+    sequelae = _snapshot._FROM_ROWS["sequelae"](rows["sequelae"], lazy=True)
+    etiologies = _snapshot._FROM_ROWS["etiologies"](rows["etiologies"], lazy=True)
+    collections = {"sequelae": sequelae, "etiologies": etiologies}
+    causes = _snapshot._FROM_ROWS["causes"](rows["causes"], collections.get, lazy=True)
+
+    diarrheal_diseases = causes.diarrheal_diseases
+    assert diarrheal_diseases is causes.diarrheal_diseases
+    assert "enteric_infections" in causes._deferred
+    assert diarrheal_diseases.parent is causes.enteric_infections
+    assert len(sequelae._deferred) == len(rows["sequelae"])
+    # Only the sequelae of the cause are built, once they are accessed.
+    built = {s.name for s in diarrheal_diseases.sequelae}
+    assert built == {s.name for s in module_causes.diarrheal_diseases.sequelae}
+    assert set(rows["sequelae"].keys) - set(sequelae._deferred) == built
+    assert diarrheal_diseases.to_dict() == module_causes.diarrheal_diseases.to_dict()
+    assert [cause.name for cause in causes] == [cause.name for cause in module_causes]
+    assert not causes._deferred
+
+
+def test_snapshot_is_memory_mapped(monkeypatch, tmp_path, snapshot_bytes):
+    tmp_path.joinpath(_snapshot.SNAPSHOT_FILE).write_bytes(snapshot_bytes)
+    digests = _snapshot.loads(snapshot_bytes)["sources"]
+    monkeypatch.setattr(_snapshot, "_ROOT", tmp_path)
+    monkeypatch.setattr(_snapshot, "_payload", None)
+    monkeypatch.setattr(_snapshot, "source_digest", digests.get)
+
+    table = _snapshot._read_payload()["rows"]["sequelae"]
+    sequelae = _snapshot.load_collection("sequelae", lambda name: None)
+
+    assert isinstance(table.buffer.obj, mmap.mmap)
+    assert len(sequelae._deferred) == len(module_sequelae.__slots__)
+    assert (
+        sequelae.drug_susceptible_tuberculosis.to_dict()
+        == module_sequelae.drug_susceptible_tuberculosis.to_dict()
+    )
+
+
+def test_corrupt_snapshot_is_rejected(snapshot_bytes):
+    corrupted = bytearray(snapshot_bytes)
+    corrupted[-1] ^= 0xFF
+    assert _snapshot.loads(bytes(corrupted)) is None
+    assert _snapshot.loads(b"") is None
+
+
+def test_stale_snapshot_falls_back(monkeypatch, snapshot_bytes):
+    monkeypatch.setattr(_snapshot, "_payload", _snapshot.loads(snapshot_bytes))
+    monkeypatch.setattr(_snapshot, "source_digest", lambda module: "stale")
+    assert _snapshot.load_collection("sequelae", lambda name: None) is None
+
+
+def test_missing_source_falls_back(monkeypatch, tmp_path, snapshot_bytes):
+    monkeypatch.setattr(_snapshot, "_payload", _snapshot.loads(snapshot_bytes))
+    monkeypatch.setattr(_snapshot, "_ROOT", tmp_path)
+    assert _snapshot.load_collection("sequelae", lambda name: None) is None